@@ -73,6 +73,15 @@ class Settings(BaseSettings):
         ),
     )
 
+    # CLI settings
+    FAST_EXIT: bool = Field(
+        default=False,
+        description=(
+            "Exit the CLI with os._exit on fatal errors after flushing output and log sinks, "
+            "skipping interpreter teardown."
+        ),
+    )
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -163,3 +163,16 @@ class WorkflowValidationError(WorkflowError):
             cause: Optional exception that caused this error
         """
         super().__init__(f"Workflow validation error: {message}", cause)
+
+
+class WorkflowDiscoveryError(WorkflowError):
+    """Exception raised when workflow discovery fails."""
+
+    def __init__(self, message: str, cause: Exception | None = None):
+        """Initialize with an error message and optional cause.
+
+        Args:
+            message: Error message
+            cause: Optional exception that caused this error
+        """
+        super().__init__(f"Workflow discovery error: {message}", cause)
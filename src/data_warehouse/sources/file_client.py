@@ -7,14 +7,28 @@ It handles different file formats and provides consistent error handling.
 
 import logging
 import os
+from collections.abc import Iterator
+from fnmatch import fnmatch
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pa_csv
+from pyarrow import feather
+from pyarrow import parquet as pq
+
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:  # Optional dependency, install with the "excel" extra
+    CalamineWorkbook = None
 
 
 class FileClient:
     """Client for reading data from files."""
 
+    __slots__ = ("data_dir", "logger", "_path_cache")
+
     def __init__(self, data_dir: str | Path):
         """Initialize file client.
 
@@ -23,11 +37,25 @@ class FileClient:
         """
         self.data_dir = Path(data_dir)
         self.logger = logging.getLogger(__name__)
+        self._path_cache: dict[str, Path] = {}
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+
+    def _resolve(self, filename: str) -> Path:
+        """Get the path of a file in the data directory.
 
-        if not self.data_dir.exists():
-            self.logger.warning(f"Data directory does not exist: {self.data_dir}")
-            os.makedirs(self.data_dir, exist_ok=True)
-            self.logger.info(f"Created data directory: {self.data_dir}")
+        Path objects are cached per filename so repeated reads of the same
+        file skip rebuilding the path.
+
+        Args:
+            filename: Name of the file in the data directory
+
+        Returns:
+            Path to the file
+        """
+        path = self._path_cache.get(filename)
+        if path is None:
+            path = self._path_cache[filename] = self.data_dir / filename
+        return path
 
     def read_csv(self, filename: str, **kwargs) -> pd.DataFrame:
         """Read data from a CSV file.
@@ -43,28 +71,67 @@ class FileClient:
             FileNotFoundError: If the file does not exist
             ValueError: If the file cannot be read as CSV
         """
-        file_path = self.data_dir / filename
-
-        if not file_path.exists():
-            self.logger.error(f"CSV file not found: {file_path}")
-            raise FileNotFoundError(f"File not found: {file_path}")
+        file_path = self._resolve(filename)
 
         try:
             self.logger.info(f"Reading CSV file: {file_path}")
             return pd.read_csv(file_path, **kwargs)
+        except FileNotFoundError:
+            self.logger.error(f"CSV file not found: {file_path}")
+            raise
         except Exception as e:
             self.logger.error(f"Failed to read CSV file {file_path}: {str(e)}")
             raise ValueError(f"Failed to read CSV file: {str(e)}") from e
 
+    def iter_csv(self, filename: str, block_size: int = 1 << 24, **kwargs) -> Iterator[pa.RecordBatch]:
+        """Stream a CSV file as Arrow record batches.
+
+        Only one batch is held in memory at a time, so large files can be
+        processed without materializing the whole DataFrame. Downstream steps
+        should accept ``pa.RecordBatch`` directly to keep the handoff zero-copy,
+        or call ``batch.to_pandas()`` per batch when pandas is required.
+
+        Args:
+            filename: Name of the CSV file in the data directory
+            block_size: Approximate number of bytes parsed into each batch
+            **kwargs: Additional arguments to pass to pyarrow.csv.open_csv
+
+        Yields:
+            Record batches containing consecutive rows of the CSV data
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            ValueError: If the file cannot be read as CSV
+        """
+        file_path = self._resolve(filename)
+
+        kwargs.setdefault("read_options", pa_csv.ReadOptions(block_size=block_size))
+
+        try:
+            self.logger.info(f"Streaming CSV file: {file_path}")
+            with pa_csv.open_csv(file_path, **kwargs) as reader:
+                yield from reader
+        except FileNotFoundError:
+            self.logger.error(f"CSV file not found: {file_path}")
+            raise
+        except Exception as e:
+            self.logger.error(f"Failed to stream CSV file {file_path}: {str(e)}")
+            raise ValueError(f"Failed to stream CSV file: {str(e)}") from e
+
     def read_excel(
         self, filename: str, sheet_name: str | int | list[str | int] | None = None, **kwargs
     ) -> pd.DataFrame | dict[str, pd.DataFrame]:
         """Read data from an Excel file.
 
+        Uses the Rust-based calamine engine when python-calamine is installed,
+        falling back to the pandas default engines otherwise. Plain XLSB reads
+        bypass pandas entirely and build the DataFrame from calamine's rows.
+        The workbook is opened once, however many sheets are requested.
+
         Args:
             filename: Name of the Excel file in the data directory
             sheet_name: Sheet(s) to read (name, index, or list of names/indices)
-            **kwargs: Additional arguments to pass to pandas.read_excel
+            **kwargs: Additional arguments to pass to pandas.ExcelFile.parse
 
         Returns:
             DataFrame containing the Excel data or dictionary of DataFrames (multiple sheets)
@@ -73,19 +140,63 @@ class FileClient:
             FileNotFoundError: If the file does not exist
             ValueError: If the file cannot be read as Excel
         """
-        file_path = self.data_dir / filename
-
-        if not file_path.exists():
-            self.logger.error(f"Excel file not found: {file_path}")
-            raise FileNotFoundError(f"File not found: {file_path}")
+        file_path = self._resolve(filename)
 
         try:
             self.logger.info(f"Reading Excel file: {file_path}")
-            return pd.read_excel(file_path, sheet_name=sheet_name, **kwargs)
+            if CalamineWorkbook is not None:
+                if file_path.suffix.lower() == ".xlsb" and not kwargs:
+                    return self._read_xlsb(file_path, sheet_name)
+                kwargs.setdefault("engine", "calamine")
+
+            # Open the workbook once and parse every requested sheet from it
+            workbook_kwargs = {key: kwargs.pop(key) for key in ("engine", "engine_kwargs") if key in kwargs}
+            with pd.ExcelFile(file_path, **workbook_kwargs) as workbook:
+                if sheet_name is None or isinstance(sheet_name, list):
+                    sheets = workbook.sheet_names if sheet_name is None else sheet_name
+                    return {sheet: workbook.parse(sheet, **kwargs) for sheet in sheets}
+                return workbook.parse(sheet_name, **kwargs)
+        except FileNotFoundError:
+            self.logger.error(f"Excel file not found: {file_path}")
+            raise
         except Exception as e:
             self.logger.error(f"Failed to read Excel file {file_path}: {str(e)}")
             raise ValueError(f"Failed to read Excel file: {str(e)}") from e
 
+    @staticmethod
+    def _read_xlsb(
+        file_path: Path, sheet_name: str | int | list[str | int] | None
+    ) -> pd.DataFrame | dict[str, pd.DataFrame]:
+        """Read an XLSB workbook directly with calamine.
+
+        The first row of each sheet is used as the header, matching the
+        pandas.read_excel defaults.
+
+        Args:
+            file_path: Path to the XLSB file
+            sheet_name: Sheet(s) to read (name, index, or list of names/indices)
+
+        Returns:
+            DataFrame for a single sheet or dictionary of DataFrames (multiple sheets)
+        """
+        with open(file_path, "rb") as file:
+            workbook = CalamineWorkbook.from_filelike(file)
+
+        def read_sheet(sheet: str | int) -> pd.DataFrame:
+            if isinstance(sheet, int):
+                rows = workbook.get_sheet_by_index(sheet).to_python()
+            else:
+                rows = workbook.get_sheet_by_name(sheet).to_python()
+            if not rows:
+                return pd.DataFrame()
+            return pd.DataFrame(rows[1:], columns=rows[0])
+
+        if sheet_name is None:
+            return {name: read_sheet(name) for name in workbook.sheet_names}
+        if isinstance(sheet_name, list):
+            return {sheet: read_sheet(sheet) for sheet in sheet_name}
+        return read_sheet(sheet_name)
+
     def read_parquet(self, filename: str, **kwargs) -> pd.DataFrame:
         """Read data from a Parquet file.
 
@@ -100,22 +211,126 @@ class FileClient:
             FileNotFoundError: If the file does not exist
             ValueError: If the file cannot be read as Parquet
         """
-        file_path = self.data_dir / filename
-
-        if not file_path.exists():
-            self.logger.error(f"Parquet file not found: {file_path}")
-            raise FileNotFoundError(f"File not found: {file_path}")
+        file_path = self._resolve(filename)
 
         try:
             self.logger.info(f"Reading Parquet file: {file_path}")
             return pd.read_parquet(file_path, **kwargs)
+        except FileNotFoundError:
+            self.logger.error(f"Parquet file not found: {file_path}")
+            raise
         except Exception as e:
             self.logger.error(f"Failed to read Parquet file {file_path}: {str(e)}")
             raise ValueError(f"Failed to read Parquet file: {str(e)}") from e
 
+    def read_feather(self, filename: str, **kwargs) -> pd.DataFrame:
+        """Read data from a Feather (Arrow IPC) file.
+
+        Args:
+            filename: Name of the Feather file in the data directory
+            **kwargs: Additional arguments to pass to pandas.read_feather
+
+        Returns:
+            DataFrame containing the Feather data
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            ValueError: If the file cannot be read as Feather
+        """
+        file_path = self._resolve(filename)
+
+        try:
+            self.logger.info(f"Reading Feather file: {file_path}")
+            return pd.read_feather(file_path, **kwargs)
+        except FileNotFoundError:
+            self.logger.error(f"Feather file not found: {file_path}")
+            raise
+        except Exception as e:
+            self.logger.error(f"Failed to read Feather file {file_path}: {str(e)}")
+            raise ValueError(f"Failed to read Feather file: {str(e)}") from e
+
+    def read_csv_arrow(self, filename: str, **kwargs) -> pa.Table:
+        """Read data from a CSV file into an Arrow table.
+
+        Args:
+            filename: Name of the CSV file in the data directory
+            **kwargs: Additional arguments to pass to pyarrow.csv.read_csv
+
+        Returns:
+            Arrow table containing the CSV data
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            ValueError: If the file cannot be read as CSV
+        """
+        file_path = self._resolve(filename)
+
+        try:
+            self.logger.info(f"Reading CSV file into Arrow: {file_path}")
+            return pa_csv.read_csv(file_path, **kwargs)
+        except FileNotFoundError:
+            self.logger.error(f"CSV file not found: {file_path}")
+            raise
+        except Exception as e:
+            self.logger.error(f"Failed to read CSV file {file_path}: {str(e)}")
+            raise ValueError(f"Failed to read CSV file: {str(e)}") from e
+
+    def read_parquet_arrow(self, filename: str, **kwargs) -> pa.Table:
+        """Read data from a Parquet file into an Arrow table.
+
+        The file is memory-mapped rather than copied into Python-managed buffers.
+
+        Args:
+            filename: Name of the Parquet file in the data directory
+            **kwargs: Additional arguments to pass to pyarrow.parquet.read_table
+
+        Returns:
+            Arrow table containing the Parquet data
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            ValueError: If the file cannot be read as Parquet
+        """
+        file_path = self._resolve(filename)
+
+        try:
+            self.logger.info(f"Reading Parquet file into Arrow: {file_path}")
+            return pq.read_table(file_path, memory_map=True, **kwargs)
+        except FileNotFoundError:
+            self.logger.error(f"Parquet file not found: {file_path}")
+            raise
+        except Exception as e:
+            self.logger.error(f"Failed to read Parquet file {file_path}: {str(e)}")
+            raise ValueError(f"Failed to read Parquet file: {str(e)}") from e
+
+    def read_excel_arrow(self, filename: str, sheet_name: str | int = 0, **kwargs) -> pa.Table:
+        """Read a single Excel sheet into an Arrow table.
+
+        Excel has no native Arrow reader, so the sheet is parsed with read_excel
+        and converted once, letting callers stay in Arrow from here on.
+
+        Args:
+            filename: Name of the Excel file in the data directory
+            sheet_name: Sheet to read (name or index)
+            **kwargs: Additional arguments to pass to read_excel
+
+        Returns:
+            Arrow table containing the sheet data
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            ValueError: If the file cannot be read as Excel
+        """
+        df = self.read_excel(filename, sheet_name=sheet_name, **kwargs)
+        return pa.Table.from_pandas(df, preserve_index=False)
+
     def save_csv(self, df: pd.DataFrame, filename: str, **kwargs) -> None:
         """Save DataFrame to a CSV file.
 
+        Index-free writes of integer and string columns go through pyarrow's
+        multithreaded CSV writer when it produces the same bytes as pandas.
+        Anything else falls back to DataFrame.to_csv.
+
         Args:
             df: DataFrame to save
             filename: Name of the CSV file in the data directory
@@ -124,16 +339,122 @@ class FileClient:
         Raises:
             ValueError: If the DataFrame cannot be saved as CSV
         """
-        file_path = self.data_dir / filename
+        file_path = self._resolve(filename)
 
         try:
             self.logger.info(f"Saving DataFrame to CSV file: {file_path}")
-            df.to_csv(file_path, **kwargs)
+            if not (
+                self._can_write_csv_with_arrow(df, kwargs)
+                and self._write_csv_with_arrow(df, file_path, kwargs.get("header", True))
+            ):
+                df.to_csv(file_path, **kwargs)
             self.logger.info(f"Successfully saved {len(df)} rows to {file_path}")
         except Exception as e:
             self.logger.error(f"Failed to save CSV file {file_path}: {str(e)}")
             raise ValueError(f"Failed to save CSV file: {str(e)}") from e
 
+    @staticmethod
+    def _can_write_csv_with_arrow(df: pd.DataFrame, kwargs: dict) -> bool:
+        """Check whether pyarrow can write a DataFrame as the same CSV bytes as pandas.
+
+        pyarrow writes floats, booleans and datetimes differently from pandas, so only
+        non-nullable integer and string columns qualify. Single-column frames are
+        excluded because pandas quotes rows holding one empty field.
+
+        Args:
+            df: DataFrame to save
+            kwargs: Arguments intended for DataFrame.to_csv
+
+        Returns:
+            True if pyarrow.csv.write_csv can be used, False otherwise
+        """
+        if kwargs.get("index", True) or not kwargs.keys() <= {"index", "header"}:
+            return False
+        if not isinstance(kwargs.get("header", True), bool) or len(df.columns) < 2 or os.linesep != "\n":
+            return False
+        return all(
+            (isinstance(column.dtype, np.dtype) and column.dtype.kind in "iu")
+            or isinstance(column.dtype, pd.StringDtype)
+            or (column.dtype == object and pd.api.types.infer_dtype(column, skipna=True) == "string")
+            for _, column in df.items()
+        )
+
+    @staticmethod
+    def _write_csv_with_arrow(df: pd.DataFrame, file_path: Path, header: bool) -> bool:
+        """Write a DataFrame as CSV with pyarrow.
+
+        The header comes from pandas, as pyarrow always quotes column names. Values are
+        written unquoted; pyarrow rejects values that would need quotes, in which case
+        the caller falls back to DataFrame.to_csv.
+
+        Args:
+            df: DataFrame accepted by ``_can_write_csv_with_arrow``
+            file_path: Path of the CSV file
+            header: Whether to write the column names
+
+        Returns:
+            True if the file was written, False if pandas has to write it instead
+        """
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        write_options = pa_csv.WriteOptions(include_header=False, quoting_style="none")
+        with open(file_path, "wb") as f:
+            if header:
+                f.write(df.head(0).to_csv(index=False).encode())
+            try:
+                pa_csv.write_csv(table, f, write_options=write_options)
+            except pa.ArrowInvalid:
+                return False
+        return True
+
+    def save_parquet(self, df: pd.DataFrame, filename: str, compression: str = "zstd", **kwargs) -> None:
+        """Save DataFrame to a Parquet file.
+
+        Args:
+            df: DataFrame to save
+            filename: Name of the Parquet file in the data directory
+            compression: Compression codec to use
+            **kwargs: Additional arguments to pass to pyarrow.parquet.write_table
+
+        Raises:
+            ValueError: If the DataFrame cannot be saved as Parquet
+        """
+        file_path = self._resolve(filename)
+
+        try:
+            self.logger.info(f"Saving DataFrame to Parquet file: {file_path}")
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            pq.write_table(table, file_path, compression=compression, use_dictionary=True, **kwargs)
+            self.logger.info(f"Successfully saved {len(df)} rows to {file_path}")
+        except Exception as e:
+            self.logger.error(f"Failed to save Parquet file {file_path}: {str(e)}")
+            raise ValueError(f"Failed to save Parquet file: {str(e)}") from e
+
+    def save_feather(self, df: pd.DataFrame, filename: str, compression: str = "lz4", **kwargs) -> None:
+        """Save DataFrame to a Feather (Arrow IPC) file.
+
+        Feather stores the Arrow in-memory layout directly, so it is the
+        preferred format for intermediates passed between pipeline steps.
+
+        Args:
+            df: DataFrame to save
+            filename: Name of the Feather file in the data directory
+            compression: Compression codec to use
+            **kwargs: Additional arguments to pass to pyarrow.feather.write_feather
+
+        Raises:
+            ValueError: If the DataFrame cannot be saved as Feather
+        """
+        file_path = self._resolve(filename)
+
+        try:
+            self.logger.info(f"Saving DataFrame to Feather file: {file_path}")
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            feather.write_feather(table, file_path, compression=compression, **kwargs)
+            self.logger.info(f"Successfully saved {len(df)} rows to {file_path}")
+        except Exception as e:
+            self.logger.error(f"Failed to save Feather file {file_path}: {str(e)}")
+            raise ValueError(f"Failed to save Feather file: {str(e)}") from e
+
     def list_files(self, pattern: str | None = None, extension: str | None = None) -> list[Path]:
         """List files in the data directory.
 
@@ -144,13 +465,21 @@ class FileClient:
         Returns:
             List of file paths matching the criteria
         """
-        if pattern:
+        # Patterns spanning directories need full glob semantics
+        if pattern and ("**" in pattern or "/" in pattern or os.sep in pattern):
             files = list(self.data_dir.glob(pattern))
         else:
-            files = [f for f in self.data_dir.iterdir() if f.is_file()]
+            # A single scandir pass reuses the directory entry's cached type information.
+            # Like glob, a pattern also matches directories; without one only files are listed.
+            with os.scandir(self.data_dir) as entries:
+                files = [
+                    Path(entry.path)
+                    for entry in entries
+                    if (fnmatch(entry.name, pattern) if pattern else entry.is_file())
+                ]
 
         if extension:
-            ext = extension if extension.startswith(".") else f".{extension}"
-            files = [f for f in files if f.suffix.lower() == ext.lower()]
+            ext = (extension if extension.startswith(".") else f".{extension}").lower()
+            files = [f for f in files if os.path.splitext(f.name)[1].lower() == ext]
 
         return files
@@ -5,10 +5,11 @@ the CLI commands. It includes decorators and helpers for catching and formatting
 """
 
 import functools
+import os
 import sys
 import traceback
 from collections.abc import Callable
-from typing import Any, TypeVar
+from typing import Any, NoReturn, TypeVar
 
 import click
 from loguru import logger
@@ -24,53 +25,111 @@ from data_warehouse.core.exceptions import (
 F = TypeVar("F", bound=Callable[..., Any])
 
 
-def _handle_click_abort(exit_on_error: bool) -> None:
+def _handle_click_abort(e: Exception) -> int:
     click.echo("\nOperation aborted by user.", err=True)
-    if exit_on_error:
-        sys.exit(1)
+    return 1
 
 
-def _handle_usage_error(e: Exception, exit_on_error: bool) -> None:
+def _handle_usage_error(e: Exception) -> int:
     click.secho(f"Error: {str(e)}", fg="red", err=True)
-    if exit_on_error:
-        sys.exit(2)
+    return 2
 
 
-def _handle_validation_error(e: Exception, exit_on_error: bool) -> None:
+def _handle_validation_error(e: Exception) -> int:
     click.secho(f"Validation Error: {str(e)}", fg="red", err=True)
-    if exit_on_error:
-        sys.exit(3)
+    return 3
 
 
-def _handle_database_error(e: Exception, exit_on_error: bool) -> None:
+def _handle_database_error(e: Exception) -> int:
     click.secho(f"Database Error: {str(e)}", fg="red", err=True)
-    if exit_on_error:
-        sys.exit(4)
+    return 4
 
 
-def _handle_storage_error(e: Exception, exit_on_error: bool) -> None:
+def _handle_storage_error(e: Exception) -> int:
     click.secho(f"Storage Error: {str(e)}", fg="red", err=True)
-    if exit_on_error:
-        sys.exit(5)
+    return 5
 
 
-def _handle_datawarehouse_error(e: Exception, exit_on_error: bool) -> None:
+def _handle_datawarehouse_error(e: Exception) -> int:
     click.secho(f"Error: {str(e)}", fg="red", err=True)
-    if exit_on_error:
-        sys.exit(6)
+    return 6
 
 
-def _handle_unexpected_error(e: Exception, exit_on_error: bool) -> None:
+def _handle_unexpected_error(e: Exception) -> int:
     click.secho("An unexpected error occurred:", fg="red", err=True)
     click.secho(str(e), fg="red", err=True)
-    logger.error(f"Unexpected error: {str(e)}")
-    logger.debug(f"Traceback: {traceback.format_exc()}")
+    logger.error("Unexpected error: {}", e)
+    # Format the traceback at most once, and only when something consumes it
     if settings.LOG_LEVEL == "DEBUG":
-        click.echo(traceback.format_exc(), err=True)
+        tb = traceback.format_exc()
+        logger.debug("Traceback: {}", tb)
+        click.echo(tb, err=True)
     else:
+        logger.opt(lazy=True).debug("Traceback: {}", traceback.format_exc)
         click.echo("Run with --verbose for detailed error information.", err=True)
-    if exit_on_error:
-        sys.exit(10)
+    return 10
+
+
+# Handlers keyed by exception type. The first match along the raised exception's
+# MRO wins, so subclasses resolve to their most specific handler.
+# Each handler reports the error and returns the process exit code for it.
+_EXCEPTION_HANDLERS: dict[type[Exception], Callable[[Exception], int]] = {
+    click.Abort: _handle_click_abort,
+    click.UsageError: _handle_usage_error,
+    ValidationError: _handle_validation_error,
+    DatabaseError: _handle_database_error,
+    StorageError: _handle_storage_error,
+    DataWarehouseError: _handle_datawarehouse_error,
+    Exception: _handle_unexpected_error,
+}
+
+
+@functools.cache
+def _resolve_handler(exc_type: type[Exception]) -> Callable[[Exception], int]:
+    """Find the handler for an exception type, caching the MRO walk per type.
+
+    Args:
+        exc_type: The type of the raised exception
+
+    Returns:
+        The most specific registered handler
+    """
+    for base in exc_type.__mro__:
+        handler = _EXCEPTION_HANDLERS.get(base)
+        if handler is not None:
+            return handler
+    return _handle_unexpected_error
+
+
+def _dispatch_exception(e: Exception) -> int:
+    """Route an exception to the handler registered for its type.
+
+    Args:
+        e: The exception to handle
+
+    Returns:
+        The exit code for the exception
+    """
+    logger.debug("Handling {}: {}", type(e).__name__, e)
+    return _resolve_handler(type(e))(e)
+
+
+def _exit(code: int) -> NoReturn:
+    """Exit the process with the given code.
+
+    With FAST_EXIT enabled, standard streams are flushed and loguru sinks are
+    drained and closed before ``os._exit`` skips interpreter teardown.
+    Otherwise this raises SystemExit as usual.
+
+    Args:
+        code: The process exit code
+    """
+    if settings.FAST_EXIT:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        logger.remove()
+        os._exit(code)
+    sys.exit(code)
 
 
 def handle_exceptions(exit_on_error: bool = True) -> Callable[[F], F]:
@@ -83,38 +142,31 @@ def handle_exceptions(exit_on_error: bool = True) -> Callable[[F], F]:
         A decorator that handles exceptions
     """
 
-    logger.debug(f"Creating exception handler decorator (exit_on_error={exit_on_error})")
-
     def decorator(func: F) -> F:
-        @functools.wraps(func)
-        def wrapper(*args: Any, **kwargs: Any) -> Any:
-            logger.debug(f"Calling wrapped function: {func.__name__}")
-            try:
-                return func(*args, **kwargs)
-            except click.Abort:
-                logger.debug("Handling click.Abort exception")
-                _handle_click_abort(exit_on_error)
-            except click.UsageError as e:
-                logger.debug(f"Handling click.UsageError: {e}")
-                _handle_usage_error(e, exit_on_error)
-            except ValidationError as e:
-                logger.debug(f"Handling ValidationError: {e}")
-                _handle_validation_error(e, exit_on_error)
-            except DatabaseError as e:
-                logger.debug(f"Handling DatabaseError: {e}")
-                _handle_database_error(e, exit_on_error)
-            except StorageError as e:
-                logger.debug(f"Handling StorageError: {e}")
-                _handle_storage_error(e, exit_on_error)
-            except DataWarehouseError as e:
-                logger.debug(f"Handling DataWarehouseError: {e}")
-                _handle_datawarehouse_error(e, exit_on_error)
-            except Exception as e:
-                logger.debug(f"Handling unexpected Exception: {e}")
-                _handle_unexpected_error(e, exit_on_error)
-            return None  # Should only reach here if exit_on_error is False
-
-        return wrapper  # type: ignore
+        func_name = func.__name__
+
+        # Pick the wrapper once here so the exit_on_error branch is not re-evaluated per call
+        if exit_on_error:
+
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                # Positional args defer formatting until loguru knows DEBUG is enabled
+                logger.debug("Calling wrapped function: {}", func_name)
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    _exit(_dispatch_exception(e))
+
+        else:
+
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                logger.debug("Calling wrapped function: {}", func_name)
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    _dispatch_exception(e)
+                    return None
+
+        return functools.wraps(func)(wrapper)  # type: ignore
 
     return decorator
 
@@ -1,14 +1,17 @@
 """Logging configuration for the data warehouse."""
 
+import functools
 import sys
 from typing import Any, Literal
 
-from loguru import logger
+from loguru import logger as _logger
 
 from data_warehouse.config.settings import settings
 
 LogLevel = Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
 
+_configured = False
+
 
 def setup_logger(verbose: bool = False) -> None:
     """Configure the logger with project settings.
@@ -16,6 +19,8 @@ def setup_logger(verbose: bool = False) -> None:
     Args:
         verbose: If True, set log level to DEBUG regardless of settings
     """
+    global _configured
+
     # Determine the log level based on verbose flag or settings
     log_level: LogLevel = "DEBUG" if verbose else settings.LOG_LEVEL
 
@@ -31,37 +36,57 @@ def setup_logger(verbose: bool = False) -> None:
     }
 
     # Remove default handler and apply our configuration
-    logger.remove()
-    logger.configure(**config)
+    _logger.remove()
+    _logger.configure(**config)
 
     # Add file logging in non-development environments
     if settings.ENVIRONMENT != "development":
         log_file = settings.PROJECT_ROOT / "logs" / "data_warehouse.log"
         log_file.parent.mkdir(parents=True, exist_ok=True)
 
-        logger.add(
+        # enqueue=True hands writes, rotation and compression to loguru's worker thread
+        _logger.add(
             str(log_file),
             rotation="10 MB",
             retention="1 week",
-            compression="zip",
+            compression="gz",
             level=log_level,
             format=settings.LOG_FORMAT,
+            enqueue=True,
         )
 
-    logger.debug("Logger configured successfully")
+    _configured = True
+    _logger.debug("Logger configured successfully")
 
 
-# Configure logger once on module import - will be reconfigured when CLI runs
-setup_logger()
+def __getattr__(name: str) -> Any:
+    """Configure the logger on first access to ``logger`` (PEP 562).
 
+    Importing this module has no side effects. The default configuration is
+    applied the first time ``logger`` is imported from it, unless an entry
+    point has already called setup_logger.
+    """
+    if name == "logger":
+        if not _configured:
+            setup_logger()
+        return _logger
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
+
+@functools.lru_cache(maxsize=256)
 def get_command_logger(module_name: str):
     """Get a logger instance with context for CLI commands.
 
+    Bound loggers are cached per module name, so repeated calls return the
+    same instance. Like ``logger``, the first call applies the default
+    configuration unless setup_logger has already been called.
+
     Args:
         module_name: The name of the module using the logger
 
     Returns:
         A logger instance with context
     """
-    return logger.bind(module=module_name)
+    if not _configured:
+        setup_logger()
+    return _logger.bind(module=module_name)
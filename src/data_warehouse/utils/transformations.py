@@ -10,29 +10,156 @@ from datetime import datetime
 
 import numpy as np
 import pandas as pd
+from pandas.api.extensions import take
 
+_NON_DIGIT_RE = re.compile(r"\D")
+_NON_ASCII_DIGIT_RE = re.compile(r"[^0-9]")
 
-def clean_customer_data(df: pd.DataFrame) -> pd.DataFrame:
+# Raw date columns are usually ISO 8601 strings. Naming the format skips per-column
+# format inference and still accepts date-only and full timestamp values.
+DATE_FORMAT = "ISO8601"
+
+# Low-cardinality labels are stored as categoricals (small integer codes plus one
+# copy of each label) rather than one Python string per row
+ORDER_STATUSES = ["Unknown", "Shipped", "Delivered"]
+INVENTORY_STATUSES = ["In Stock", "Out of Stock", "Low Stock"]
+
+
+def _strip_non_digits(series: pd.Series, pattern: re.Pattern = _NON_DIGIT_RE) -> pd.Series:
+    """Remove every non-digit character from a column, mapping missing values to "".
+
+    Args:
+        series: Column to clean
+        pattern: Compiled regex matching the characters to remove
+
+    Returns:
+        Column containing only digit strings
+    """
+    # Python-backed strings keep Python's re semantics, where \D treats any Unicode
+    # digit (e.g. full-width "１") as a digit; pyarrow's RE2 kernel is ASCII-only
+    stripped = series.astype("string[python]").str.replace(pattern, "", regex=True)
+    return stripped.fillna("")
+
+
+def _parse_dates(series: pd.Series) -> pd.Series:
+    """Parse a raw date column, coercing unparseable values to NaT.
+
+    Args:
+        series: Column of date strings or datetime-like values
+
+    Returns:
+        Datetime column
+    """
+    parsed = pd.to_datetime(series, errors="coerce", format=DATE_FORMAT)
+
+    # Values the ISO pass rejected (e.g. "01/15/2024") fall back to format inference,
+    # so only the non-ISO rows pay for it
+    retry = parsed.isna() & series.notna()
+    if retry.any():
+        parsed[retry] = pd.to_datetime(series[retry], errors="coerce")
+    return parsed
+
+
+def _normalize_code_column(series: pd.Series) -> pd.Series:
+    """Strip and uppercase a low-cardinality text column, returning a categorical.
+
+    Equivalent to ``series.str.strip().str.upper().astype("category")``.
+
+    Args:
+        series: Column of codes such as states or countries
+
+    Returns:
+        Categorical column of cleaned codes
+    """
+    # Clean each distinct value once instead of every row, then remap the row codes;
+    # values that collapse together (" ny" and "NY") share one category afterwards
+    codes, uniques = pd.factorize(series)
+    cleaned = pd.Index(uniques).str.strip().str.upper()
+    cleaned_codes, categories = pd.factorize(cleaned, sort=True)
+    row_codes = np.where(codes >= 0, cleaned_codes[codes], -1)
+    return pd.Series(pd.Categorical.from_codes(row_codes, categories), index=series.index, name=series.name)
+
+
+def _drop_duplicate_keys(df: pd.DataFrame, key: str) -> pd.DataFrame:
+    """Keep the last row for each value of a key column.
+
+    Equivalent to ``df.drop_duplicates(subset=[key], keep="last")``.
+
+    Args:
+        df: Frame to deduplicate
+        key: Name of the key column
+
+    Returns:
+        New frame with one row per key
+    """
+    keys = df[key]
+    # Sorted keys (typical for ids exported in primary-key order) keep their duplicates
+    # adjacent, so a neighbour comparison replaces hashing every key
+    if len(keys) > 1 and keys.is_monotonic_increasing and keys.dtype.kind in "iu":
+        values = keys.to_numpy()
+        keep = np.ones(len(values), dtype=bool)
+        keep[:-1] = values[1:] != values[:-1]
+    else:
+        keep = ~keys.duplicated(keep="last").to_numpy()
+
+    # take() returns an independent frame, so callers can assign to it without relying on
+    # copy-on-write (and without SettingWithCopyWarning on older pandas)
+    return df.take(np.flatnonzero(keep))
+
+
+def _left_join_on_key(left: pd.DataFrame, right: pd.DataFrame, key: str) -> pd.DataFrame:
+    """Left-join the columns of ``right`` onto ``left`` by a shared key column.
+
+    Args:
+        left: Frame whose rows are all kept
+        right: Lookup frame containing ``key`` and the columns to add
+        key: Name of the join column in both frames
+
+    Returns:
+        Joined frame with a fresh RangeIndex, matching ``pd.merge(..., on=key)``
+    """
+    lookup = right.set_index(key)
+
+    # With unique keys every left row matches at most one right row, so each column
+    # can be gathered with a single shared indexer instead of building a joined frame.
+    # Overlapping column names fall through to merge, which suffixes them.
+    if lookup.index.is_unique and left.columns.intersection(lookup.columns).empty:
+        if lookup.empty:
+            # Nothing can match an empty lookup (common for unpopulated dimension tables)
+            indexer = np.full(len(left), -1, dtype=np.intp)
+        else:
+            indexer = lookup.index.get_indexer(left[key])
+        joined = left.copy(deep=False)
+        for col in lookup.columns:
+            # Unmatched rows (-1) are filled with NA, upcasting like a left merge does
+            joined[col] = take(lookup[col].array, indexer, allow_fill=True)
+        return joined.reset_index(drop=True)
+
+    # Joining against the right frame's index lets pandas reuse the index hash table
+    # instead of factorizing the right key column as an ordinary column
+    joined = pd.merge(left, lookup, left_on=key, right_index=True, how="left")
+    return joined.reset_index(drop=True)
+
+
+def clean_customer_data(df: pd.DataFrame, updated_at: datetime | None = None) -> pd.DataFrame:
     """Clean and standardize customer data.
 
     Args:
         df: Raw customer data DataFrame
+        updated_at: Value for the last_updated column (defaults to the current time)
 
     Returns:
         Cleaned customer DataFrame
     """
-    # Create a copy to avoid modifying the original
-    result_df = df.copy()
-
-    # Drop duplicates based on customer_id
-    result_df.drop_duplicates(subset=["customer_id"], keep="last", inplace=True)
+    # Drop duplicates based on customer_id; this returns a new frame, so the input is untouched
+    result_df = _drop_duplicate_keys(df, "customer_id")
 
     # Fill missing values
     result_df["email"] = result_df["email"].fillna("")
     result_df["phone"] = result_df["phone"].fillna("")
 
     # Standardize phone numbers (remove non-digit characters)
-    result_df["phone"] = result_df["phone"].apply(lambda x: re.sub(r"\D", "", str(x)) if pd.notna(x) else "")
+    result_df["phone"] = _strip_non_digits(result_df["phone"])
 
     # Convert names to title case
     for col in ["first_name", "last_name"]:
@@ -46,33 +173,33 @@ def clean_customer_data(df: pd.DataFrame) -> pd.DataFrame:
     result_df["full_name"] = result_df["first_name"] + " " + result_df["last_name"]
 
     # Add data quality columns
-    result_df["has_email"] = result_df["email"].str.len() > 0
-    result_df["has_phone"] = result_df["phone"].str.len() > 0
-    result_df["last_updated"] = datetime.now()
+    # Both columns were filled with "" above, so emptiness is a single comparison.
+    # Store plain numpy bools; the Arrow-backed phone column would otherwise yield bool[pyarrow]
+    result_df["has_email"] = (result_df["email"] != "").to_numpy(dtype=bool)
+    result_df["has_phone"] = (result_df["phone"] != "").to_numpy(dtype=bool)
+    result_df["last_updated"] = updated_at if updated_at is not None else datetime.now()
 
     return result_df
 
 
-def clean_order_data(df: pd.DataFrame) -> pd.DataFrame:
+def clean_order_data(df: pd.DataFrame, updated_at: datetime | None = None) -> pd.DataFrame:
     """Clean and standardize order data.
 
     Args:
         df: Raw order data DataFrame
+        updated_at: Value for the last_updated column (defaults to the current time)
 
     Returns:
         Cleaned order DataFrame
     """
-    # Create a copy to avoid modifying the original
-    result_df = df.copy()
-
-    # Drop duplicates based on order_id
-    result_df.drop_duplicates(subset=["order_id"], keep="last", inplace=True)
+    # Drop duplicates based on order_id; this returns a new frame, so the input is untouched
+    result_df = _drop_duplicate_keys(df, "order_id")
 
     # Convert date columns to datetime
     date_columns = ["order_date", "ship_date", "delivery_date"]
     for col in date_columns:
         if col in result_df.columns:
-            result_df[col] = pd.to_datetime(result_df[col], errors="coerce")
+            result_df[col] = _parse_dates(result_df[col])
 
     # Calculate order_total if not present
     if "order_total" not in result_df.columns and "item_price" in result_df.columns and "quantity" in result_df.columns:
@@ -83,39 +210,48 @@ def clean_order_data(df: pd.DataFrame) -> pd.DataFrame:
 
     # Add derived columns
     if "ship_date" in result_df.columns and "order_date" in result_df.columns:
-        result_df["processing_days"] = (result_df["ship_date"] - result_df["order_date"]).dt.days
+        # Whole days on the raw timedelta64 array, floored like Series.dt.days
+        delta = (result_df["ship_date"] - result_df["order_date"]).to_numpy()
+        days = np.floor(delta / np.timedelta64(1, "D"))
 
-        # Handle negative values (incorrect dates)
-        result_df.loc[result_df["processing_days"] < 0, "processing_days"] = np.nan
+        # Negative values (incorrect dates) and missing dates both become NaN in one pass
+        result_df["processing_days"] = np.where(days >= 0, days, np.nan)
 
     # Add status columns
     if "order_status" not in result_df.columns:
-        result_df["order_status"] = "Unknown"
-        if "ship_date" in result_df.columns:
-            result_df.loc[pd.notna(result_df["ship_date"]), "order_status"] = "Shipped"
+        # First matching condition wins; codes index into ORDER_STATUSES
+        conditions = []
+        choices = []
         if "delivery_date" in result_df.columns:
-            result_df.loc[pd.notna(result_df["delivery_date"]), "order_status"] = "Delivered"
+            conditions.append(result_df["delivery_date"].notna().to_numpy())
+            choices.append(2)
+        if "ship_date" in result_df.columns:
+            conditions.append(result_df["ship_date"].notna().to_numpy())
+            choices.append(1)
+        if conditions:
+            codes = np.select(conditions, choices, default=0).astype(np.int8)
+        else:
+            codes = np.zeros(len(result_df), dtype=np.int8)
+        result_df["order_status"] = pd.Categorical.from_codes(codes, categories=ORDER_STATUSES, ordered=True)
 
     # Add last_updated timestamp
-    result_df["last_updated"] = datetime.now()
+    result_df["last_updated"] = updated_at if updated_at is not None else datetime.now()
 
     return result_df
 
 
-def clean_product_data(df: pd.DataFrame) -> pd.DataFrame:
+def clean_product_data(df: pd.DataFrame, updated_at: datetime | None = None) -> pd.DataFrame:
     """Clean and standardize product data.
 
     Args:
         df: Raw product data DataFrame
+        updated_at: Value for the last_updated column (defaults to the current time)
 
     Returns:
         Cleaned product DataFrame
     """
-    # Create a copy to avoid modifying the original
-    result_df = df.copy()
-
-    # Drop duplicates based on product_id
-    result_df.drop_duplicates(subset=["product_id"], keep="last", inplace=True)
+    # Drop duplicates based on product_id; this returns a new frame, so the input is untouched
+    result_df = _drop_duplicate_keys(df, "product_id")
 
     # Cleanup product names
     if "product_name" in result_df.columns:
@@ -137,79 +273,81 @@ def clean_product_data(df: pd.DataFrame) -> pd.DataFrame:
     # Calculate margins if price and cost are available
     if "price" in result_df.columns and "cost" in result_df.columns:
         result_df["margin"] = result_df["price"] - result_df["cost"]
-        result_df["margin_percent"] = (result_df["margin"] / result_df["price"]) * 100
 
-        # Handle division by zero
-        result_df.loc[result_df["price"] == 0, "margin_percent"] = 0
+        # Divide only where price is non-zero; zero prices keep the preset 0 margin
+        price = result_df["price"].to_numpy(dtype=np.float64, na_value=np.nan)
+        margin = result_df["margin"].to_numpy(dtype=np.float64, na_value=np.nan)
+        ratio = np.divide(margin, price, out=np.zeros(len(price)), where=price != 0)
+        result_df["margin_percent"] = ratio * 100
 
     # Remove rows with missing critical data
     result_df = result_df.dropna(subset=["product_id"])
 
     # Add last_updated timestamp
-    result_df["last_updated"] = datetime.now()
+    result_df["last_updated"] = updated_at if updated_at is not None else datetime.now()
 
     return result_df
 
 
-def clean_store_location_data(df: pd.DataFrame) -> pd.DataFrame:
+def clean_store_location_data(df: pd.DataFrame, updated_at: datetime | None = None) -> pd.DataFrame:
     """Clean and standardize store location data.
 
     Args:
         df: Raw store location data DataFrame
+        updated_at: Value for the last_updated column (defaults to the current time)
 
     Returns:
         Cleaned store location DataFrame
     """
-    # Create a copy to avoid modifying the original
-    result_df = df.copy()
-
-    # Drop duplicates based on store_id
-    result_df.drop_duplicates(subset=["store_id"], keep="last", inplace=True)
+    # Drop duplicates based on store_id; this returns a new frame, so the input is untouched
+    result_df = _drop_duplicate_keys(df, "store_id")
 
     # Standardize address fields
-    address_cols = ["address", "city", "state", "zip_code", "country"]
-    for col in address_cols:
+    for col in ["address", "city", "zip_code"]:
         if col in result_df.columns:
             # Trim whitespace
             result_df[col] = result_df[col].str.strip()
 
-            # Convert state and country to uppercase
-            if col in ["state", "country"]:
-                result_df[col] = result_df[col].str.upper()
+    # Trim and uppercase state and country
+    for col in ["state", "country"]:
+        if col in result_df.columns:
+            result_df[col] = _normalize_code_column(result_df[col])
 
     # Standardize zip codes
     if "zip_code" in result_df.columns:
         # Keep only numeric parts for US zip codes
-        result_df["zip_code"] = result_df["zip_code"].apply(
-            lambda x: re.sub(r"[^0-9]", "", str(x)) if pd.notna(x) else ""
-        )
+        result_df["zip_code"] = _strip_non_digits(result_df["zip_code"], _NON_ASCII_DIGIT_RE)
 
     # Format phone numbers
     if "phone" in result_df.columns:
-        result_df["phone"] = result_df["phone"].apply(lambda x: re.sub(r"\D", "", str(x)) if pd.notna(x) else "")
+        result_df["phone"] = _strip_non_digits(result_df["phone"])
 
     # Convert date columns to datetime
     date_columns = ["opening_date", "closing_date"]
     for col in date_columns:
         if col in result_df.columns:
-            result_df[col] = pd.to_datetime(result_df[col], errors="coerce")
+            result_df[col] = _parse_dates(result_df[col])
 
     # Add is_active flag
-    result_df["is_active"] = True
     if "closing_date" in result_df.columns:
-        result_df.loc[pd.notna(result_df["closing_date"]), "is_active"] = False
+        result_df["is_active"] = result_df["closing_date"].isna().to_numpy()
+    else:
+        result_df["is_active"] = True
 
     # Remove rows with missing critical data
     result_df = result_df.dropna(subset=["store_id"])
 
     # Add last_updated timestamp
-    result_df["last_updated"] = datetime.now()
+    result_df["last_updated"] = updated_at if updated_at is not None else datetime.now()
 
     return result_df
 
 
 def enrich_inventory_data(
-    inventory_df: pd.DataFrame, products_df: pd.DataFrame, store_locations_df: pd.DataFrame
+    inventory_df: pd.DataFrame,
+    products_df: pd.DataFrame,
+    store_locations_df: pd.DataFrame,
+    updated_at: datetime | None = None,
 ) -> pd.DataFrame:
     """Enrich inventory data with product and store information.
 
@@ -217,12 +355,13 @@ def enrich_inventory_data(
         inventory_df: Raw inventory data
         products_df: Product data for enrichment
         store_locations_df: Store location data for enrichment
+        updated_at: Value for the last_updated column (defaults to the current time)
 
     Returns:
         Enriched inventory data
     """
-    # Create a copy to avoid modifying the original
-    result_df = inventory_df.copy()
+    # Shallow copy: new columns never reach the caller's frame, and no data is duplicated
+    result_df = inventory_df.copy(deep=False)
 
     # Merge with product data
     if "product_id" in result_df.columns and "product_id" in products_df.columns:
@@ -231,7 +370,7 @@ def enrich_inventory_data(
         product_cols = [col for col in product_cols if col in products_df.columns]
 
         # Merge product data
-        result_df = pd.merge(result_df, products_df[product_cols], on="product_id", how="left")
+        result_df = _left_join_on_key(result_df, products_df[product_cols], "product_id")
 
     # Merge with store location data
     if "store_id" in result_df.columns and "store_id" in store_locations_df.columns:
@@ -240,7 +379,7 @@ def enrich_inventory_data(
         store_cols = [col for col in store_cols if col in store_locations_df.columns]
 
         # Merge store location data
-        result_df = pd.merge(result_df, store_locations_df[store_cols], on="store_id", how="left")
+        result_df = _left_join_on_key(result_df, store_locations_df[store_cols], "store_id")
 
     # Calculate inventory value
     if "quantity" in result_df.columns and "cost" in result_df.columns:
@@ -251,12 +390,12 @@ def enrich_inventory_data(
 
     # Add inventory status based on quantity
     if "quantity" in result_df.columns:
-        # Create inventory status column
-        result_df["inventory_status"] = "In Stock"
-        result_df.loc[result_df["quantity"] <= 0, "inventory_status"] = "Out of Stock"
-        result_df.loc[result_df["quantity"] < 10, "inventory_status"] = "Low Stock"
+        # One pass over quantity; codes index into INVENTORY_STATUSES
+        quantity = result_df["quantity"].to_numpy()
+        codes = np.select([quantity <= 0, quantity < 10], [1, 2], default=0).astype(np.int8)
+        result_df["inventory_status"] = pd.Categorical.from_codes(codes, categories=INVENTORY_STATUSES)
 
     # Add last_updated timestamp
-    result_df["last_updated"] = datetime.now()
+    result_df["last_updated"] = updated_at if updated_at is not None else datetime.now()
 
     return result_df
@@ -5,88 +5,95 @@ Use this template as a starting point for creating new workflows.
 Replace the placeholders with your implementation.
 """
 
+from collections.abc import Iterator
 from typing import Any
 
+import pandas as pd
 from loguru import logger
 
 from data_warehouse.workflow.base import WorkflowBase, WorkflowContext
 from data_warehouse.workflow.etl import ExtractorBase, LoaderBase, TransformerBase
 
+# Rows per DataFrame chunk. Each step handles one chunk at a time, so peak memory is
+# bounded by the chunk size rather than the size of the source.
+CHUNK_SIZE = 100_000
 
-class MyWorkflowExtractor(ExtractorBase[list[dict[str, Any]]]):
+
+class MyWorkflowExtractor(ExtractorBase[Iterator[pd.DataFrame]]):
     """Data extractor for MyWorkflow."""
 
-    def extract(self, context: WorkflowContext) -> list[dict[str, Any]]:
+    def extract(self, context: WorkflowContext) -> Iterator[pd.DataFrame]:
         """Extract data from the source.
 
         Args:
             context: The workflow context
 
-        Returns:
-            List of extracted data records
+        Yields:
+            Chunks of extracted records
         """
         logger.info("Extracting data")
 
         # Implementation goes here
         # Example:
-        # source_name = self.config.source_name
-        # records = api_client.fetch_data(source_name)
-        # return records
+        # source_path = context.config["source_path"]
+        # yield from pd.read_csv(source_path, chunksize=CHUNK_SIZE, dtype={"id": "int64", "name": "string"})
 
         # Placeholder implementation
-        return [{"id": 1, "name": "Example"}]
+        yield pd.DataFrame({"id": [1], "name": ["Example"]})
 
 
-class MyWorkflowTransformer(TransformerBase[list[dict[str, Any]], list[dict[str, Any]]]):
+class MyWorkflowTransformer(TransformerBase[Iterator[pd.DataFrame], Iterator[pd.DataFrame]]):
     """Data transformer for MyWorkflow."""
 
-    def transform(self, data: list[dict[str, Any]], context: WorkflowContext) -> list[dict[str, Any]]:
+    def transform(self, data: Iterator[pd.DataFrame], context: WorkflowContext) -> Iterator[pd.DataFrame]:
         """Transform the extracted data.
 
         Args:
-            data: The data to transform
+            data: Chunks of data to transform
             context: The workflow context
 
-        Returns:
-            Transformed data
+        Yields:
+            Transformed chunks
         """
-        logger.info(f"Transforming {len(data)} records")
+        logger.info("Transforming data")
 
         # Implementation goes here
-        # Example:
-        # transformed_data = []
-        # for record in data:
-        #     transformed_record = self._transform_record(record)
-        #     transformed_data.append(transformed_record)
-        # return transformed_data
+        # Example (the cleaners in data_warehouse.utils.transformations work per frame):
+        # for chunk in data:
+        #     yield clean_customer_data(chunk)
 
         # Placeholder implementation
-        return [{"id": record["id"], "name": record["name"].upper()} for record in data]
+        for chunk in data:
+            yield chunk.assign(name=chunk["name"].str.upper())
 
 
-class MyWorkflowLoader(LoaderBase[list[dict[str, Any]]]):
+class MyWorkflowLoader(LoaderBase[Iterator[pd.DataFrame]]):
     """Data loader for MyWorkflow."""
 
-    def load(self, data: list[dict[str, Any]], context: WorkflowContext) -> int:
+    def load(self, data: Iterator[pd.DataFrame], context: WorkflowContext) -> int:
         """Load data into the target system.
 
         Args:
-            data: The data to load
+            data: Chunks of data to load
             context: The workflow context
 
         Returns:
             Number of records loaded
         """
-        logger.info(f"Loading {len(data)} records")
+        logger.info("Loading data")
 
-        # Implementation goes here
-        # Example:
-        # target_name = self.config.target_name
-        # return database.insert_records(target_name, data)
+        records_loaded = 0
+        for chunk in data:
+            # Implementation goes here
+            # Example:
+            # target_name = self.config.target_name
+            # chunk.to_sql(target_name, engine, if_exists="append", index=False)
 
-        # Placeholder implementation
-        logger.info(f"Would load {len(data)} records to {self.config.target_name}")
-        return len(data)
+            # Placeholder implementation
+            logger.info(f"Would load {len(chunk)} records to {self.config.target_name}")
+            records_loaded += len(chunk)
+
+        return records_loaded
 
 
 class MyWorkflow(WorkflowBase):
@@ -113,6 +120,7 @@ class MyWorkflow(WorkflowBase):
         Returns:
             Updated workflow context with extracted data
         """
+        # The extractor is lazy; chunks are only read once the loader consumes them
         extracted_data = self.extractor.extract(context)
         context.update_data({"extracted_data": extracted_data})
         return context
@@ -14,10 +14,13 @@ from __future__ import annotations
 import abc
 import inspect
 import pkgutil
+import time
+from collections import deque
 from dataclasses import dataclass, field
+from datetime import datetime
 from enum import Enum
 from importlib import import_module
-from typing import Any, TypeVar
+from typing import Any, ClassVar, TypeVar
 
 from loguru import logger
 from pydantic import BaseModel, Field, validator
@@ -79,6 +82,18 @@ class WorkflowContext:
 class WorkflowBase(abc.ABC):
     """Abstract base class for all workflows."""
 
+    # Unique identifier of the workflow class, set when the subclass is defined
+    _workflow_id: ClassVar[str]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Compute the workflow ID once for each subclass.
+
+        The ID is stored on the class itself rather than in a cache keyed by class, so
+        classes replaced by a hot reload can be garbage collected.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._workflow_id = f"{cls.__module__}.{cls.__name__}"
+
     def __init__(self, config: dict[str, Any] | None = None) -> None:
         """Initialize the workflow with optional configuration."""
         self.config = config or {}
@@ -88,8 +103,8 @@ class WorkflowBase(abc.ABC):
 
     @classmethod
     def get_workflow_id(cls) -> str:
-        """Get the unique identifier for this workflow."""
-        return f"{cls.__module__}.{cls.__name__}"
+        """Get the unique identifier for this workflow, computed once per class."""
+        return cls._workflow_id
 
     @abc.abstractmethod
     def extract(self, context: WorkflowContext) -> WorkflowContext:
@@ -139,6 +154,8 @@ class WorkflowRegistry:
     _instance = None
     _workflows: dict[str, type[WorkflowBase]] = {}
     _domains: dict[str, set[str]] = {}
+    # Reverse index of _domains so unregister only touches the domains a workflow is in
+    _workflow_domains: dict[str, set[str]] = {}
 
     def __new__(cls) -> WorkflowRegistry:
         """Ensure registry is a singleton."""
@@ -155,22 +172,31 @@ class WorkflowRegistry:
         if domain not in self._domains:
             self._domains[domain] = set()
         self._domains[domain].add(workflow_id)
+        self._workflow_domains.setdefault(workflow_id, set()).add(domain)
 
         logger.debug(f"Registered workflow: {workflow_id} in domain: {domain}")
 
     def unregister(self, workflow_id: str) -> None:
         """Unregister a workflow by its ID."""
         if workflow_id in self._workflows:
-            self._workflows[workflow_id]
             del self._workflows[workflow_id]
 
             # Clean up domain registrations
-            for _domain, workflows in self._domains.items():
-                if workflow_id in workflows:
-                    workflows.remove(workflow_id)
+            for domain in self._workflow_domains.pop(workflow_id, ()):
+                self._domains[domain].discard(workflow_id)
 
             logger.debug(f"Unregistered workflow: {workflow_id}")
 
+    def unregister_module(self, module_name: str) -> None:
+        """Unregister every workflow defined in a module."""
+        workflow_ids = [
+            workflow_id
+            for workflow_id, workflow_class in self._workflows.items()
+            if workflow_class.__module__ == module_name
+        ]
+        for workflow_id in workflow_ids:
+            self.unregister(workflow_id)
+
     def get_workflow(self, workflow_id: str) -> type[WorkflowBase]:
         """Get a workflow class by its ID."""
         if workflow_id not in self._workflows:
@@ -215,15 +241,25 @@ class WorkflowRegistry:
                 # Import the module and search for workflow classes
                 try:
                     module = import_module(full_module_name)
-                    for _name, obj in inspect.getmembers(module):
-                        # Check if it's a class that inherits from WorkflowBase
-                        if inspect.isclass(obj) and issubclass(obj, WorkflowBase) and obj != WorkflowBase:
-                            # Extract domain from module path
-                            domain_parts = full_module_name.split(".")
-                            domain = domain_parts[-2] if len(domain_parts) > 2 else "default"
 
-                            # Register the workflow
-                            self.register(obj, domain=domain)
+                    # Modules may list their workflows in __workflows__ to skip the scan;
+                    # otherwise walk the module namespace directly (no sorting, unlike
+                    # inspect.getmembers) and keep WorkflowBase subclasses
+                    workflow_classes = getattr(module, "__workflows__", None)
+                    if workflow_classes is None:
+                        workflow_classes = [
+                            obj
+                            for obj in vars(module).values()
+                            if isinstance(obj, type) and issubclass(obj, WorkflowBase) and obj is not WorkflowBase
+                        ]
+
+                    # Extract domain from module path
+                    domain_parts = full_module_name.split(".")
+                    domain = domain_parts[-2] if len(domain_parts) > 2 else "default"
+
+                    # Register the workflows
+                    for obj in workflow_classes:
+                        self.register(obj, domain=domain)
 
                 except Exception as e:
                     logger.warning(f"Error importing module {full_module_name}: {str(e)}")
@@ -262,6 +298,9 @@ class WorkflowExecutor:
         return results
 
 
+_REQUIRED_WORKFLOW_METHODS = frozenset({"extract", "transform", "load"})
+
+
 class WorkflowValidator:
     """Validates workflow definitions and configurations."""
 
@@ -269,17 +308,19 @@ class WorkflowValidator:
     def validate_workflow_class(workflow_class: type[WorkflowBase]) -> bool:
         """Validate that a workflow class meets all requirements."""
         # Check that it's a proper subclass
-        if not inspect.isclass(workflow_class) or not issubclass(workflow_class, WorkflowBase):
+        if (
+            not inspect.isclass(workflow_class)
+            or not issubclass(workflow_class, WorkflowBase)
+            or workflow_class is WorkflowBase
+        ):
             logger.error(f"{workflow_class} is not a valid WorkflowBase subclass")
             return False
 
-        # Check that required methods are implemented
-        required_methods = ["extract", "transform", "load"]
-        for method_name in required_methods:
-            method = getattr(workflow_class, method_name, None)
-            if not method or method.__func__ is getattr(WorkflowBase, method_name):
-                logger.error(f"{workflow_class.__name__} must implement {method_name}")
-                return False
+        # ABCMeta already tracks which abstract methods are still unimplemented
+        missing = workflow_class.__abstractmethods__ & _REQUIRED_WORKFLOW_METHODS
+        if missing:
+            logger.error(f"{workflow_class.__name__} must implement {', '.join(sorted(missing))}")
+            return False
 
         return True
 
@@ -294,33 +335,54 @@ class WorkflowValidator:
             return False
 
 
+@dataclass
+class ExecutionRecord:
+    """A single workflow execution event recorded by the monitor."""
+
+    timestamp_ns: int
+    status: WorkflowStatus
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def timestamp(self) -> str:
+        """ISO 8601 local time of the event, as ``datetime.now().isoformat()`` gives."""
+        seconds, nanoseconds = divmod(self.timestamp_ns, 1_000_000_000)
+        return datetime.fromtimestamp(seconds).replace(microsecond=nanoseconds // 1000).isoformat()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the record to a plain dictionary."""
+        return {"timestamp": self.timestamp, "status": self.status, "metadata": self.metadata}
+
+
 class WorkflowMonitor:
     """Tracks and reports on workflow execution."""
 
-    def __init__(self) -> None:
-        """Initialize the workflow monitor."""
+    def __init__(self, max_history: int | None = None) -> None:
+        """Initialize the workflow monitor.
+
+        Args:
+            max_history: Optional number of execution records kept per workflow;
+                older records are discarded. The full history is kept by default.
+        """
+        self.max_history = max_history
         self.workflows: dict[str, dict[str, Any]] = {}
 
     def register_workflow_execution(
         self, workflow_id: str, status: WorkflowStatus, metadata: dict[str, Any] | None = None
     ) -> None:
         """Register a workflow execution event."""
-        if workflow_id not in self.workflows:
-            self.workflows[workflow_id] = {
-                "executions": [],
+        entry = self.workflows.get(workflow_id)
+        if entry is None:
+            entry = self.workflows[workflow_id] = {
+                "executions": deque(maxlen=self.max_history),
                 "last_status": None,
             }
 
-        execution = {
-            "timestamp": import_module("datetime").datetime.now().isoformat(),
-            "status": status,
-            "metadata": metadata or {},
-        }
-
-        self.workflows[workflow_id]["executions"].append(execution)
-        self.workflows[workflow_id]["last_status"] = status
+        # Store the raw clock reading; the ISO string is only built when history is read
+        entry["executions"].append(ExecutionRecord(time.time_ns(), status, metadata or {}))
+        entry["last_status"] = status
 
-        logger.info(f"Workflow {workflow_id} status: {status}")
+        logger.info("Workflow {} status: {}", workflow_id, status)
 
     def get_workflow_status(self, workflow_id: str) -> WorkflowStatus | None:
         """Get the last status of a workflow."""
@@ -332,4 +394,4 @@ class WorkflowMonitor:
         """Get the execution history of a workflow."""
         if workflow_id not in self.workflows:
             return []
-        return self.workflows[workflow_id]["executions"]
+        return [record.to_dict() for record in self.workflows[workflow_id]["executions"]]
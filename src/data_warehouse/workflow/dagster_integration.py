@@ -5,7 +5,15 @@ This module provides integration between the workflow system and Dagster,
 enabling workflows to be orchestrated as Dagster assets and ops.
 """
 
-from collections.abc import Callable
+import functools
+import hashlib
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from contextvars import ContextVar
+from types import MappingProxyType
 from typing import Any
 
 from dagster import (
@@ -15,7 +23,6 @@ from dagster import (
     DagsterLogManager,
     InputContext,
     IOManager,
-    MetadataValue,
     OpExecutionContext,
     Out,
     OutputContext,
@@ -28,6 +35,72 @@ from loguru import logger
 from data_warehouse.core.exceptions import WorkflowError
 from data_warehouse.workflow.base import WorkflowBase, WorkflowContext, WorkflowRegistry
 
+# Output types whose length is reported as the record count
+_RECORD_COUNT_TYPES = (list, dict, tuple, set)
+
+# Inputs of assets without dependencies; read-only so the shared mapping cannot change
+_EMPTY_INS: Mapping[str, AssetIn] = MappingProxyType({})
+
+
+@functools.lru_cache(maxsize=1024)
+def _asset_in_for(dep_key: AssetKey) -> AssetIn:
+    """Get the asset input for a dependency, shared across assets.
+
+    Args:
+        dep_key: Key of the upstream asset
+
+    Returns:
+        Asset input referring to the upstream asset
+    """
+    return AssetIn(key=dep_key)
+
+
+@functools.cache
+def _type_name(obj_type: type) -> str:
+    """Format a type for output metadata, once per type.
+
+    Args:
+        obj_type: Type of an output value
+
+    Returns:
+        String form of the type
+    """
+    return str(obj_type)
+
+
+def _workflow_meta(workflow_class: type[WorkflowBase]) -> tuple[str, str, str]:
+    """Split a workflow's ID into its naming parts.
+
+    Args:
+        workflow_class: The workflow class
+
+    Returns:
+        Tuple of (workflow ID, class name, domain)
+    """
+    # The ID is stored on the class when it is defined, so no per-class cache is needed
+    # (one keyed by class would also keep every hot-reloaded class alive)
+    workflow_id = workflow_class._workflow_id
+    parts = workflow_id.split(".")
+    domain = parts[-2] if len(parts) > 2 else "default"
+    return workflow_id, parts[-1], domain
+
+
+def _config_key(config: dict[str, Any] | None) -> tuple | None:
+    """Build a hashable key for a workflow config.
+
+    Args:
+        config: Configuration for the workflow
+
+    Returns:
+        Sorted tuple of the config items, or None if a value is unhashable
+    """
+    key = tuple(sorted((config or {}).items()))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
 
 class WorkflowIOManager(IOManager):
     """IO Manager for workflow data exchange.
@@ -35,14 +108,31 @@ class WorkflowIOManager(IOManager):
     This IO manager handles the exchange of data between workflow steps in Dagster.
     """
 
-    def __init__(self, storage_dir: str = "/tmp/workflow_io") -> None:
+    def __init__(self, storage_dir: str = "/tmp/workflow_io", max_entries: int = 1024) -> None:
         """Initialize the IO manager.
 
         Args:
             storage_dir: Directory for temporary data storage
+            max_entries: Number of outputs kept in memory; least recently used outputs
+                beyond this are spilled to ``storage_dir``
         """
         self.storage_dir = storage_dir
-        self._cache: dict[str, Any] = {}  # Simple in-memory store for data exchange
+        self.max_entries = max_entries
+        # In-memory LRU store for data exchange, most recently used last
+        self._cache: OrderedDict[tuple[str, ...], Any] = OrderedDict()
+
+    def _spill_path(self, key: tuple[str, ...]) -> str:
+        """Get the file used to hold an evicted output.
+
+        Args:
+            key: Cache key of the output
+
+        Returns:
+            Path of the pickle file for the key
+        """
+        # Keys are identifier parts, so hash them into a safe file name
+        digest = hashlib.sha1("/".join(key).encode()).hexdigest()
+        return os.path.join(self.storage_dir, f"{digest}.pkl")
 
     def handle_output(self, context: OutputContext, obj: Any) -> None:
         """Store output data from a workflow step.
@@ -52,14 +142,14 @@ class WorkflowIOManager(IOManager):
             obj: Output data from the workflow step
         """
         # Store the output data in our cache using a unique key
-        key = str(context.get_run_scoped_output_identifier())
-        self._cache[key] = obj
+        self._store(tuple(context.get_run_scoped_output_identifier()), obj)
 
-        # Add metadata to help with debugging and monitoring
+        # Add metadata to help with debugging and monitoring; plain values are wrapped
+        # into metadata values by Dagster
         context.add_output_metadata(
             {
-                "record_count": MetadataValue.int(len(obj) if isinstance(obj, list | dict) else 1),
-                "data_type": MetadataValue.text(str(type(obj))),
+                "record_count": len(obj) if isinstance(obj, _RECORD_COUNT_TYPES) else 1,
+                "data_type": _type_name(type(obj)),
             }
         )
 
@@ -73,8 +163,46 @@ class WorkflowIOManager(IOManager):
             Input data for the workflow step
         """
         # Retrieve data from cache using the unique identifier
-        key = str(context.get_run_scoped_output_identifier())
-        return self._cache.get(key)
+        key = tuple(context.get_run_scoped_output_identifier())
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        # Fall back to outputs that were spilled to disk; the output moves back into
+        # memory, so the file is no longer needed
+        spill_path = self._spill_path(key)
+        if os.path.exists(spill_path):
+            with open(spill_path, "rb") as f:
+                obj = pickle.load(f)
+            os.remove(spill_path)
+            self._store(key, obj)
+            return obj
+        return None
+
+    def _store(self, key: tuple[str, ...], obj: Any) -> None:
+        """Keep an output in memory, spilling the least recently used ones to disk.
+
+        Outputs that cannot be pickled, such as generators, are dropped on eviction
+        with a warning instead of failing the step that caused the eviction.
+
+        Args:
+            key: Cache key of the output
+            obj: Output data
+        """
+        self._cache[key] = obj
+        self._cache.move_to_end(key)
+
+        # Spill the least recently used outputs so memory stays bounded
+        while len(self._cache) > self.max_entries:
+            evicted_key, evicted = self._cache.popitem(last=False)
+            try:
+                data = pickle.dumps(evicted, protocol=pickle.HIGHEST_PROTOCOL)
+            except (pickle.PicklingError, TypeError, AttributeError) as e:
+                logger.warning(f"Dropping output {'/'.join(evicted_key)} that cannot be spilled to disk: {str(e)}")
+                continue
+            os.makedirs(self.storage_dir, exist_ok=True)
+            with open(self._spill_path(evicted_key), "wb") as f:
+                f.write(data)
 
 
 @io_manager
@@ -87,6 +215,54 @@ def workflow_io_manager() -> WorkflowIOManager:
     return WorkflowIOManager()
 
 
+def _execute_workflow(
+    workflow_class: type[WorkflowBase],
+    config: dict[str, Any] | None,
+    workflow_id: str,
+    context: AssetExecutionContext | OpExecutionContext,
+    data: dict[str, Any],
+    kind: str,
+) -> dict[str, Any]:
+    """Execute a workflow inside a Dagster asset or op.
+
+    Args:
+        workflow_class: The workflow class to execute
+        config: Configuration for the workflow
+        workflow_id: ID of the workflow
+        context: Dagster execution context
+        data: Initial data for the workflow context
+        kind: Kind of Dagster definition ("asset" or "op"), used in messages
+
+    Returns:
+        Workflow execution results
+
+    Raises:
+        WorkflowError: If the workflow fails
+    """
+    # Configure logging
+    _setup_loguru_dagster_bridge(context.log)
+
+    # Create and configure workflow instance
+    workflow = workflow_class(config or {})
+
+    # Create workflow context
+    workflow_context = WorkflowContext(workflow_id=workflow_id)
+    workflow_context.update_data(data)
+
+    try:
+        # Execute the workflow
+        logger.info(f"Executing workflow as Dagster {kind}: {workflow_id}")
+        result_context = workflow.execute()
+
+        # Return results
+        return result_context.data
+
+    except Exception as e:
+        logger.error(f"Workflow {kind} execution failed: {str(e)}")
+        context.log.error(str(e))
+        raise WorkflowError(f"Error executing workflow as Dagster {kind}: {str(e)}") from e
+
+
 class DagsterWorkflowAdapter:
     """Adapter for converting workflows to Dagster assets and ops."""
 
@@ -98,6 +274,40 @@ class DagsterWorkflowAdapter:
                      the singleton registry will be used.
         """
         self.registry = registry or WorkflowRegistry()
+        # Built assets and ops keyed by workflow ID, config and naming options, so
+        # repeated conversions reuse the same definitions. Keying by ID rather than class
+        # means a reloaded workflow replaces its stale entries instead of adding to them.
+        self._definition_cache: dict[tuple, Callable] = {}
+        self._cached_classes: dict[str, type[WorkflowBase]] = {}
+
+    def _cached_definition(
+        self, key: tuple | None, workflow_class: type[WorkflowBase], build: Callable[[], Callable]
+    ) -> Callable:
+        """Get a cached asset or op, building and caching it on first use.
+
+        Args:
+            key: Cache key whose second item is the workflow ID, or None if the
+                definition cannot be cached
+            workflow_class: The workflow class the definition executes
+            build: Function creating the definition
+
+        Returns:
+            The Dagster asset or op function
+        """
+        if key is None:
+            return build()
+
+        workflow_id = key[1]
+        if self._cached_classes.get(workflow_id) is not workflow_class:
+            # First use, or the workflow was reloaded: drop definitions built for the old class
+            for stale_key in [k for k in self._definition_cache if k[1] == workflow_id]:
+                del self._definition_cache[stale_key]
+            self._cached_classes[workflow_id] = workflow_class
+
+        definition = self._definition_cache.get(key)
+        if definition is None:
+            definition = self._definition_cache[key] = build()
+        return definition
 
     def workflow_to_asset(
         self,
@@ -119,66 +329,57 @@ class DagsterWorkflowAdapter:
         Returns:
             A Dagster asset function
         """
-        # Get workflow ID and extract the class name part
-        workflow_id = workflow_class.get_workflow_id()
-        class_name = workflow_id.split(".")[-1]
-
-        # Initialize asset dependencies
-        ins = {}
-        if deps:
-            for i, dep in enumerate(deps):
-                ins[f"dep_{i}"] = AssetIn(key=dep)
-
-        # Create the asset decorator
-        asset_decorator = asset(
-            name=f"{name_prefix}{class_name}".lower(),
-            group_name=group_name,
-            ins=ins,
-            io_manager_key="workflow_io_manager",
-            compute_kind="workflow",
+        # Get the class name part of the workflow ID
+        workflow_id, class_name, _ = _workflow_meta(workflow_class)
+        asset_name = f"{name_prefix}{class_name}".lower()
+
+        dep_keys = tuple(deps or ())
+
+        config_key = _config_key(config)
+        key = None if config_key is None else ("asset", workflow_id, config_key, dep_keys, asset_name, group_name)
+        return self._cached_definition(
+            key,
+            workflow_class,
+            functools.partial(self._build_asset, workflow_class, asset_name, config, dep_keys, group_name),
         )
 
-        # Define the asset function
-        @asset_decorator
-        def workflow_asset(context: AssetExecutionContext, **inputs: Any) -> dict[str, Any]:
-            """Execute the workflow as a Dagster asset.
-
-            Args:
-                context: Dagster asset execution context
-                inputs: Dependency inputs
-
-            Returns:
-                Workflow execution results
-            """
-            # Configure logging
-            _setup_loguru_dagster_bridge(context.log)
-
-            # Create and configure workflow instance
-            workflow = workflow_class(config or {})
-
-            # Create workflow context
-            workflow_context = WorkflowContext(workflow_id=workflow_id)
-
-            # Add dependency data to workflow context
-            for key, value in inputs.items():
-                if value is not None:
-                    workflow_context.update_data({key: value})
+    def _build_asset(
+        self,
+        workflow_class: type[WorkflowBase],
+        asset_name: str,
+        config: dict[str, Any] | None,
+        deps: tuple[AssetKey, ...],
+        group_name: str | None,
+    ) -> Callable:
+        """Create the Dagster asset that executes a workflow.
 
-            # Add Dagster context
-            workflow_context.update_data({"dagster_context": context})
+        Args:
+            workflow_class: The workflow class to execute
+            asset_name: Name of the asset
+            config: Configuration for the workflow
+            deps: Keys of the assets this asset depends on
+            group_name: Asset group name
 
-            try:
-                # Execute the workflow
-                logger.info(f"Executing workflow as Dagster asset: {workflow_id}")
-                result_context = workflow.execute()
+        Returns:
+            A Dagster asset function
+        """
+        workflow_id, _, _ = _workflow_meta(workflow_class)
 
-                # Return results
-                return result_context.data
+        # Initialize asset dependencies; inputs for shared upstream assets are reused
+        ins = {f"dep_{i}": _asset_in_for(dep) for i, dep in enumerate(deps)} if deps else _EMPTY_INS
 
-            except Exception as e:
-                logger.error(f"Workflow asset execution failed: {str(e)}")
-                context.log.error(str(e))
-                raise WorkflowError(f"Error executing workflow as Dagster asset: {str(e)}") from e
+        @asset(
+            name=asset_name,
+            group_name=group_name,
+            ins=ins,
+            io_manager_key="workflow_io_manager",
+            compute_kind="workflow",
+        )
+        def workflow_asset(context: AssetExecutionContext, **inputs: Any) -> dict[str, Any]:
+            """Execute the workflow as a Dagster asset."""
+            data = {key: value for key, value in inputs.items() if value is not None}
+            data["dagster_context"] = context
+            return _execute_workflow(workflow_class, config, workflow_id, context, data, "asset")
 
         return workflow_asset
 
@@ -200,57 +401,46 @@ class DagsterWorkflowAdapter:
         Returns:
             A Dagster op function
         """
-        # Get workflow ID and extract the class name part
-        workflow_id = workflow_class.get_workflow_id()
-        class_name = workflow_id.split(".")[-1]
-
-        # Create the op decorator
-        op_decorator = op(
-            name=f"{name_prefix}{class_name}".lower(),
-            required_resource_keys=set(required_resource_keys or []),
-            out={"result": Out(dict[str, Any])},
+        # Get the class name part of the workflow ID
+        workflow_id, class_name, _ = _workflow_meta(workflow_class)
+        op_name = f"{name_prefix}{class_name}".lower()
+        resource_keys = frozenset(required_resource_keys or [])
+
+        config_key = _config_key(config)
+        key = None if config_key is None else ("op", workflow_id, config_key, op_name, resource_keys)
+        return self._cached_definition(
+            key, workflow_class, functools.partial(self._build_op, workflow_class, op_name, config, resource_keys)
         )
 
-        # Define the op function
-        @op_decorator
-        def workflow_op(context: OpExecutionContext) -> dict[str, Any]:
-            """Execute the workflow as a Dagster op.
-
-            Args:
-                context: Dagster op execution context
-
-            Returns:
-                Workflow execution results
-            """
-            # Configure logging
-            _setup_loguru_dagster_bridge(context.log)
-
-            # Create and configure workflow instance
-            workflow = workflow_class(config or {})
-
-            # Create workflow context
-            workflow_context = WorkflowContext(workflow_id=workflow_id)
-
-            # Add Dagster context and resources
-            workflow_context.update_data(
-                {
-                    "dagster_context": context,
-                    "dagster_resources": context.resources,
-                }
-            )
+    def _build_op(
+        self,
+        workflow_class: type[WorkflowBase],
+        op_name: str,
+        config: dict[str, Any] | None,
+        required_resource_keys: frozenset[str],
+    ) -> Callable:
+        """Create the Dagster op that executes a workflow.
 
-            try:
-                # Execute the workflow
-                logger.info(f"Executing workflow as Dagster op: {workflow_id}")
-                result_context = workflow.execute()
+        Args:
+            workflow_class: The workflow class to execute
+            op_name: Name of the op
+            config: Configuration for the workflow
+            required_resource_keys: Keys for required Dagster resources
 
-                # Return results
-                return result_context.data
+        Returns:
+            A Dagster op function
+        """
+        workflow_id, _, _ = _workflow_meta(workflow_class)
 
-            except Exception as e:
-                logger.error(f"Workflow op execution failed: {str(e)}")
-                context.log.error(str(e))
-                raise WorkflowError(f"Error executing workflow as Dagster op: {str(e)}") from e
+        @op(
+            name=op_name,
+            required_resource_keys=set(required_resource_keys),
+            out={"result": Out(dict[str, Any])},
+        )
+        def workflow_op(context: OpExecutionContext) -> dict[str, Any]:
+            """Execute the workflow as a Dagster op."""
+            data = {"dagster_context": context, "dagster_resources": context.resources}
+            return _execute_workflow(workflow_class, config, workflow_id, context, data, "op")
 
         return workflow_op
 
@@ -282,8 +472,7 @@ class DagsterWorkflowAdapter:
 
         # Convert each workflow to an asset
         for workflow_class in workflows:
-            # Get workflow ID
-            workflow_id = workflow_class.get_workflow_id()
+            workflow_id, class_name, module_domain = _workflow_meta(workflow_class)
 
             # Get config from factory if provided
             config = None
@@ -291,47 +480,58 @@ class DagsterWorkflowAdapter:
                 config = config_factory(workflow_class)
 
             # Get domain for grouping
-            workflow_domain = domain
-            if group_by_domain and not workflow_domain:
-                # Extract domain from module path
-                parts = workflow_id.split(".")
-                workflow_domain = parts[-2] if len(parts) > 2 else "default"
-
-            # Convert to asset
-            asset_fn = self.workflow_to_asset(
-                workflow_class,
-                config=config,
-                name_prefix=name_prefix,
-                group_name=workflow_domain if group_by_domain else None,
-            )
+            group_name = None
+            if group_by_domain:
+                group_name = domain or module_domain
 
-            # Store in assets dict
-            class_name = workflow_id.split(".")[-1]
+            # Convert to asset; the name is built once and used for the asset and the dict key
             asset_name = f"{name_prefix}{class_name}".lower()
-            assets[asset_name] = asset_fn
+            config_key = _config_key(config)
+            key = None if config_key is None else ("asset", workflow_id, config_key, (), asset_name, group_name)
+            assets[asset_name] = self._cached_definition(
+                key,
+                workflow_class,
+                functools.partial(self._build_asset, workflow_class, asset_name, config, (), group_name),
+            )
 
         return assets
 
 
+class DagsterLoggerHandler:
+    """Loguru sink that redirects logs to the Dagster logger of the current run."""
+
+    def write(self, message: str) -> None:
+        """Write a log message to Dagster.
+
+        Args:
+            message: Log message
+        """
+        dagster_logger = _current_dagster_logger.get()
+        if dagster_logger is not None:
+            dagster_logger.info(message.rstrip())
+
+
+# Dagster logger of the asset or op running in the current context
+_current_dagster_logger: ContextVar[DagsterLogManager | None] = ContextVar("dagster_logger", default=None)
+# Loguru handler id of the shared bridge sink, None until it is first added
+_dagster_bridge_handler_id: int | None = None
+_dagster_bridge_lock = threading.Lock()
+
+
 def _setup_loguru_dagster_bridge(dagster_logger: DagsterLogManager) -> None:
     """Set up bridge from loguru to Dagster logging.
 
     Args:
         dagster_logger: Dagster logger to bridge to
     """
+    global _dagster_bridge_handler_id
 
-    class DagsterLoggerHandler:
-        """Handler that redirects loguru logs to Dagster."""
-
-        def write(self, message: str) -> None:
-            """Write a log message to Dagster.
-
-            Args:
-                message: Log message
-            """
-            dagster_logger.info(message.rstrip())
+    # Route this context's loguru records to its own Dagster logger
+    _current_dagster_logger.set(dagster_logger)
 
-    # Only add the Dagster handler if it's not already present
-    # This preserves existing sinks and prevents duplicate handlers
-    if not any(isinstance(handler.sink, DagsterLoggerHandler) for handler in logger._core.handlers.values()):
-        logger.add(DagsterLoggerHandler(), format="{message}")
+    # A single shared sink is added once; this preserves existing sinks and prevents
+    # a new handler from piling up on every asset or op execution. The sink is added
+    # again if it has since been removed, e.g. by setup_logger() reconfiguring loguru
+    with _dagster_bridge_lock:
+        if _dagster_bridge_handler_id not in logger._core.handlers:
+            _dagster_bridge_handler_id = logger.add(DagsterLoggerHandler(), format="{message}")
@@ -10,8 +10,9 @@ import importlib.util
 import os
 import sys
 import threading
-import time
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Iterator
+from typing import Any
 
 from loguru import logger
 from watchdog.events import FileSystemEvent, FileSystemEventHandler
@@ -20,6 +21,27 @@ from watchdog.observers import Observer
 from data_warehouse.core.exceptions import WorkflowDiscoveryError
 from data_warehouse.workflow.base import WorkflowBase, WorkflowRegistry
 
+# Name prefixes of hidden and internal files and directories that are never scanned
+_SKIP_PREFIXES = ("_", ".")
+
+
+def _iter_workflow_subclasses() -> Iterator[type[WorkflowBase]]:
+    """Yield every direct and indirect subclass of WorkflowBase once.
+
+    Yields:
+        Workflow classes currently alive in the process
+    """
+    seen: set[type[WorkflowBase]] = set()
+    stack = WorkflowBase.__subclasses__()
+    while stack:
+        workflow_class = stack.pop()
+        # Classes with several workflow bases are reachable along more than one path
+        if workflow_class in seen:
+            continue
+        seen.add(workflow_class)
+        yield workflow_class
+        stack.extend(workflow_class.__subclasses__())
+
 
 class WorkflowDiscovery:
     """Workflow discovery system that finds and registers workflows."""
@@ -32,7 +54,8 @@ class WorkflowDiscovery:
                      the singleton registry will be used.
         """
         self.registry = registry or WorkflowRegistry()
-        self.discovered_modules: dict[str, float] = {}  # module path -> timestamp
+        self.discovered_modules: dict[str, int] = {}  # module path -> mtime in nanoseconds
+        self._package_fs_paths: dict[str, str] = {}  # package path -> directory
         self.observer: Observer | None = None
         self.watching = False
         self._lock = threading.RLock()
@@ -50,43 +73,29 @@ class WorkflowDiscovery:
             WorkflowDiscoveryError: If discovery fails
         """
         try:
-            # Import the package
+            # Get the filesystem path of the package
             logger.info(f"Discovering workflows in package: {package_path}")
-            package = importlib.import_module(package_path)
-
-            # Get the filesystem path
-            if not hasattr(package, "__path__"):
-                raise WorkflowDiscoveryError(f"Invalid package: {package_path}")
-
-            fs_path = package.__path__[0]
+            fs_path = self._resolve_fs_path(package_path)
             discovered = []
 
             # Walk the directory tree
-            for root, dirs, files in os.walk(fs_path):
-                # Skip hidden directories and _templates, _common
-                dirs[:] = [d for d in dirs if not d.startswith("_") and not d.startswith(".")]
-
-                # Process Python files
-                for file in files:
-                    if file.endswith(".py") and not file.startswith("_"):
-                        file_path = os.path.join(root, file)
-                        rel_path = os.path.relpath(file_path, fs_path)
-                        module_path = f"{package_path}.{os.path.splitext(rel_path)[0].replace(os.path.sep, '.')}"
-
-                        # Skip if already processed and file hasn't changed
-                        file_timestamp = os.path.getmtime(file_path)
-                        if (
-                            module_path in self.discovered_modules
-                            and self.discovered_modules[module_path] >= file_timestamp
-                        ):
-                            continue
-
-                        # Import module and find workflow classes
-                        found_workflows = self._import_module_workflows(module_path, file_path)
-                        discovered.extend(found_workflows)
-
-                        # Update timestamp
-                        self.discovered_modules[module_path] = file_timestamp
+            for module_path, file_path, file_timestamp in self._iter_module_files(fs_path, package_path):
+                # Skip if already processed and file hasn't changed
+                if self.discovered_modules.get(module_path, -1) >= file_timestamp:
+                    continue
+
+                # Import module and find workflow classes
+                # Modules seen before have changed on disk and must be re-executed; new
+                # ones may already be imported elsewhere and can be used as they are
+                changed = module_path in self.discovered_modules
+                found_workflows = self._import_module_workflows(module_path, file_path, reload=changed)
+                if found_workflows is None:
+                    # Leave the timestamp alone so the module is retried on the next scan
+                    continue
+                discovered.extend(found_workflows)
+
+                # Update timestamp
+                self.discovered_modules[module_path] = file_timestamp
 
             logger.info(f"Discovered {len(discovered)} workflows in {package_path}")
             return discovered
@@ -95,21 +104,89 @@ class WorkflowDiscovery:
             logger.error(f"Error discovering workflows: {str(e)}")
             raise WorkflowDiscoveryError(f"Error discovering workflows: {str(e)}") from e
 
-    def _import_module_workflows(self, module_path: str, file_path: str) -> list[type[WorkflowBase]]:
+    def _resolve_fs_path(self, package_path: str) -> str:
+        """Get the filesystem directory of a package, locating it on first use.
+
+        The package is only looked up through its module spec, so its code is not run.
+
+        Args:
+            package_path: Import path of the package
+
+        Returns:
+            Filesystem path of the package directory
+
+        Raises:
+            WorkflowDiscoveryError: If the import path is not a package
+        """
+        fs_path = self._package_fs_paths.get(package_path)
+        if fs_path is None:
+            try:
+                spec = importlib.util.find_spec(package_path)
+            except ModuleNotFoundError as e:
+                raise WorkflowDiscoveryError(f"Package not found: {package_path}") from e
+            if spec is None:
+                raise WorkflowDiscoveryError(f"Package not found: {package_path}")
+            if not spec.submodule_search_locations:
+                raise WorkflowDiscoveryError(f"Invalid package: {package_path}")
+            fs_path = self._package_fs_paths[package_path] = spec.submodule_search_locations[0]
+        return fs_path
+
+    def _iter_module_files(self, dir_path: str, module_prefix: str) -> Iterator[tuple[str, str, int]]:
+        """Yield the public Python modules below a directory.
+
+        Uses a single ``os.scandir`` pass per directory, walking the tree breadth-first
+        from an explicit queue; file and directory checks come from the cached entry
+        type and each file is stat'ed once for its mtime. Like ``os.walk``, symlinked
+        directories are not followed and unreadable or vanished directories are skipped.
+
+        Args:
+            dir_path: Filesystem directory to scan
+            module_prefix: Import path corresponding to ``dir_path``
+
+        Yields:
+            Tuples of (module import path, file path, modification time in nanoseconds)
+        """
+        pending = deque([(dir_path, module_prefix)])
+        while pending:
+            current_dir, current_prefix = pending.popleft()
+            try:
+                scanner = os.scandir(current_dir)
+            except OSError:
+                # Removed since it was queued (e.g. an editor's temporary directory)
+                continue
+
+            with scanner as entries:
+                for entry in entries:
+                    # Skip hidden and internal entries (_templates, _common, __init__.py)
+                    if entry.name.startswith(_SKIP_PREFIXES):
+                        continue
+
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append((entry.path, f"{current_prefix}.{entry.name}"))
+                    elif entry.name.endswith(".py") and entry.is_file():
+                        yield f"{current_prefix}.{entry.name[:-3]}", entry.path, entry.stat().st_mtime_ns
+
+    def _import_module_workflows(
+        self, module_path: str, file_path: str, reload: bool = False
+    ) -> list[type[WorkflowBase]] | None:
         """Import a module and register any workflow classes.
 
         Args:
             module_path: Import path of the module
             file_path: Filesystem path of the module
+            reload: Whether to re-execute the module if it is already loaded
 
         Returns:
-            List of workflow classes found in the module
+            List of workflow classes found in the module, or None if it failed to import
         """
         try:
             # Import the module
             try:
-                # Reload if already loaded
-                if module_path in sys.modules:
+                # Reload if already loaded and changed. Reloading re-executes the module in
+                # its existing namespace, so remember what was there to spot stale classes.
+                previous: dict[str, Any] = {}
+                if reload and module_path in sys.modules:
+                    previous = dict(vars(sys.modules[module_path]))
                     module = importlib.reload(sys.modules[module_path])
                 else:
                     module = importlib.import_module(module_path)
@@ -125,34 +202,40 @@ class WorkflowDiscovery:
                 sys.modules[module_path] = module
                 spec.loader.exec_module(module)
 
-            # Find workflow classes
-            discovered = []
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
-
-                # Check if it's a WorkflowBase subclass
-                if (
-                    isinstance(attr, type)
-                    and issubclass(attr, WorkflowBase)
-                    and attr != WorkflowBase
-                    and attr.__module__ == module.__name__
-                ):
-                    # Extract domain from module path
-                    parts = module_path.split(".")
-                    domain = parts[-2] if len(parts) > 2 else "default"
-
-                    # Register the workflow
-                    with self._lock:
-                        self.registry.register(attr, domain=domain)
-
-                    discovered.append(attr)
-                    logger.debug(f"Registered workflow: {attr.__name__} from {module_path}")
-
-            return discovered
+            # Extract domain from module path
+            parts = module_path.split(".")
+            domain = parts[-2] if len(parts) > 2 else "default"
+
+            # Find workflow classes defined in this module. WorkflowBase already tracks
+            # its subclasses, so there is no need to inspect every module attribute.
+            # The namespace checks drop stale classes left behind by earlier reloads, and
+            # classes deleted from the file, which a reload leaves in the namespace as is.
+            namespace = vars(module)
+            discovered = [
+                workflow_class
+                for workflow_class in _iter_workflow_subclasses()
+                if workflow_class.__module__ == module.__name__
+                and namespace.get(workflow_class.__name__) is workflow_class
+                and previous.get(workflow_class.__name__) is not workflow_class
+            ]
 
         except Exception as e:
+            # A module that fails to import keeps its previous registrations
             logger.error(f"Error importing module {module_path}: {str(e)}")
-            return []
+            return None
+
+        with self._lock:
+            # Only once the module imported cleanly, drop its old registrations so
+            # workflows deleted from the file do not linger in the registry
+            if reload:
+                self.registry.unregister_module(module_path)
+
+            # Register the workflows
+            for workflow_class in discovered:
+                self.registry.register(workflow_class, domain=domain)
+                logger.debug(f"Registered workflow: {workflow_class.__name__} from {module_path}")
+
+        return discovered
 
     def start_watching(self, package_paths: list[str], reload_callback: Callable[[], None] | None = None) -> None:
         """Start watching directories for changes and hot-reload workflows.
@@ -173,11 +256,8 @@ class WorkflowDiscovery:
             watched_dirs: set[str] = set()
             for package_path in package_paths:
                 try:
-                    package = importlib.import_module(package_path)
-                    if hasattr(package, "__path__"):
-                        fs_path = package.__path__[0]
-                        watched_dirs.add(fs_path)
-                        self.discover_workflows(package_path)
+                    watched_dirs.add(self._resolve_fs_path(package_path))
+                    self.discover_workflows(package_path)
                 except Exception as e:
                     logger.error(f"Error in initial discovery of {package_path}: {str(e)}")
 
@@ -246,8 +326,9 @@ class WorkflowFileHandler(FileSystemEventHandler):
         self.discovery = discovery
         self.package_paths = package_paths
         self.reload_callback = reload_callback
-        self.last_reload_time = 0
-        self.cooldown_period = 2.0  # seconds
+        self.cooldown_period = 0.5  # seconds without events before reloading
+        self._pending_timer: threading.Timer | None = None
+        self._timer_lock = threading.Lock()
 
     def on_modified(self, event: FileSystemEvent) -> None:
         """Handle file modification events.
@@ -276,38 +357,29 @@ class WorkflowFileHandler(FileSystemEventHandler):
         Returns:
             True if the event should be processed, False otherwise
         """
-        # Ignore directory events
-        if event.is_directory:
-            return False
-
-        # Check if it's a Python file
+        # Only non-directory events for public Python modules (not hidden or internal files)
         path = event.src_path
-        if not isinstance(path, str) or not path.endswith(".py"):
-            return False
-
-        # Ignore hidden files and internal modules
-        filename = os.path.basename(path)
-        if not isinstance(filename, str):
-            return False
-
-        if filename.startswith("_") or filename.startswith("."):
-            return False
-
-        return True
+        return (
+            not event.is_directory
+            and isinstance(path, str)
+            and path.endswith(".py")
+            and not os.path.basename(path).startswith(_SKIP_PREFIXES)
+        )
 
     def _debounced_reload(self) -> None:
-        """Reload workflows with debouncing to prevent rapid multiple reloads."""
-        current_time = time.time()
+        """Reload workflows with debouncing to prevent rapid multiple reloads.
 
-        # Check if we're in the cooldown period
-        if current_time - self.last_reload_time < self.cooldown_period:
-            return
-
-        # Update timestamp and reload
-        self.last_reload_time = current_time
-
-        # Run in a separate thread to not block the file watcher
-        threading.Timer(0.5, self._reload_workflows).start()
+        Each event restarts the cooldown, so a burst of saves triggers a single reload
+        once the files have been quiet for ``cooldown_period`` seconds.
+        """
+        with self._timer_lock:
+            if self._pending_timer is not None:
+                self._pending_timer.cancel()
+
+            # Run in a separate thread to not block the file watcher
+            self._pending_timer = threading.Timer(self.cooldown_period, self._reload_workflows)
+            self._pending_timer.daemon = True
+            self._pending_timer.start()
 
     def _reload_workflows(self) -> None:
         """Reload workflows from all watched packages."""
@@ -4,14 +4,72 @@ GitHub Data Loading Module.
 This module provides classes for loading transformed GitHub data into storage systems.
 """
 
+import json
+import os
+from datetime import datetime
+from types import MappingProxyType
 from typing import Any
 
+import pyarrow as pa
 from loguru import logger
+from pyarrow import parquet as pq
 
 from data_warehouse.core.exceptions import LoaderError
 from data_warehouse.workflow.base import WorkflowContext
 from data_warehouse.workflow.etl import LoaderBase
 
+try:
+    import orjson
+except ImportError:  # Optional dependency, install with the "json" extra
+    orjson = None
+
+# Table and file names for GitHub API endpoints; other endpoints use their own name
+_ENDPOINT_NAMES = MappingProxyType(
+    {
+        "issues": "issues",
+        "pulls": "pull_requests",
+        "releases": "releases",
+        "commits": "commits",
+        "repositories": "repositories",
+        "users": "users",
+        "teams": "teams",
+        "projects": "projects",
+    }
+)
+
+
+def _json_default(value: Any) -> str:
+    """Serialize values the standard library json module does not support.
+
+    Args:
+        value: Value to serialize
+
+    Returns:
+        ISO 8601 string for datetimes, matching orjson's output
+
+    Raises:
+        TypeError: If the value cannot be serialized
+    """
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _dump_json(data: list[dict[str, Any]]) -> bytes:
+    """Encode records as a UTF-8 JSON array.
+
+    Uses orjson when it is installed, which encodes straight to bytes in native code.
+
+    Args:
+        data: Records to encode
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, default=_json_default, separators=(",", ":")).encode()
+
 
 class GitHubDatabaseLoader(LoaderBase[list[dict[str, Any]]]):
     """Loader for GitHub data into a database."""
@@ -51,8 +109,6 @@ class GitHubDatabaseLoader(LoaderBase[list[dict[str, Any]]]):
         try:
             # This is a placeholder implementation
             # In a real implementation, this would connect to a database and insert the records
-            logger.info(f"Would insert {len(data)} records into {target_table}")
-
             # Simulate database operations for demonstration purposes
             records_loaded = len(data)
 
@@ -76,20 +132,8 @@ class GitHubDatabaseLoader(LoaderBase[list[dict[str, Any]]]):
         """
         table_prefix = "github"
 
-        # Map endpoints to table names
-        endpoint_table_map = {
-            "issues": "issues",
-            "pulls": "pull_requests",
-            "releases": "releases",
-            "commits": "commits",
-            "repositories": "repositories",
-            "users": "users",
-            "teams": "teams",
-            "projects": "projects",
-        }
-
         # Get the table name for the endpoint, defaulting to the endpoint name
-        table_name = endpoint_table_map.get(endpoint, endpoint)
+        table_name = _ENDPOINT_NAMES.get(endpoint, endpoint)
 
         return f"{table_prefix}_{table_name}"
 
@@ -121,7 +165,9 @@ class GitHubDatabaseLoader(LoaderBase[list[dict[str, Any]]]):
 
 
 class GitHubFileLoader(LoaderBase[list[dict[str, Any]]]):
-    """Loader for GitHub data into files."""
+    """Loader for GitHub data into JSON files."""
+
+    FILE_EXTENSION = ".json"
 
     def load(self, data: list[dict[str, Any]], context: WorkflowContext) -> int:
         """Load GitHub data into files.
@@ -147,11 +193,9 @@ class GitHubFileLoader(LoaderBase[list[dict[str, Any]]]):
         logger.info(f"Writing {len(data)} records to file '{file_path}'")
 
         try:
-            # This is a placeholder implementation
-            # In a real implementation, this would write the data to a file
-            logger.info(f"Would write {len(data)} records to {file_path}")
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            self._write(data, file_path)
 
-            # Simulate file writing for demonstration purposes
             records_written = len(data)
 
             logger.info(f"Successfully wrote {records_written} records to {file_path}")
@@ -162,6 +206,17 @@ class GitHubFileLoader(LoaderBase[list[dict[str, Any]]]):
             logger.error(error_msg)
             raise LoaderError(error_msg) from e
 
+    def _write(self, data: list[dict[str, Any]], file_path: str) -> None:
+        """Write records to a file.
+
+        Args:
+            data: The records to write
+            file_path: Path of the output file
+        """
+        # Encode once to bytes and write them in a single call, skipping the text layer
+        with open(file_path, "wb") as f:
+            f.write(_dump_json(data))
+
     def _get_file_path(self, entity_type: str, endpoint: str) -> str:
         """Get the file path based on entity type and endpoint.
 
@@ -172,19 +227,51 @@ class GitHubFileLoader(LoaderBase[list[dict[str, Any]]]):
         Returns:
             The file path
         """
-        # Map endpoints to file names
-        endpoint_file_map = {
-            "issues": "issues",
-            "pulls": "pull_requests",
-            "releases": "releases",
-            "commits": "commits",
-            "repositories": "repositories",
-            "users": "users",
-            "teams": "teams",
-            "projects": "projects",
-        }
-
         # Get the file name for the endpoint, defaulting to the endpoint name
-        file_name = endpoint_file_map.get(endpoint, endpoint)
+        file_name = _ENDPOINT_NAMES.get(endpoint, endpoint)
+
+        return f"data/github/{entity_type}/{file_name}{self.FILE_EXTENSION}"
 
-        return f"data/github/{entity_type}/{file_name}.json"
+
+class GitHubParquetLoader(GitHubFileLoader):
+    """Loader for GitHub data into zstd-compressed Parquet files.
+
+    Parquet keeps the records columnar and typed (timestamps stay timestamps), so
+    analytical readers can load single columns without parsing JSON.
+    """
+
+    FILE_EXTENSION = ".parquet"
+
+    def _write(self, data: list[dict[str, Any]], file_path: str) -> None:
+        """Write records to a Parquet file.
+
+        Args:
+            data: The records to write
+            file_path: Path of the output file
+        """
+        # Build each column from every record: from_pylist takes the schema from the first
+        # record alone, dropping keys it lacks and failing on values of another type
+        names = list(dict.fromkeys(key for record in data for key in record))
+        columns = []
+        for name in names:
+            values = [record.get(name) for record in data]
+            try:
+                column = pa.array(values)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                # Columns of mixed types (e.g. an ID that is sometimes a string) are stored as
+                # text, with non-string values JSON-encoded
+                column = pa.array(
+                    [
+                        value if value is None or isinstance(value, str) else json.dumps(value, default=_json_default)
+                        for value in values
+                    ],
+                    type=pa.string(),
+                )
+
+            # Parquet cannot store structs without fields, e.g. commit stats that are always {}
+            if pa.types.is_struct(column.type) and column.type.num_fields == 0:
+                column = pa.nulls(len(values))
+            columns.append(column)
+        table = pa.Table.from_arrays(columns, names=names)
+
+        pq.write_table(table, file_path, compression="zstd", row_group_size=64 * 1024)
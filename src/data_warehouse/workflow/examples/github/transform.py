@@ -4,6 +4,8 @@ GitHub Data Transformation Module.
 This module provides classes for transforming GitHub API data.
 """
 
+import functools
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any
 
@@ -14,9 +16,48 @@ from data_warehouse.workflow.base import WorkflowContext
 from data_warehouse.workflow.etl import TransformerBase
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_github_date(date_str: str | None) -> datetime | None:
+    """Parse GitHub ISO 8601 date string to datetime.
+
+    Results are cached, as records in one response often share timestamps.
+
+    Args:
+        date_str: The date string to parse
+
+    Returns:
+        Parsed datetime or None if parsing fails
+    """
+    if not date_str:
+        return None
+
+    try:
+        # fromisoformat accepts the trailing "Z" on Python 3.11+
+        return datetime.fromisoformat(date_str)
+    except ValueError:
+        logger.warning(f"Failed to parse date: {date_str}")
+        return None
+
+
 class GitHubTransformer(TransformerBase[list[dict[str, Any]], list[dict[str, Any]]]):
     """Transformer for GitHub API data."""
 
+    def __init__(self, config: dict[str, Any] | None = None) -> None:
+        """Initialize the GitHub transformer.
+
+        Args:
+            config: Configuration dictionary
+        """
+        super().__init__(config)
+        # Endpoint-specific transformations; other endpoints use _transform_generic
+        self._dispatch: dict[str, Callable[[list[dict[str, Any]]], list[dict[str, Any]]]] = {
+            "issues": self._transform_issues,
+            "pulls": self._transform_pull_requests,
+            "commits": self._transform_commits,
+            "repositories": self._transform_repos,
+            "users": self._transform_users,
+        }
+
     def transform(self, data: list[dict[str, Any]], context: WorkflowContext) -> list[dict[str, Any]]:
         """Transform GitHub API data.
 
@@ -33,26 +74,13 @@ class GitHubTransformer(TransformerBase[list[dict[str, Any]], list[dict[str, Any
         if not data:
             return []
 
-        context.config.get("entity_type", "repo")
         endpoint = context.config.get("endpoint", "issues")
 
         logger.info(f"Transforming {len(data)} GitHub {endpoint} items")
 
         try:
             # Select appropriate transformation method based on endpoint
-            if endpoint == "issues":
-                return self._transform_issues(data)
-            elif endpoint == "pulls":
-                return self._transform_pull_requests(data)
-            elif endpoint == "commits":
-                return self._transform_commits(data)
-            elif endpoint == "repositories":
-                return self._transform_repos(data)
-            elif endpoint == "users":
-                return self._transform_users(data)
-            else:
-                # Default transformation for other endpoints
-                return self._transform_generic(data)
+            return self._dispatch.get(endpoint, self._transform_generic)(data)
 
         except Exception as e:
             logger.error(f"Failed to transform GitHub data: {str(e)}")
@@ -70,25 +98,14 @@ class GitHubTransformer(TransformerBase[list[dict[str, Any]], list[dict[str, Any
         transformed = []
 
         for item in data:
-            # Apply generic transformations
-            transformed_item = {}
-
-            # Copy essential ID and metadata fields
-            if "id" in item:
-                transformed_item["id"] = item["id"]
+            # Copy all fields in one C-level pass, then add the renamed URL and parse dates
+            transformed_item = dict(item)
             if "url" in item:
                 transformed_item["api_url"] = item["url"]
-            if "html_url" in item:
-                transformed_item["html_url"] = item["html_url"]
             if "created_at" in item:
-                transformed_item["created_at"] = self._parse_github_date(item["created_at"])
+                transformed_item["created_at"] = _parse_github_date(item["created_at"])
             if "updated_at" in item:
-                transformed_item["updated_at"] = self._parse_github_date(item["updated_at"])
-
-            # Copy the rest of the fields
-            for key, value in item.items():
-                if key not in transformed_item:
-                    transformed_item[key] = value
+                transformed_item["updated_at"] = _parse_github_date(item["updated_at"])
 
             transformed.append(transformed_item)
 
@@ -103,19 +120,17 @@ class GitHubTransformer(TransformerBase[list[dict[str, Any]], list[dict[str, Any
         Returns:
             Transformed issues data
         """
-        transformed = []
-
-        for issue in data:
-            transformed_issue = {
+        return [
+            {
                 "id": issue["id"],
                 "issue_number": issue["number"],
                 "title": issue["title"],
                 "state": issue["state"],
                 "api_url": issue["url"],
                 "html_url": issue["html_url"],
-                "created_at": self._parse_github_date(issue["created_at"]),
-                "updated_at": self._parse_github_date(issue["updated_at"]),
-                "closed_at": self._parse_github_date(issue["closed_at"]) if issue.get("closed_at") else None,
+                "created_at": _parse_github_date(issue["created_at"]),
+                "updated_at": _parse_github_date(issue["updated_at"]),
+                "closed_at": _parse_github_date(issue["closed_at"]) if issue.get("closed_at") else None,
                 "body": issue.get("body", ""),
                 "comments_count": issue.get("comments", 0),
                 "is_pull_request": "pull_request" in issue,
@@ -124,10 +139,8 @@ class GitHubTransformer(TransformerBase[list[dict[str, Any]], list[dict[str, Any
                 "milestone": issue["milestone"]["title"] if issue.get("milestone") else None,
                 "author": issue["user"]["login"] if issue.get("user") else None,
             }
-
-            transformed.append(transformed_issue)
-
-        return transformed
+            for issue in data
+        ]
 
     def _transform_pull_requests(self, data: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """Transform GitHub pull requests data.
@@ -138,20 +151,18 @@ class GitHubTransformer(TransformerBase[list[dict[str, Any]], list[dict[str, Any
         Returns:
             Transformed pull requests data
         """
-        transformed = []
-
-        for pr in data:
-            transformed_pr = {
+        return [
+            {
                 "id": pr["id"],
                 "pr_number": pr["number"],
                 "title": pr["title"],
                 "state": pr["state"],
                 "api_url": pr["url"],
                 "html_url": pr["html_url"],
-                "created_at": self._parse_github_date(pr["created_at"]),
-                "updated_at": self._parse_github_date(pr["updated_at"]),
-                "closed_at": self._parse_github_date(pr["closed_at"]) if pr.get("closed_at") else None,
-                "merged_at": self._parse_github_date(pr["merged_at"]) if pr.get("merged_at") else None,
+                "created_at": _parse_github_date(pr["created_at"]),
+                "updated_at": _parse_github_date(pr["updated_at"]),
+                "closed_at": _parse_github_date(pr["closed_at"]) if pr.get("closed_at") else None,
+                "merged_at": _parse_github_date(pr["merged_at"]) if pr.get("merged_at") else None,
                 "body": pr.get("body", ""),
                 "comments_count": pr.get("comments", 0),
                 "review_comments_count": pr.get("review_comments", 0),
@@ -164,10 +175,8 @@ class GitHubTransformer(TransformerBase[list[dict[str, Any]], list[dict[str, Any
                 "base_branch": pr.get("base", {}).get("ref"),
                 "head_branch": pr.get("head", {}).get("ref"),
             }
-
-            transformed.append(transformed_pr)
-
-        return transformed
+            for pr in data
+        ]
 
     def _transform_commits(self, data: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """Transform GitHub commits data.
@@ -190,7 +199,7 @@ class GitHubTransformer(TransformerBase[list[dict[str, Any]], list[dict[str, Any
                 if "author" in commit["commit"]:
                     author_name = commit["commit"]["author"].get("name")
                     author_email = commit["commit"]["author"].get("email")
-                    author_date = self._parse_github_date(commit["commit"]["author"].get("date"))
+                    author_date = _parse_github_date(commit["commit"]["author"].get("date"))
 
             # Extract committer information
             committer_name = None
@@ -201,7 +210,7 @@ class GitHubTransformer(TransformerBase[list[dict[str, Any]], list[dict[str, Any
                 if "committer" in commit["commit"]:
                     committer_name = commit["commit"]["committer"].get("name")
                     committer_email = commit["commit"]["committer"].get("email")
-                    committer_date = self._parse_github_date(commit["commit"]["committer"].get("date"))
+                    committer_date = _parse_github_date(commit["commit"]["committer"].get("date"))
 
             transformed_commit = {
                 "sha": commit["sha"],
@@ -233,19 +242,17 @@ class GitHubTransformer(TransformerBase[list[dict[str, Any]], list[dict[str, Any
         Returns:
             Transformed repositories data
         """
-        transformed = []
-
-        for repo in data:
-            transformed_repo = {
+        return [
+            {
                 "id": repo["id"],
                 "name": repo["name"],
                 "full_name": repo["full_name"],
                 "api_url": repo["url"],
                 "html_url": repo["html_url"],
                 "description": repo.get("description", ""),
-                "created_at": self._parse_github_date(repo["created_at"]),
-                "updated_at": self._parse_github_date(repo["updated_at"]),
-                "pushed_at": self._parse_github_date(repo["pushed_at"]) if repo.get("pushed_at") else None,
+                "created_at": _parse_github_date(repo["created_at"]),
+                "updated_at": _parse_github_date(repo["updated_at"]),
+                "pushed_at": _parse_github_date(repo["pushed_at"]) if repo.get("pushed_at") else None,
                 "homepage": repo.get("homepage"),
                 "language": repo.get("language"),
                 "fork": repo.get("fork", False),
@@ -260,10 +267,8 @@ class GitHubTransformer(TransformerBase[list[dict[str, Any]], list[dict[str, Any
                 "is_archived": repo.get("archived", False),
                 "is_disabled": repo.get("disabled", False),
             }
-
-            transformed.append(transformed_repo)
-
-        return transformed
+            for repo in data
+        ]
 
     def _transform_users(self, data: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """Transform GitHub users data.
@@ -274,10 +279,8 @@ class GitHubTransformer(TransformerBase[list[dict[str, Any]], list[dict[str, Any
         Returns:
             Transformed users data
         """
-        transformed = []
-
-        for user in data:
-            transformed_user = {
+        return [
+            {
                 "id": user["id"],
                 "login": user["login"],
                 "api_url": user["url"],
@@ -294,30 +297,9 @@ class GitHubTransformer(TransformerBase[list[dict[str, Any]], list[dict[str, Any
                 "public_gists": user.get("public_gists", 0),
                 "followers": user.get("followers", 0),
                 "following": user.get("following", 0),
-                "created_at": self._parse_github_date(user["created_at"]) if "created_at" in user else None,
-                "updated_at": self._parse_github_date(user["updated_at"]) if "updated_at" in user else None,
+                "created_at": _parse_github_date(user["created_at"]) if "created_at" in user else None,
+                "updated_at": _parse_github_date(user["updated_at"]) if "updated_at" in user else None,
                 "is_site_admin": user.get("site_admin", False),
             }
-
-            transformed.append(transformed_user)
-
-        return transformed
-
-    @staticmethod
-    def _parse_github_date(date_str: str | None) -> datetime | None:
-        """Parse GitHub ISO 8601 date string to datetime.
-
-        Args:
-            date_str: The date string to parse
-
-        Returns:
-            Parsed datetime or None if parsing fails
-        """
-        if not date_str:
-            return None
-
-        try:
-            return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-        except ValueError:
-            logger.warning(f"Failed to parse date: {date_str}")
-            return None
+            for user in data
+        ]
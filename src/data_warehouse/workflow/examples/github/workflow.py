@@ -5,15 +5,44 @@ This module provides a comprehensive workflow for GitHub data extraction,
 transformation, and loading.
 """
 
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any
 
 from loguru import logger
 
-from data_warehouse.workflow.base import WorkflowBase, WorkflowContext
+from data_warehouse.core.exceptions import WorkflowError
+from data_warehouse.workflow.base import WorkflowBase, WorkflowContext, WorkflowStatus
+from data_warehouse.workflow.etl import ExtractorConfig
 from data_warehouse.workflow.examples.github.extraction import GitHubExtractor
-from data_warehouse.workflow.examples.github.load import GitHubDatabaseLoader, GitHubFileLoader
+from data_warehouse.workflow.examples.github.load import GitHubDatabaseLoader, GitHubFileLoader, GitHubParquetLoader
 from data_warehouse.workflow.examples.github.transform import GitHubTransformer
 
+# Config keys read by the extractor; workflows that agree on them share one extractor,
+# and with it one HTTP session, URL cache and rate limit
+_EXTRACTOR_CONFIG_KEYS = (*ExtractorConfig.model_fields, "cache_dir")
+_shared_extractors: dict[str, GitHubExtractor] = {}
+_shared_extractors_lock = threading.Lock()
+
+
+def _shared_extractor(config: dict[str, Any] | None) -> GitHubExtractor:
+    """Get the extractor shared by workflows with the same connection settings.
+
+    Args:
+        config: Configuration dictionary
+
+    Returns:
+        GitHub extractor for the configuration
+    """
+    config = config or {}
+    key = json.dumps({k: config[k] for k in _EXTRACTOR_CONFIG_KEYS if k in config}, sort_keys=True, default=str)
+    with _shared_extractors_lock:
+        extractor = _shared_extractors.get(key)
+        if extractor is None:
+            extractor = _shared_extractors[key] = GitHubExtractor(config)
+    return extractor
+
 
 class GitHubWorkflow(WorkflowBase):
     """Workflow for processing GitHub data.
@@ -39,13 +68,15 @@ class GitHubWorkflow(WorkflowBase):
             self.config["endpoint"] = "issues"
 
         # Initialize ETL components
-        self.extractor = GitHubExtractor(config)
+        self.extractor = _shared_extractor(config)
         self.transformer = GitHubTransformer(config)
 
         # Determine the loader type based on config
         loader_type = self.config.get("loader_type", "database")
         if loader_type == "file":
             self.loader = GitHubFileLoader(config)
+        elif loader_type == "parquet":
+            self.loader = GitHubParquetLoader(config)
         else:
             self.loader = GitHubDatabaseLoader(config)
 
@@ -54,6 +85,57 @@ class GitHubWorkflow(WorkflowBase):
             f"'{self.config['entity_name']}', endpoint '{self.config['endpoint']}'"
         )
 
+    @staticmethod
+    def reset_shared_extractors() -> None:
+        """Close and forget the extractors shared between GitHub workflows."""
+        with _shared_extractors_lock:
+            for extractor in _shared_extractors.values():
+                extractor.close()
+            _shared_extractors.clear()
+
+    def execute_endpoints(self, endpoints: list[str]) -> dict[str, WorkflowContext]:
+        """Run the workflow for several endpoints of the configured entity.
+
+        Extractions run concurrently on a thread pool, and each endpoint is transformed
+        and loaded as soon as its data arrives, so the network waits of the remaining
+        endpoints overlap with the processing of those already fetched.
+
+        Args:
+            endpoints: GitHub API endpoints to process
+
+        Returns:
+            Dictionary of endpoint names to their workflow contexts
+
+        Raises:
+            WorkflowError: If any endpoint fails
+        """
+        workflow_id = self.get_workflow_id()
+        contexts = {
+            endpoint: WorkflowContext(workflow_id=workflow_id, config={**self.config, "endpoint": endpoint})
+            for endpoint in endpoints
+        }
+        if not contexts:
+            return contexts
+
+        try:
+            self.status = WorkflowStatus.RUNNING
+            logger.info(f"Starting workflow: {workflow_id} for endpoints {', '.join(contexts)}")
+
+            max_workers = min(GitHubExtractor.MAX_CONCURRENT_REQUESTS, len(contexts))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(self.extract, context) for context in contexts.values()]
+                for future in as_completed(futures):
+                    self.load(self.transform(future.result()))
+
+            self.status = WorkflowStatus.COMPLETED
+            logger.info(f"Workflow completed: {workflow_id}")
+            return contexts
+
+        except Exception as e:
+            self.status = WorkflowStatus.FAILED
+            logger.error(f"Workflow failed: {workflow_id}, Error: {str(e)}")
+            raise WorkflowError(f"Error executing workflow: {str(e)}") from e
+
     def extract(self, context: WorkflowContext) -> WorkflowContext:
         """Extract data from the GitHub API.
 
@@ -65,10 +147,12 @@ class GitHubWorkflow(WorkflowBase):
         """
         logger.info("Starting GitHub data extraction")
 
-        # Copy configuration to context for use by the extractor
+        # Copy configuration to context for use by the extractor; settings already in the
+        # context (such as the endpoint of an execute_endpoints run) take precedence
         if not context.config:
             context.config = {}
-        context.config.update(self.config)
+        for key, value in self.config.items():
+            context.config.setdefault(key, value)
 
         # Extract data from GitHub API
         extracted_data = self.extractor.extract(context)
@@ -162,6 +246,6 @@ class GitHubWorkflow(WorkflowBase):
 
         # Validate loader configuration
         loader_type = self.config.get("loader_type", "database")
-        if loader_type not in ["database", "file"]:
+        if loader_type not in ["database", "file", "parquet"]:
             logger.warning(f"Invalid loader_type '{loader_type}'. Using 'database' as default.")
             self.config["loader_type"] = "database"
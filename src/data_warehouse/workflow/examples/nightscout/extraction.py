@@ -4,16 +4,48 @@ Nightscout Data Extraction Module.
 This module provides classes for extracting data from Nightscout API.
 """
 
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any
+from typing import Any, Self
 
 import requests
 from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from data_warehouse.core.exceptions import ExtractorError
 from data_warehouse.workflow.base import WorkflowContext
 from data_warehouse.workflow.etl import ExtractorBase
 
+try:
+    import orjson
+except ImportError:  # Optional dependency, install with the "json" extra
+    orjson = None
+
+
+def _parse_json(content: bytes) -> Any:
+    """Decode a Nightscout API response body.
+
+    Parses the raw bytes directly instead of going through ``response.json()``,
+    which first decodes the whole body into a ``str``. Uses orjson when it is
+    installed, which is several times faster than the standard library on large
+    CGM entry payloads.
+
+    Args:
+        content: Raw response body
+
+    Returns:
+        The decoded JSON document
+
+    Raises:
+        ValueError: If the body is not valid JSON
+    """
+    return orjson.loads(content) if orjson is not None else json.loads(content)
+
 
 class NightscoutExtractor(ExtractorBase[dict[str, Any]]):
     """Extractor for Nightscout API data."""
@@ -21,6 +53,15 @@ class NightscoutExtractor(ExtractorBase[dict[str, Any]]):
     # Default API limit for Nightscout record count
     DEFAULT_RECORD_LIMIT = 10000
 
+    # Maximum number of CGM entries requested per page
+    ENTRIES_PAGE_SIZE = 2000
+
+    # Fields read by NightscoutTransformer, requested as a server-side projection so
+    # large uploader blobs (raw, slope, intercept, ...) are not sent. Treatments are
+    # always fetched whole, as unknown treatment types keep every field.
+    _ENTRY_FIELDS = "_id,device,date,dateString,sgv,direction,type,filtered,unfiltered,rssi,noise,sysTime,utcOffset"
+    _DEVICESTATUS_FIELDS = "_id,created_at,device,pump,uploader,loop"
+
     def __init__(self, config: dict[str, Any] | None = None) -> None:
         """Initialize the Nightscout extractor.
 
@@ -38,6 +79,132 @@ class NightscoutExtractor(ExtractorBase[dict[str, Any]]):
             api_secret = self.config.credentials["api_secret"]
             self.headers["api-secret"] = api_secret
 
+        # Persistent session so requests to the Nightscout host reuse keep-alive
+        # connections and TLS sessions
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        retries = Retry(
+            total=self.config.retry_count,
+            backoff_factor=0.5,
+            status_forcelist=[429, 502, 503, 504],
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # ETag and raw body of slow-changing resources (profiles, status) by URL, used
+        # for conditional requests; persisted below the optional cache directory
+        self._etag_cache: dict[str, tuple[str, bytes]] = {}
+        self.cache_dir: str | None = (config or {}).get("cache_dir")
+
+    def close(self) -> None:
+        """Close the HTTP session and release its pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> Self:
+        """Use the extractor as a context manager that closes its session on exit."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the HTTP session."""
+        self.close()
+
+    def _get_json(self, url: str, params: dict[str, Any] | None = None, conditional: bool = False) -> Any:
+        """Request a Nightscout API URL and decode its JSON body.
+
+        Conditional requests send the ETag of the previous response in
+        ``If-None-Match``; a 304 reply is served from the cached body without
+        downloading it again.
+
+        Args:
+            url: The API URL
+            params: Optional query parameters
+            conditional: Whether to revalidate a cached response with its ETag
+
+        Returns:
+            The decoded JSON document
+
+        Raises:
+            requests.RequestException: If the API request fails
+        """
+        cached = self._cached_response(url) if conditional else None
+        headers = {"If-None-Match": cached[0]} if cached else None
+        response = self.session.get(url, params=params, headers=headers, timeout=self.config.timeout_seconds)
+
+        if cached and response.status_code == 304:
+            logger.debug("Not modified, using cached response for {}", url)
+            return _parse_json(cached[1])
+
+        response.raise_for_status()
+        logger.debug("{} returned {} bytes ({})", url, len(response.content), response.headers.get("Content-Encoding"))
+
+        etag = response.headers.get("ETag")
+        if conditional and etag:
+            self._store_response(url, etag, response.content)
+        return _parse_json(response.content)
+
+    def _cache_path(self, url: str) -> str:
+        """Get the cache file for a URL.
+
+        Args:
+            url: The API URL
+
+        Returns:
+            Path of the cache file
+        """
+        # The API secret is part of the key, as responses may vary by credentials
+        key = f"{url}|{self.headers.get('api-secret', '')}"
+        digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        return os.path.join(self.cache_dir or "", f"{digest}.cache")
+
+    def _cached_response(self, url: str) -> tuple[str, bytes] | None:
+        """Get the cached ETag and body for a URL.
+
+        Args:
+            url: The API URL
+
+        Returns:
+            Tuple of (ETag, raw body), or None if nothing usable is cached
+        """
+        cached = self._etag_cache.get(url)
+        if cached is None and self.cache_dir:
+            try:
+                with open(self._cache_path(url), "rb") as f:
+                    etag, _, content = f.read().partition(b"\n")
+                if etag:
+                    cached = self._etag_cache[url] = (etag.decode(), content)
+            except (OSError, UnicodeDecodeError):
+                return None
+        return cached
+
+    def _store_response(self, url: str, etag: str, content: bytes) -> None:
+        """Cache a response body with its ETag.
+
+        The cache file holds the ETag on the first line followed by the body exactly
+        as received.
+
+        Args:
+            url: The API URL
+            etag: ETag of the response
+            content: Raw response body
+        """
+        self._etag_cache[url] = (etag, content)
+        if not self.cache_dir:
+            return
+
+        cache_path = self._cache_path(url)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Write to a temporary file first so concurrent readers never see a partial entry
+            tmp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(etag.encode())
+                f.write(b"\n")
+                f.write(content)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not cache Nightscout response: {str(e)}")
+
     def extract(self, context: WorkflowContext) -> dict[str, Any]:
         """Extract data from Nightscout API.
 
@@ -60,9 +227,16 @@ class NightscoutExtractor(ExtractorBase[dict[str, Any]]):
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days_to_extract)
 
+        # Convert dates to timestamps for Nightscout API
+        start_timestamp = int(start_date.timestamp() * 1000)
+        end_timestamp = int(end_date.timestamp() * 1000)
+
         # Get the configurable record limit (default: 10000)
         record_limit = context.config.get("record_limit", self.DEFAULT_RECORD_LIMIT)
 
+        # Only request the fields the transformer uses unless disabled
+        sparse_fields = context.config.get("sparse_fields", True)
+
         # Format dates for API
         start_date_str = start_date.strftime("%Y-%m-%d")
         end_date_str = end_date.strftime("%Y-%m-%d")
@@ -80,31 +254,57 @@ class NightscoutExtractor(ExtractorBase[dict[str, Any]]):
         }
 
         try:
-            # Extract entries (CGM data)
-            entries = self._extract_entries(nightscout_url, start_date, end_date, record_limit)
-            result["entries"] = entries
-            logger.info(f"Extracted {len(entries)} CGM entries")
-
-            # Extract treatments
-            treatments = self._extract_treatments(nightscout_url, start_date, end_date, record_limit)
-            result["treatments"] = treatments
-            logger.info(f"Extracted {len(treatments)} treatments")
-
-            # Extract profiles
-            profiles = self._extract_profiles(nightscout_url)
-            result["profiles"] = profiles
-            logger.info(f"Extracted {len(profiles)} profiles")
-
-            # Extract device status
-            devicestatus = self._extract_devicestatus(nightscout_url, start_date, end_date, record_limit)
-            result["devicestatus"] = devicestatus
-            logger.info(f"Extracted {len(devicestatus)} device statuses")
+            # The four endpoints are independent, so request them concurrently; the
+            # extraction then takes as long as the slowest request instead of the sum
+            with ThreadPoolExecutor(max_workers=len(result)) as executor:
+                entries_future = executor.submit(
+                    self._extract_entries,
+                    nightscout_url,
+                    start_timestamp,
+                    end_timestamp,
+                    record_limit,
+                    self._ENTRY_FIELDS if sparse_fields else None,
+                )
+                treatments_future = executor.submit(
+                    self._extract_treatments, nightscout_url, start_timestamp, end_timestamp, record_limit
+                )
+                profiles_future = executor.submit(self._extract_profiles, nightscout_url)
+                devicestatus_future = executor.submit(
+                    self._extract_devicestatus,
+                    nightscout_url,
+                    start_timestamp,
+                    end_timestamp,
+                    record_limit,
+                    self._DEVICESTATUS_FIELDS if sparse_fields else None,
+                )
+
+                # Extract entries (CGM data)
+                entries = entries_future.result()
+                result["entries"] = entries
+                logger.info(f"Extracted {len(entries)} CGM entries")
+
+                # Extract treatments
+                treatments = treatments_future.result()
+                result["treatments"] = treatments
+                logger.info(f"Extracted {len(treatments)} treatments")
+
+                # Extract profiles
+                profiles = profiles_future.result()
+                result["profiles"] = profiles
+                logger.info(f"Extracted {len(profiles)} profiles")
+
+                # Extract device status
+                devicestatus = devicestatus_future.result()
+                result["devicestatus"] = devicestatus
+                logger.info(f"Extracted {len(devicestatus)} device statuses")
 
             return result
 
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
+            # Malformed bodies raise ValueError from the JSON parser rather than the
+            # requests.JSONDecodeError that response.json() used to raise
             error_msg = f"Failed to extract data from Nightscout API: {str(e)}"
-            if hasattr(e, "response") and e.response is not None:
+            if getattr(e, "response", None) is not None:
                 error_msg += f", Status code: {e.response.status_code}"
                 if e.response.text:
                     error_msg += f", Response: {e.response.text[:200]}..."
@@ -113,15 +313,27 @@ class NightscoutExtractor(ExtractorBase[dict[str, Any]]):
             raise ExtractorError(error_msg) from e
 
     def _extract_entries(
-        self, nightscout_url: str, start_date: datetime, end_date: datetime, record_limit: int
+        self,
+        nightscout_url: str,
+        start_timestamp: int,
+        end_timestamp: int,
+        record_limit: int,
+        fields: str | None = None,
     ) -> list[dict[str, Any]]:
         """Extract CGM entries from Nightscout.
 
+        Entries are requested newest first in pages of at most ``ENTRIES_PAGE_SIZE``,
+        each page ending at the oldest date of the previous one, so no single response
+        has to hold the whole time range. The API has no offset, so when more entries
+        than a page share one date the rest of that date cannot be reached; they are
+        skipped with a warning.
+
         Args:
             nightscout_url: The Nightscout instance URL
-            start_date: Start date for extraction
-            end_date: End date for extraction
+            start_timestamp: Start of the extraction range in epoch milliseconds
+            end_timestamp: End of the extraction range in epoch milliseconds
             record_limit: Maximum number of records to retrieve
+            fields: Optional comma-separated fields to return, all fields if omitted
 
         Returns:
             List of CGM entries
@@ -129,33 +341,68 @@ class NightscoutExtractor(ExtractorBase[dict[str, Any]]):
         Raises:
             requests.RequestException: If the API request fails
         """
-        # Convert dates to timestamps for Nightscout API
-        start_timestamp = int(start_date.timestamp() * 1000)
-        end_timestamp = int(end_date.timestamp() * 1000)
-
         # Format the URL for entries
         entries_url = f"{nightscout_url}/api/v1/entries.json"
-        params = {
-            "find[date][$gte]": start_timestamp,
-            "find[date][$lte]": end_timestamp,
-            "count": record_limit,
-        }
+        params: dict[str, Any] = {"find[date][$gte]": start_timestamp}
+        if fields:
+            params["fields"] = fields
 
         logger.debug(f"Requesting entries from {entries_url} (limit: {record_limit})")
-        response = requests.get(entries_url, params=params, headers=self.headers)
-        response.raise_for_status()
+        entries: list[dict[str, Any]] = []
+        seen_keys: set[Any] = set()
+        page_size = params["count"] = min(self.ENTRIES_PAGE_SIZE, record_limit)
+        cursor_filter = "find[date][$lte]"
+        cursor = end_timestamp
+        while len(entries) < record_limit:
+            page = self._get_json(entries_url, {**params, cursor_filter: cursor})
+
+            # The cursor is normally inclusive so entries sharing the boundary date (such
+            # as one reading sent by two uploaders) are not skipped; drop the repeats
+            new_entries = []
+            for entry in page:
+                key = self._entry_key(entry)
+                if key not in seen_keys:
+                    seen_keys.add(key)
+                    new_entries.append(entry)
+            entries.extend(new_entries)
+
+            if len(page) < page_size:
+                break
+            cursor = min(entry.get("date", cursor) for entry in page)
+            if new_entries:
+                cursor_filter = "find[date][$lte]"
+            else:
+                # A full page of repeats: every entry on it has the cursor date, so move
+                # past that date instead of requesting the same page again
+                logger.warning(f"More than {page_size} Nightscout entries share date {cursor}, skipping the rest")
+                cursor_filter = "find[date][$lt]"
+
+        return entries[:record_limit]
+
+    @staticmethod
+    def _entry_key(entry: dict[str, Any]) -> Any:
+        """Get the key identifying an entry across pages.
 
-        return response.json()
+        Args:
+            entry: A CGM entry
+
+        Returns:
+            The entry's ``_id``, or its date, device, type and value if it has none
+        """
+        entry_id = entry.get("_id")
+        if entry_id is not None:
+            return entry_id
+        return (entry.get("date"), entry.get("device"), entry.get("type"), entry.get("sgv"))
 
     def _extract_treatments(
-        self, nightscout_url: str, start_date: datetime, end_date: datetime, record_limit: int
+        self, nightscout_url: str, start_timestamp: int, end_timestamp: int, record_limit: int
     ) -> list[dict[str, Any]]:
         """Extract treatments from Nightscout.
 
         Args:
             nightscout_url: The Nightscout instance URL
-            start_date: Start date for extraction
-            end_date: End date for extraction
+            start_timestamp: Start of the extraction range in epoch milliseconds
+            end_timestamp: End of the extraction range in epoch milliseconds
             record_limit: Maximum number of records to retrieve
 
         Returns:
@@ -164,10 +411,6 @@ class NightscoutExtractor(ExtractorBase[dict[str, Any]]):
         Raises:
             requests.RequestException: If the API request fails
         """
-        # Convert dates to timestamps for Nightscout API
-        start_timestamp = int(start_date.timestamp() * 1000)
-        end_timestamp = int(end_date.timestamp() * 1000)
-
         # Format the URL for treatments
         treatments_url = f"{nightscout_url}/api/v1/treatments.json"
         params = {
@@ -177,10 +420,7 @@ class NightscoutExtractor(ExtractorBase[dict[str, Any]]):
         }
 
         logger.debug(f"Requesting treatments from {treatments_url} (limit: {record_limit})")
-        response = requests.get(treatments_url, params=params, headers=self.headers)
-        response.raise_for_status()
-
-        return response.json()
+        return self._get_json(treatments_url, params)
 
     def _extract_profiles(self, nightscout_url: str) -> list[dict[str, Any]]:
         """Extract profiles from Nightscout.
@@ -198,21 +438,24 @@ class NightscoutExtractor(ExtractorBase[dict[str, Any]]):
         profiles_url = f"{nightscout_url}/api/v1/profile.json"
 
         logger.debug(f"Requesting profiles from {profiles_url}")
-        response = requests.get(profiles_url, headers=self.headers)
-        response.raise_for_status()
-
-        return response.json()
+        return self._get_json(profiles_url, conditional=True)
 
     def _extract_devicestatus(
-        self, nightscout_url: str, start_date: datetime, end_date: datetime, record_limit: int
+        self,
+        nightscout_url: str,
+        start_timestamp: int,
+        end_timestamp: int,
+        record_limit: int,
+        fields: str | None = None,
     ) -> list[dict[str, Any]]:
         """Extract device status from Nightscout.
 
         Args:
             nightscout_url: The Nightscout instance URL
-            start_date: Start date for extraction
-            end_date: End date for extraction
+            start_timestamp: Start of the extraction range in epoch milliseconds
+            end_timestamp: End of the extraction range in epoch milliseconds
             record_limit: Maximum number of records to retrieve
+            fields: Optional comma-separated fields to return, all fields if omitted
 
         Returns:
             List of device statuses
@@ -220,23 +463,18 @@ class NightscoutExtractor(ExtractorBase[dict[str, Any]]):
         Raises:
             requests.RequestException: If the API request fails
         """
-        # Convert dates to timestamps for Nightscout API
-        start_timestamp = int(start_date.timestamp() * 1000)
-        end_timestamp = int(end_date.timestamp() * 1000)
-
         # Format the URL for device status
         devicestatus_url = f"{nightscout_url}/api/v1/devicestatus.json"
-        params = {
+        params: dict[str, Any] = {
             "find[created_at][$gte]": start_timestamp,
             "find[created_at][$lte]": end_timestamp,
             "count": record_limit,
         }
+        if fields:
+            params["fields"] = fields
 
         logger.debug(f"Requesting device status from {devicestatus_url} (limit: {record_limit})")
-        response = requests.get(devicestatus_url, params=params, headers=self.headers)
-        response.raise_for_status()
-
-        return response.json()
+        return self._get_json(devicestatus_url, params)
 
     def validate_source(self) -> bool:
         """Validate the Nightscout API configuration.
@@ -253,11 +491,9 @@ class NightscoutExtractor(ExtractorBase[dict[str, Any]]):
         try:
             # Check if Nightscout is accessible by calling the status endpoint
             status_url = f"{nightscout_url}/api/v1/status.json"
-            response = requests.get(status_url, headers=self.headers)
-            response.raise_for_status()
+            status = self._get_json(status_url, conditional=True)
 
             # Validate that it's actually a Nightscout instance
-            status = response.json()
             if "version" not in status:
                 logger.warning("Not a valid Nightscout instance")
                 return False
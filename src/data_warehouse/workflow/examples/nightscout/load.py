@@ -4,12 +4,17 @@ Nightscout Data Loading Module.
 This module provides classes for loading transformed Nightscout data into the data warehouse.
 """
 
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from types import MappingProxyType
 from typing import Any
 
-import pandas as pd
 from loguru import logger
-from sqlalchemy import Column, DateTime, Float, Integer, String, Table, create_engine, text
+from sqlalchemy import Column, DateTime, Engine, Float, Insert, Integer, String, Table, create_engine, text
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.schema import MetaData
 
@@ -17,6 +22,83 @@ from data_warehouse.core.exceptions import LoaderError
 from data_warehouse.workflow.base import WorkflowContext
 from data_warehouse.workflow.etl import LoaderBase
 
+try:
+    import orjson
+except ImportError:  # Optional dependency, install with the "json" extra
+    orjson = None
+
+# Record keys of columns named differently from the fields NightscoutTransformer emits
+_RECORD_KEYS = MappingProxyType(
+    {
+        "nightscout_treatments": MappingProxyType({"entered_by": "enteredBy"}),
+        "nightscout_profiles": MappingProxyType({"start_date": "startDate"}),
+    }
+)
+
+
+def _json_default(value: Any) -> str:
+    """Serialize values the standard library json module does not support.
+
+    Args:
+        value: Value to serialize
+
+    Returns:
+        ISO 8601 string for datetimes, matching orjson's output
+
+    Raises:
+        TypeError: If the value cannot be serialized
+    """
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _json_serializer(value: Any) -> str:
+    """Encode a JSONB column value.
+
+    The raw_data records hold the parsed datetimes produced by the transformer,
+    which orjson encodes natively. Uses orjson when it is installed, several times
+    faster than the standard library for the thousands of records in a load.
+
+    Args:
+        value: Value to encode
+
+    Returns:
+        JSON text
+    """
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value, separators=(",", ":"), default=_json_default)
+
+
+# Engines by connection string, so loaders for the same database share one pool
+_engines: dict[str, Engine] = {}
+_engines_lock = threading.Lock()
+
+
+def _shared_engine(connection_string: str) -> Engine:
+    """Get the engine shared by loaders for a database, connecting on first use.
+
+    Args:
+        connection_string: Database connection string
+
+    Returns:
+        SQLAlchemy engine for the database
+
+    Raises:
+        SQLAlchemyError: If the database cannot be reached
+    """
+    with _engines_lock:
+        engine = _engines.get(connection_string)
+        if engine is None:
+            engine = create_engine(connection_string, json_serializer=_json_serializer)
+            # Test connection
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+            _engines[connection_string] = engine
+            logger.info("Database connection initialized successfully")
+    return engine
+
 
 class NightscoutLoader(LoaderBase[dict[str, Any]]):
     """Loader for Nightscout data into the data warehouse."""
@@ -28,8 +110,9 @@ class NightscoutLoader(LoaderBase[dict[str, Any]]):
             config: Configuration for the loader
         """
         super().__init__(config)
-        self.engine = None
+        self.engine: Engine | None = None
         self.metadata = MetaData()
+        self._schema_ready = False
 
         # Define tables
         self.entries_table = Table(
@@ -89,6 +172,28 @@ class NightscoutLoader(LoaderBase[dict[str, Any]]):
             Column("raw_data", JSONB),
         )
 
+        # Insert statements are built once per loader; reusing the same statement
+        # objects on every load lets SQLAlchemy serve them from its compiled cache
+        self._insert_statements = {table.name: self._build_insert(table) for table in self.metadata.tables.values()}
+
+    def _build_insert(self, table: Table) -> Insert:
+        """Build the batch insert statement for a table.
+
+        Args:
+            table: The table to insert into
+
+        Returns:
+            An INSERT, or an INSERT ... ON CONFLICT (id) DO UPDATE when upsert is enabled
+        """
+        if not self.config.upsert:
+            return table.insert()
+
+        upsert = pg_insert(table)
+        return upsert.on_conflict_do_update(
+            index_elements=["id"],
+            set_={column.name: upsert.excluded[column.name] for column in table.columns if column.name != "id"},
+        )
+
     def _initialize_db_connection(self) -> None:
         """Initialize the database connection."""
         if self.engine is None:
@@ -97,20 +202,23 @@ class NightscoutLoader(LoaderBase[dict[str, Any]]):
                 raise LoaderError("Database connection string not provided in configuration")
 
             try:
-                self.engine = create_engine(connection_string)
-                # Test connection
-                with self.engine.connect() as conn:
-                    conn.execute(text("SELECT 1"))
-                logger.info("Database connection initialized successfully")
+                self.engine = _shared_engine(connection_string)
             except SQLAlchemyError as e:
                 raise LoaderError(f"Failed to connect to database: {str(e)}") from e
 
     def _create_tables_if_not_exist(self) -> None:
-        """Create tables if they don't exist."""
+        """Create tables if they don't exist.
+
+        The check runs once per loader, as it costs a catalog query per table.
+        """
+        if self._schema_ready:
+            return
+
         try:
             if self.engine is None:
                 raise LoaderError("Database engine not initialized")
             self.metadata.create_all(self.engine, checkfirst=True)
+            self._schema_ready = True
             logger.info("Database tables created or verified")
         except SQLAlchemyError as e:
             raise LoaderError(f"Failed to create database tables: {str(e)}") from e
@@ -132,23 +240,16 @@ class NightscoutLoader(LoaderBase[dict[str, Any]]):
             self._initialize_db_connection()
             self._create_tables_if_not_exist()
 
-            total_records = 0
-
-            # Load entries
-            if entries := data.get("entries"):
-                total_records += self._load_entries(entries)
-
-            # Load treatments
-            if treatments := data.get("treatments"):
-                total_records += self._load_treatments(treatments)
-
-            # Load profiles
-            if profiles := data.get("profiles"):
-                total_records += self._load_profiles(profiles)
-
-            # Load devicestatus
-            if devicestatus := data.get("devicestatus"):
-                total_records += self._load_devicestatus(devicestatus)
+            # The tables are independent and each load runs in its own transaction on
+            # its own pooled connection, so load them concurrently
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = [
+                    executor.submit(self._load_entries, data.get("entries") or []),
+                    executor.submit(self._load_treatments, data.get("treatments") or []),
+                    executor.submit(self._load_profiles, data.get("profiles") or []),
+                    executor.submit(self._load_devicestatus, data.get("devicestatus") or []),
+                ]
+                total_records = sum(future.result() for future in futures)
 
             logger.info(f"Successfully loaded {total_records} Nightscout records")
             return total_records
@@ -157,27 +258,31 @@ class NightscoutLoader(LoaderBase[dict[str, Any]]):
             logger.error(f"Failed to load Nightscout data: {str(e)}")
             raise LoaderError(f"Failed to load Nightscout data: {str(e)}") from e
 
-    def _load_entries(self, entries: list[dict[str, Any]]) -> int:
-        """Load CGM entries into the database.
+    def _load_records(self, table: Table, records: list[dict[str, Any]], label: str) -> int:
+        """Insert records into a table in batches.
 
         Args:
-            entries: The entries to load
+            table: The table to load
+            records: The records to load
+            label: Name of the records used in log and error messages
 
         Returns:
-            Number of entries loaded
+            Number of records loaded
+
+        Raises:
+            LoaderError: If loading fails
         """
-        if not entries:
+        if not records:
             return 0
 
         try:
             if self.engine is None:
                 raise LoaderError("Database engine not initialized")
 
-            # Convert to DataFrame for efficient batch insertion
-            df = pd.DataFrame(entries)
-
-            # Add raw data column
-            df["raw_data"] = df.to_dict("records")
+            # The same statement is executed for every batch, which SQLAlchemy sends
+            # through the driver as multi-row INSERTs instead of compiling a new
+            # statement with the batch's values inlined
+            insert_stmt = self._insert_statements[table.name]
 
             # Insert data
             with self.engine.begin() as conn:
@@ -185,35 +290,49 @@ class NightscoutLoader(LoaderBase[dict[str, Any]]):
                 batch_size = self.config.batch_size
 
                 # Load data in batches
-                for i in range(0, len(df), batch_size):
-                    batch = df.iloc[i : i + batch_size]
+                for i in range(0, len(records), batch_size):
+                    conn.execute(insert_stmt, self._build_rows(table, records[i : i + batch_size]))
 
-                    # If upsert is enabled, use it
-                    if self.config.upsert:
-                        insert_stmt = (
-                            self.entries_table.insert()
-                            .values(batch.to_dict("records"))
-                            .prefix_with("ON CONFLICT (id) DO UPDATE SET ")
-                        )
+            logger.info(f"Loaded {len(records)} {label} into database")
+            return len(records)
 
-                        # Exclude id from update
-                        for column in self.entries_table.columns:
-                            if column.name != "id":
-                                insert_stmt = insert_stmt.prefix_with(f"{column.name} = EXCLUDED.{column.name},")
+        except Exception as e:
+            logger.error(f"Failed to load {label}: {str(e)}")
+            raise LoaderError(f"Failed to load {label}: {str(e)}") from e
 
-                        # Remove trailing comma
-                        insert_stmt = insert_stmt.prefix_with("", replace=True)
-                    else:
-                        insert_stmt = self.entries_table.insert().values(batch.to_dict("records"))
+    @staticmethod
+    def _build_rows(table: Table, records: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Build the insert parameters for records.
 
-                    conn.execute(insert_stmt)
+        An executemany needs the same keys in every row, so each record is projected
+        onto the table's columns. Fields without a column are only kept in raw_data,
+        which holds the record itself.
 
-            logger.info(f"Loaded {len(df)} entries into database")
-            return len(df)
+        Args:
+            table: The table the rows are inserted into
+            records: The transformed records
 
-        except Exception as e:
-            logger.error(f"Failed to load entries: {str(e)}")
-            raise LoaderError(f"Failed to load entries: {str(e)}") from e
+        Returns:
+            One parameter dictionary per record
+        """
+        record_keys = _RECORD_KEYS.get(table.name, {})
+        columns = [
+            (column.name, record_keys.get(column.name, column.name))
+            for column in table.columns
+            if column.name != "raw_data"
+        ]
+        return [{**{name: record.get(key) for name, key in columns}, "raw_data": record} for record in records]
+
+    def _load_entries(self, entries: list[dict[str, Any]]) -> int:
+        """Load CGM entries into the database.
+
+        Args:
+            entries: The entries to load
+
+        Returns:
+            Number of entries loaded
+        """
+        return self._load_records(self.entries_table, entries, "entries")
 
     def _load_treatments(self, treatments: list[dict[str, Any]]) -> int:
         """Load treatments into the database.
@@ -224,54 +343,7 @@ class NightscoutLoader(LoaderBase[dict[str, Any]]):
         Returns:
             Number of treatments loaded
         """
-        if not treatments:
-            return 0
-
-        try:
-            if self.engine is None:
-                raise LoaderError("Database engine not initialized")
-
-            # Convert to DataFrame for efficient batch insertion
-            df = pd.DataFrame(treatments)
-
-            # Add raw data column
-            df["raw_data"] = df.to_dict("records")
-
-            # Insert data
-            with self.engine.begin() as conn:
-                # Use batch size from config
-                batch_size = self.config.batch_size
-
-                # Load data in batches
-                for i in range(0, len(df), batch_size):
-                    batch = df.iloc[i : i + batch_size]
-
-                    # If upsert is enabled, use it
-                    if self.config.upsert:
-                        insert_stmt = (
-                            self.treatments_table.insert()
-                            .values(batch.to_dict("records"))
-                            .prefix_with("ON CONFLICT (id) DO UPDATE SET ")
-                        )
-
-                        # Exclude id from update
-                        for column in self.treatments_table.columns:
-                            if column.name != "id":
-                                insert_stmt = insert_stmt.prefix_with(f"{column.name} = EXCLUDED.{column.name},")
-
-                        # Remove trailing comma
-                        insert_stmt = insert_stmt.prefix_with("", replace=True)
-                    else:
-                        insert_stmt = self.treatments_table.insert().values(batch.to_dict("records"))
-
-                    conn.execute(insert_stmt)
-
-            logger.info(f"Loaded {len(df)} treatments into database")
-            return len(df)
-
-        except Exception as e:
-            logger.error(f"Failed to load treatments: {str(e)}")
-            raise LoaderError(f"Failed to load treatments: {str(e)}") from e
+        return self._load_records(self.treatments_table, treatments, "treatments")
 
     def _load_profiles(self, profiles: list[dict[str, Any]]) -> int:
         """Load profiles into the database.
@@ -282,47 +354,7 @@ class NightscoutLoader(LoaderBase[dict[str, Any]]):
         Returns:
             Number of profiles loaded
         """
-        if not profiles:
-            return 0
-
-        try:
-            if self.engine is None:
-                raise LoaderError("Database engine not initialized")
-
-            # Convert to DataFrame for efficient batch insertion
-            df = pd.DataFrame(profiles)
-
-            # Add raw data column
-            df["raw_data"] = df.to_dict("records")
-
-            # Insert data
-            with self.engine.begin() as conn:
-                # If upsert is enabled, use it
-                if self.config.upsert:
-                    insert_stmt = (
-                        self.profiles_table.insert()
-                        .values(df.to_dict("records"))
-                        .prefix_with("ON CONFLICT (id) DO UPDATE SET ")
-                    )
-
-                    # Exclude id from update
-                    for column in self.profiles_table.columns:
-                        if column.name != "id":
-                            insert_stmt = insert_stmt.prefix_with(f"{column.name} = EXCLUDED.{column.name},")
-
-                    # Remove trailing comma
-                    insert_stmt = insert_stmt.prefix_with("", replace=True)
-                else:
-                    insert_stmt = self.profiles_table.insert().values(df.to_dict("records"))
-
-                conn.execute(insert_stmt)
-
-            logger.info(f"Loaded {len(df)} profiles into database")
-            return len(df)
-
-        except Exception as e:
-            logger.error(f"Failed to load profiles: {str(e)}")
-            raise LoaderError(f"Failed to load profiles: {str(e)}") from e
+        return self._load_records(self.profiles_table, profiles, "profiles")
 
     def _load_devicestatus(self, devicestatus: list[dict[str, Any]]) -> int:
         """Load device status entries into the database.
@@ -333,54 +365,7 @@ class NightscoutLoader(LoaderBase[dict[str, Any]]):
         Returns:
             Number of device status entries loaded
         """
-        if not devicestatus:
-            return 0
-
-        try:
-            if self.engine is None:
-                raise LoaderError("Database engine not initialized")
-
-            # Convert to DataFrame for efficient batch insertion
-            df = pd.DataFrame(devicestatus)
-
-            # Add raw data column
-            df["raw_data"] = df.to_dict("records")
-
-            # Insert data
-            with self.engine.begin() as conn:
-                # Use batch size from config
-                batch_size = self.config.batch_size
-
-                # Load data in batches
-                for i in range(0, len(df), batch_size):
-                    batch = df.iloc[i : i + batch_size]
-
-                    # If upsert is enabled, use it
-                    if self.config.upsert:
-                        insert_stmt = (
-                            self.devicestatus_table.insert()
-                            .values(batch.to_dict("records"))
-                            .prefix_with("ON CONFLICT (id) DO UPDATE SET ")
-                        )
-
-                        # Exclude id from update
-                        for column in self.devicestatus_table.columns:
-                            if column.name != "id":
-                                insert_stmt = insert_stmt.prefix_with(f"{column.name} = EXCLUDED.{column.name},")
-
-                        # Remove trailing comma
-                        insert_stmt = insert_stmt.prefix_with("", replace=True)
-                    else:
-                        insert_stmt = self.devicestatus_table.insert().values(batch.to_dict("records"))
-
-                    conn.execute(insert_stmt)
-
-            logger.info(f"Loaded {len(df)} device status entries into database")
-            return len(df)
-
-        except Exception as e:
-            logger.error(f"Failed to load device status entries: {str(e)}")
-            raise LoaderError(f"Failed to load device status entries: {str(e)}") from e
+        return self._load_records(self.devicestatus_table, devicestatus, "device status entries")
 
     def validate_target(self) -> bool:
         """Validate the database target configuration.
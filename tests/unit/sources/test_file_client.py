@@ -0,0 +1,165 @@
+"""Tests for the file client."""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from data_warehouse.sources.file_client import FileClient
+
+
+@pytest.fixture
+def file_client(tmp_path: Path) -> FileClient:
+    """Return a file client rooted at a temporary directory."""
+    return FileClient(tmp_path)
+
+
+def test_iter_csv_streams_all_rows(file_client: FileClient, tmp_path: Path):
+    """Test that iter_csv yields batches covering every row of the file."""
+    df = pd.DataFrame({"id": range(50_000), "name": ["row"] * 50_000})
+    df.to_csv(tmp_path / "large.csv", index=False)
+
+    batches = list(file_client.iter_csv("large.csv", block_size=1 << 16))
+
+    assert len(batches) > 1
+    assert sum(batch.num_rows for batch in batches) == len(df)
+    assert batches[0].schema.names == ["id", "name"]
+
+
+def test_iter_csv_missing_file(file_client: FileClient):
+    """Test that iter_csv raises FileNotFoundError for a missing file."""
+    with pytest.raises(FileNotFoundError):
+        next(file_client.iter_csv("missing.csv"))
+
+
+@pytest.mark.parametrize(
+    ("save_method", "read_method", "filename"),
+    [
+        ("save_parquet", "read_parquet", "frame.parquet"),
+        ("save_feather", "read_feather", "frame.feather"),
+    ],
+)
+def test_columnar_round_trip(file_client: FileClient, save_method: str, read_method: str, filename: str):
+    """Test that DataFrames survive a Parquet/Feather save and read."""
+    df = pd.DataFrame({"id": [1, 2, 3], "name": ["a", "b", "c"]})
+
+    getattr(file_client, save_method)(df, filename)
+    result = getattr(file_client, read_method)(filename)
+
+    pd.testing.assert_frame_equal(result, df)
+
+
+@pytest.mark.parametrize("read_method", ["read_csv", "read_excel", "read_parquet", "read_feather"])
+def test_read_missing_file(file_client: FileClient, read_method: str):
+    """Test that read methods surface FileNotFoundError for missing files."""
+    with pytest.raises(FileNotFoundError):
+        getattr(file_client, read_method)("missing.dat")
+
+
+def test_init_creates_data_dir(tmp_path: Path):
+    """Test that the data directory is created when it does not exist."""
+    data_dir = tmp_path / "nested" / "data"
+
+    FileClient(data_dir)
+
+    assert data_dir.is_dir()
+
+
+def test_list_files_filters(file_client: FileClient, tmp_path: Path):
+    """Test list_files pattern and extension filtering."""
+    for name in ["a.csv", "b.CSV", "c.parquet", "notes.txt"]:
+        (tmp_path / name).write_text("x")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "d.csv").write_text("x")
+
+    def names(files: list[Path]) -> set[str]:
+        return {f.name for f in files}
+
+    assert names(file_client.list_files()) == {"a.csv", "b.CSV", "c.parquet", "notes.txt"}
+    assert names(file_client.list_files(extension="csv")) == {"a.csv", "b.CSV"}
+    assert names(file_client.list_files(pattern="*.parquet")) == {"c.parquet"}
+    assert names(file_client.list_files(pattern="**/*.csv", extension=".csv")) == {"a.csv", "d.csv"}
+
+
+def test_list_files_matches_suffixes_and_pattern_directories(file_client: FileClient, tmp_path: Path):
+    """Test that extensions match whole suffixes and patterns also match directories."""
+    for name in ["a.csv", ".csv", "b.tar.gz"]:
+        (tmp_path / name).write_text("x")
+    (tmp_path / "archive.csv").mkdir()
+
+    def names(files: list[Path]) -> set[str]:
+        return {f.name for f in files}
+
+    # A dotfile has no suffix, and only the last suffix is compared
+    assert names(file_client.list_files(extension="csv")) == {"a.csv"}
+    assert names(file_client.list_files(extension="tar.gz")) == set()
+    assert names(file_client.list_files(extension="gz")) == {"b.tar.gz"}
+    assert names(file_client.list_files(pattern="*.csv")) == {"a.csv", ".csv", "archive.csv"}
+    assert names(file_client.list_files(pattern="*.csv", extension="csv")) == {"a.csv", "archive.csv"}
+
+
+@pytest.mark.parametrize("kwargs", [{"index": False}, {"index": False, "header": False}, {}])
+def test_save_csv_round_trip(file_client: FileClient, kwargs: dict):
+    """Test that save_csv output reads back to the same values on both writer paths."""
+    df = pd.DataFrame({"id": [1, 2, 3], "price": [1.5, None, 3.25], "name": ["a", "b,c", 'q"d']})
+
+    file_client.save_csv(df, "out.csv", **kwargs)
+    result = file_client.read_csv(
+        "out.csv",
+        header=0 if kwargs.get("header", True) else None,
+        index_col=None if "index" in kwargs else 0,
+        names=None if kwargs.get("header", True) else list(df.columns),
+    )
+
+    pd.testing.assert_frame_equal(result, df)
+
+
+@pytest.mark.parametrize(
+    "df",
+    [
+        pd.DataFrame({"id": [1, 2, 3], "name": ["a", None, ""]}),
+        pd.DataFrame({"id": [1, 2], "name": ["a", "b,c"], "note": ['q"d', "line\nbreak"]}),
+        pd.DataFrame({"a b": [1], "c,d": pd.array(["x"], dtype="string")}),
+        pd.DataFrame({"a": [1, "a", None], "b": [1, 2, 3]}),
+        pd.DataFrame({"price": [1.0, 2.5], "flag": [True, False]}),
+        pd.DataFrame({"name": ["a", ""]}),
+    ],
+    ids=["ints-and-strings", "quoted-values", "quoted-header", "mixed-object", "float-bool", "single-column"],
+)
+@pytest.mark.parametrize("header", [True, False])
+def test_save_csv_matches_to_csv_bytes(file_client: FileClient, tmp_path: Path, df: pd.DataFrame, header: bool):
+    """Test that save_csv writes exactly the bytes DataFrame.to_csv would."""
+    file_client.save_csv(df, "out.csv", index=False, header=header)
+
+    assert (tmp_path / "out.csv").read_bytes() == df.to_csv(index=False, header=header).encode()
+
+
+def test_read_excel_sheets(file_client: FileClient, tmp_path: Path):
+    """Test reading single, listed and all sheets from one workbook."""
+    first = pd.DataFrame({"id": [1, 2]})
+    second = pd.DataFrame({"name": ["a", "b"]})
+    with pd.ExcelWriter(tmp_path / "book.xlsx") as writer:
+        first.to_excel(writer, sheet_name="first", index=False)
+        second.to_excel(writer, sheet_name="second", index=False)
+
+    pd.testing.assert_frame_equal(file_client.read_excel("book.xlsx", sheet_name="first"), first)
+    assert list(file_client.read_excel("book.xlsx", sheet_name=["second"])) == ["second"]
+    sheets = file_client.read_excel("book.xlsx")
+    assert list(sheets) == ["first", "second"]
+    pd.testing.assert_frame_equal(sheets["second"], second)
+
+
+def test_arrow_readers(file_client: FileClient, tmp_path: Path):
+    """Test that the Arrow read tier returns tables matching the pandas readers."""
+    df = pd.DataFrame({"id": [1, 2, 3], "name": ["a", "b", "c"]})
+    df.to_csv(tmp_path / "frame.csv", index=False)
+    file_client.save_parquet(df, "frame.parquet")
+    df.to_excel(tmp_path / "frame.xlsx", index=False)
+
+    for table in [
+        file_client.read_csv_arrow("frame.csv"),
+        file_client.read_parquet_arrow("frame.parquet"),
+        file_client.read_excel_arrow("frame.xlsx"),
+    ]:
+        assert table.column_names == ["id", "name"]
+        assert table.column("id").to_pylist() == [1, 2, 3]
@@ -0,0 +1,81 @@
+"""Tests for the CLI error handling utilities."""
+
+import click
+import pytest
+
+from data_warehouse.core.exceptions import (
+    DatabaseError,
+    DataWarehouseError,
+    StorageError,
+    ValidationError,
+    WorkflowError,
+)
+from data_warehouse.utils import error_handler
+from data_warehouse.utils.error_handler import handle_exceptions
+
+
+def _raiser(exc: Exception):
+    def command():
+        raise exc
+
+    return command
+
+
+@pytest.mark.parametrize(
+    ("exc", "exit_code"),
+    [
+        (click.Abort(), 1),
+        (click.UsageError("bad usage"), 2),
+        (ValidationError("bad value"), 3),
+        (DatabaseError("no connection"), 4),
+        (StorageError("no bucket"), 5),
+        (DataWarehouseError("generic"), 6),
+        (WorkflowError("subclass of the base error"), 6),
+        (RuntimeError("unexpected"), 10),
+    ],
+)
+def test_handle_exceptions_exit_codes(exc: Exception, exit_code: int):
+    """Test that each exception type maps to its documented exit code."""
+    command = handle_exceptions()(_raiser(exc))
+
+    with pytest.raises(SystemExit) as excinfo:
+        command()
+
+    assert excinfo.value.code == exit_code
+
+
+def test_handle_exceptions_without_exit():
+    """Test that errors are swallowed when exit_on_error is False."""
+    command = handle_exceptions(exit_on_error=False)(_raiser(StorageError("no bucket")))
+
+    assert command() is None
+
+
+def test_handle_exceptions_passes_through_result():
+    """Test that the wrapped function's return value and metadata are preserved."""
+
+    @handle_exceptions()
+    def command(value: int) -> int:
+        return value * 2
+
+    assert command(21) == 42
+    assert command.__name__ == "command"
+
+
+def test_handle_exceptions_fast_exit(monkeypatch: pytest.MonkeyPatch):
+    """Test that FAST_EXIT routes fatal errors through os._exit."""
+    exit_codes: list[int] = []
+
+    def fake_exit(code: int):
+        exit_codes.append(code)
+        raise SystemExit(code)
+
+    monkeypatch.setattr(error_handler.settings, "FAST_EXIT", True)
+    monkeypatch.setattr(error_handler.logger, "remove", lambda *args: None)
+    monkeypatch.setattr(error_handler.os, "_exit", fake_exit)
+    command = handle_exceptions()(_raiser(DatabaseError("no connection")))
+
+    with pytest.raises(SystemExit):
+        command()
+
+    assert exit_codes == [4]
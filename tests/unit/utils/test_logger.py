@@ -0,0 +1,40 @@
+"""Tests for the logging configuration."""
+
+import importlib
+
+import pytest
+
+import data_warehouse.utils.logger as logger_module
+
+
+def test_logger_configured_lazily(monkeypatch: pytest.MonkeyPatch):
+    """Test that importing the module does not configure loguru until logger is accessed."""
+    module = importlib.reload(logger_module)
+    calls: list[bool] = []
+    monkeypatch.setattr(module, "setup_logger", lambda verbose=False: calls.append(verbose))
+
+    assert calls == []
+
+    module.logger  # noqa: B018
+
+    assert calls == [False]
+
+
+def test_get_command_logger_configures_lazily(monkeypatch: pytest.MonkeyPatch):
+    """Test that the first command logger applies the default configuration."""
+    module = importlib.reload(logger_module)
+    calls: list[bool] = []
+    monkeypatch.setattr(module, "setup_logger", lambda verbose=False: calls.append(verbose))
+
+    module.get_command_logger("data_warehouse.cli.example")
+
+    assert calls == [False]
+
+
+def test_get_command_logger_is_cached():
+    """Test that bound command loggers are reused per module name."""
+    first = logger_module.get_command_logger("data_warehouse.cli.example")
+    second = logger_module.get_command_logger("data_warehouse.cli.example")
+
+    assert first is second
+    assert first is not logger_module.get_command_logger("data_warehouse.cli.other")
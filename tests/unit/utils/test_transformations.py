@@ -0,0 +1,204 @@
+"""Tests for the data transformation utilities."""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_warehouse.utils.transformations import (
+    _drop_duplicate_keys,
+    _left_join_on_key,
+    clean_customer_data,
+    clean_order_data,
+    clean_store_location_data,
+    enrich_inventory_data,
+)
+
+
+@pytest.fixture
+def customers() -> pd.DataFrame:
+    """Raw customer rows with duplicates, missing values and messy phone numbers."""
+    return pd.DataFrame(
+        {
+            "customer_id": [1, 2, 2, 3],
+            "first_name": ["ann", "bob", "BOB", None],
+            "last_name": ["lee", "o'neil", "ray", "z"],
+            "email": ["a@example.com", None, "b@example.com", ""],
+            "phone": ["(555) 123-4567", None, "555.1", ""],
+        }
+    )
+
+
+def test_clean_customer_data(customers: pd.DataFrame):
+    """Test deduplication, phone normalization and derived columns."""
+    original = customers.copy()
+
+    result = clean_customer_data(customers)
+
+    assert result["customer_id"].tolist() == [1, 2]
+    assert result["phone"].tolist() == ["5551234567", "5551"]
+    assert result["full_name"].tolist() == ["Ann Lee", "Bob Ray"]
+    assert result["has_email"].tolist() == [True, True]
+    assert result["has_phone"].tolist() == [True, True]
+    assert result["has_email"].dtype == bool
+    assert result["has_phone"].dtype == bool
+    # The input frame is left untouched
+    pd.testing.assert_frame_equal(customers, original)
+
+
+def test_clean_order_data_status_and_processing_days():
+    """Test derived order status and processing days."""
+    orders = pd.DataFrame(
+        {
+            "order_id": [1, 2, 3],
+            "customer_id": [10, 11, 12],
+            "order_date": ["2024-01-01", "2024-01-05", "2024-02-01"],
+            "ship_date": ["2024-01-03", None, "2024-01-30"],
+            "delivery_date": ["2024-01-06", None, None],
+        }
+    )
+
+    result = clean_order_data(orders)
+
+    assert result["order_status"].tolist() == ["Delivered", "Unknown", "Shipped"]
+    assert result["order_status"].cat.ordered
+    assert result["processing_days"].iloc[0] == 2
+    assert np.isnan(result["processing_days"].iloc[1])
+    # Ship dates before the order date are treated as bad data
+    assert np.isnan(result["processing_days"].iloc[2])
+
+
+def test_clean_order_data_keeps_non_iso_dates():
+    """Test that dates outside ISO 8601 are parsed rather than dropped."""
+    orders = pd.DataFrame(
+        {
+            "order_id": [1, 2, 3],
+            "customer_id": [10, 11, 12],
+            "order_date": ["2024-01-01", "01/15/2024", "not a date"],
+        }
+    )
+
+    result = clean_order_data(orders)
+
+    assert result["order_id"].tolist() == [1, 2]
+    assert result["order_date"].tolist() == [pd.Timestamp("2024-01-01"), pd.Timestamp("2024-01-15")]
+
+
+def test_clean_store_location_data():
+    """Test address standardization, zip/phone cleanup and the active flag."""
+    stores = pd.DataFrame(
+        {
+            "store_id": [1, 2],
+            "state": [" ny", "ca "],
+            "country": ["us", " us"],
+            "zip_code": ["10001-1234", None],
+            "phone": ["(212) 555-0100", None],
+            "closing_date": [None, "2022-01-01"],
+        }
+    )
+
+    result = clean_store_location_data(stores)
+
+    assert result["state"].tolist() == ["NY", "CA"]
+    assert result["country"].tolist() == ["US", "US"]
+    assert result["state"].cat.categories.tolist() == ["CA", "NY"]
+    assert result["country"].cat.categories.tolist() == ["US"]
+    assert result["zip_code"].tolist() == ["100011234", ""]
+    assert result["phone"].tolist() == ["2125550100", ""]
+    assert result["is_active"].tolist() == [True, False]
+    assert result["is_active"].dtype == bool
+
+
+def test_digit_cleanup_matches_python_regex_semantics():
+    """Test that phones keep any Unicode digit while zip codes keep ASCII digits only."""
+    stores = pd.DataFrame({"store_id": [1], "zip_code": ["１０００１"], "phone": ["１２３-4"]})
+
+    result = clean_store_location_data(stores)
+
+    # Same as re.sub(r"\D", ...) for phones and re.sub(r"[^0-9]", ...) for zip codes
+    assert result["phone"].tolist() == ["１２３4"]
+    assert result["zip_code"].tolist() == [""]
+
+
+def test_enrich_inventory_data():
+    """Test joins against products and stores plus inventory status buckets."""
+    inventory = pd.DataFrame({"product_id": [1, 2, 1], "store_id": [1, 1, 2], "quantity": [3, 0, 50]})
+    products = pd.DataFrame(
+        {"product_id": [1, 2], "product_name": ["a", "b"], "price": [10.0, 4.0], "cost": [6.0, 1.0]}
+    )
+    stores = pd.DataFrame({"store_id": [1, 2], "store_name": ["north", "south"]})
+
+    result = enrich_inventory_data(inventory, products, stores)
+
+    assert result["product_name"].tolist() == ["a", "b", "a"]
+    assert result["store_name"].tolist() == ["north", "north", "south"]
+    assert result["inventory_value"].tolist() == [18.0, 0.0, 300.0]
+    assert result["retail_value"].tolist() == [30.0, 0.0, 500.0]
+    assert result["inventory_status"].tolist() == ["Low Stock", "Out of Stock", "In Stock"]
+    assert isinstance(result["inventory_status"].dtype, pd.CategoricalDtype)
+    # Derived columns are not added to the caller's frame
+    assert list(inventory.columns) == ["product_id", "store_id", "quantity"]
+
+
+def test_enrich_inventory_data_duplicate_lookup_keys():
+    """Test that non-unique lookup keys fan out rows like a left merge."""
+    inventory = pd.DataFrame({"product_id": [1, 3], "store_id": [1, 1], "quantity": [20, 20]})
+    products = pd.DataFrame({"product_id": [1, 1], "product_name": ["old", "new"]})
+    stores = pd.DataFrame({"store_id": [1], "store_name": ["north"]})
+
+    result = enrich_inventory_data(inventory, products, stores)
+
+    assert result["product_name"].tolist()[:2] == ["old", "new"]
+    assert pd.isna(result["product_name"].iloc[2])
+    assert result["store_name"].tolist() == ["north", "north", "north"]
+    assert result.index.tolist() == [0, 1, 2]
+
+
+def test_cleaners_share_updated_at(customers: pd.DataFrame):
+    """Test that a caller-supplied timestamp is used for last_updated."""
+    updated_at = datetime(2024, 1, 1, 12, 0)
+
+    result = clean_customer_data(customers, updated_at=updated_at)
+
+    assert (result["last_updated"] == updated_at).all()
+    assert result["last_updated"].dtype.kind == "M"
+
+
+@pytest.mark.parametrize(
+    "keys",
+    [[1, 1, 2, 3, 3, 3], [3, 1, 3, 2, 1], [1.0, 1.0, None, 2.0], [5]],
+    ids=["sorted", "unsorted", "missing", "single"],
+)
+def test_drop_duplicate_keys_matches_drop_duplicates(keys: list):
+    """Test that the sorted-key fast path keeps the same rows as drop_duplicates."""
+    df = pd.DataFrame({"key": keys, "row": range(len(keys))})
+
+    result = _drop_duplicate_keys(df, "key")
+
+    pd.testing.assert_frame_equal(result, df.drop_duplicates(subset=["key"], keep="last"))
+
+
+@pytest.mark.parametrize("overlap", [0, "", "name"])
+def test_left_join_on_key_suffixes_overlapping_columns(overlap):
+    """Test that overlapping column names, including falsy labels, get merge suffixes."""
+    left = pd.DataFrame({"key": [1, 2], overlap: ["l1", "l2"]})
+    right = pd.DataFrame({"key": [2, 1], overlap: ["r2", "r1"]})
+
+    result = _left_join_on_key(left, right, "key")
+
+    pd.testing.assert_frame_equal(result, pd.merge(left, right, on="key", how="left"))
+
+
+def test_enrich_inventory_data_empty_lookups():
+    """Test that empty product and store frames add all-missing columns."""
+    inventory = pd.DataFrame({"product_id": [1, 2], "store_id": [1, 1], "quantity": [20, 0]})
+    products = pd.DataFrame({"product_id": pd.Series([], dtype="int64"), "price": pd.Series([], dtype="float64")})
+    stores = pd.DataFrame({"store_id": pd.Series([], dtype="int64"), "store_name": pd.Series([], dtype="object")})
+
+    result = enrich_inventory_data(inventory, products, stores)
+
+    assert result["price"].isna().all()
+    assert result["store_name"].isna().all()
+    assert result["retail_value"].isna().all()
+    assert result["inventory_status"].tolist() == ["In Stock", "Out of Stock"]
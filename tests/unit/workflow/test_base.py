@@ -0,0 +1,140 @@
+"""Tests for the core workflow classes."""
+
+import gc
+import weakref
+from datetime import datetime
+
+from data_warehouse.workflow.base import (
+    WorkflowBase,
+    WorkflowContext,
+    WorkflowMonitor,
+    WorkflowRegistry,
+    WorkflowStatus,
+    WorkflowValidator,
+)
+
+
+class SampleWorkflow(WorkflowBase):
+    """Minimal workflow used by the registry tests."""
+
+    def extract(self, context: WorkflowContext) -> WorkflowContext:
+        return context
+
+    def transform(self, context: WorkflowContext) -> WorkflowContext:
+        return context
+
+    def load(self, context: WorkflowContext) -> WorkflowContext:
+        return context
+
+    def _validate_config(self) -> None:
+        pass
+
+
+def test_workflow_registry_unregister_clears_domains():
+    """Test that unregistering removes a workflow from every domain it was added to."""
+    registry = WorkflowRegistry()
+    workflow_id = SampleWorkflow.get_workflow_id()
+    registry.register(SampleWorkflow, domain="sales")
+    registry.register(SampleWorkflow, domain="finance")
+
+    assert registry.get_workflows_by_domain("finance") == [SampleWorkflow]
+
+    registry.unregister(workflow_id)
+
+    assert workflow_id not in registry.get_all_workflows()
+    assert registry.get_workflows_by_domain("sales") == []
+    assert registry.get_workflows_by_domain("finance") == []
+
+
+def test_workflow_monitor_records_history():
+    """Test that executions are recorded with status, metadata and an ISO timestamp."""
+    monitor = WorkflowMonitor()
+
+    monitor.register_workflow_execution("wf", WorkflowStatus.RUNNING)
+    monitor.register_workflow_execution("wf", WorkflowStatus.COMPLETED, {"rows": 3})
+
+    history = monitor.get_workflow_history("wf")
+    assert [entry["status"] for entry in history] == [WorkflowStatus.RUNNING, WorkflowStatus.COMPLETED]
+    assert history[1]["metadata"] == {"rows": 3}
+    # Naive local time, like datetime.now()
+    timestamp = datetime.fromisoformat(history[0]["timestamp"])
+    assert timestamp.tzinfo is None
+    assert abs((datetime.now() - timestamp).total_seconds()) < 60
+    assert monitor.get_workflow_status("wf") == WorkflowStatus.COMPLETED
+    assert monitor.get_workflow_history("missing") == []
+
+
+def test_workflow_monitor_bounds_history():
+    """Test that history is unbounded by default and max_history keeps the most recent."""
+    unbounded = WorkflowMonitor()
+    monitor = WorkflowMonitor(max_history=2)
+
+    for status in (WorkflowStatus.PENDING, WorkflowStatus.RUNNING, WorkflowStatus.FAILED):
+        unbounded.register_workflow_execution("wf", status)
+        monitor.register_workflow_execution("wf", status)
+
+    assert len(unbounded.get_workflow_history("wf")) == 3
+    assert [entry["status"] for entry in monitor.get_workflow_history("wf")] == [
+        WorkflowStatus.RUNNING,
+        WorkflowStatus.FAILED,
+    ]
+
+
+def test_get_workflow_id_is_per_class():
+    """Test that cached workflow ids are not shared between subclasses."""
+
+    class OtherWorkflow(SampleWorkflow):
+        pass
+
+    assert SampleWorkflow.get_workflow_id() == f"{__name__}.SampleWorkflow"
+    assert OtherWorkflow.get_workflow_id() == f"{__name__}.OtherWorkflow"
+    assert SampleWorkflow().get_workflow_id() == SampleWorkflow.get_workflow_id()
+
+
+def test_workflow_classes_are_collectable_after_get_workflow_id():
+    """Test that looking up a workflow ID does not keep the class alive."""
+
+    class ReloadedWorkflow(SampleWorkflow):
+        pass
+
+    assert ReloadedWorkflow.get_workflow_id() == f"{__name__}.ReloadedWorkflow"
+    class_ref = weakref.ref(ReloadedWorkflow)
+    del ReloadedWorkflow
+    gc.collect()
+
+    assert class_ref() is None
+
+
+def test_validate_workflow_class():
+    """Test that only concrete workflow subclasses pass validation."""
+
+    class IncompleteWorkflow(WorkflowBase):
+        def extract(self, context: WorkflowContext) -> WorkflowContext:
+            return context
+
+    assert WorkflowValidator.validate_workflow_class(SampleWorkflow)
+    assert not WorkflowValidator.validate_workflow_class(IncompleteWorkflow)
+    assert not WorkflowValidator.validate_workflow_class(WorkflowBase)
+    assert not WorkflowValidator.validate_workflow_class(dict)
+
+
+def test_discover_workflows_honours_module_workflow_list(tmp_path, monkeypatch):
+    """Test that __workflows__ limits registration to the listed classes."""
+    package = tmp_path / "discovery_pkg" / "sales"
+    package.mkdir(parents=True)
+    (tmp_path / "discovery_pkg" / "__init__.py").write_text("")
+    (package / "__init__.py").write_text("")
+    (package / "orders.py").write_text(
+        "from data_warehouse.workflow.base import WorkflowBase\n"
+        "class Listed(WorkflowBase):\n    pass\n"
+        "class Hidden(WorkflowBase):\n    pass\n"
+        "__workflows__ = [Listed]\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    registry = WorkflowRegistry()
+
+    registry.discover_workflows("discovery_pkg")
+
+    registered = [workflow.__name__ for workflow in registry.get_workflows_by_domain("sales")]
+    assert registered == ["Listed"]
+    registry.unregister("discovery_pkg.sales.orders.Listed")
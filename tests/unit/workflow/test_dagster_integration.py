@@ -0,0 +1,89 @@
+"""Tests for the Dagster integration."""
+
+import os
+from types import SimpleNamespace
+
+import pytest
+from loguru import logger
+
+pytest.importorskip("dagster")
+
+from data_warehouse.utils.logger import setup_logger  # noqa: E402
+from data_warehouse.workflow import dagster_integration  # noqa: E402
+
+
+def test_loguru_bridge_survives_logger_reconfiguration():
+    """Test that the bridge sink is re-added after setup_logger() removes all sinks."""
+    messages: list[str] = []
+    dagster_log = SimpleNamespace(info=messages.append)
+    try:
+        dagster_integration._setup_loguru_dagster_bridge(dagster_log)
+        setup_logger()
+        dagster_integration._setup_loguru_dagster_bridge(dagster_log)
+        dagster_integration._setup_loguru_dagster_bridge(dagster_log)
+
+        logger.info("after reconfigure")
+
+        assert messages.count("after reconfigure") == 1
+    finally:
+        logger.remove(dagster_integration._dagster_bridge_handler_id)
+
+
+def _io_context(name: str, metadata: list[dict] | None = None) -> SimpleNamespace:
+    """Build a minimal Dagster output/input context for a run-scoped op output."""
+    return SimpleNamespace(
+        get_run_scoped_output_identifier=lambda: ["run", name, "result"],
+        add_output_metadata=(metadata if metadata is not None else []).append,
+    )
+
+
+def test_io_manager_spills_evicted_outputs_and_reloads_them(tmp_path):
+    """Test LRU eviction to disk, reload from disk and dropping unpicklable outputs."""
+    io_manager = dagster_integration.WorkflowIOManager(storage_dir=str(tmp_path), max_entries=1)
+
+    io_manager.handle_output(_io_context("first"), {"rows": [1, 2]})
+    io_manager.handle_output(_io_context("lazy"), (row for row in range(3)))
+    # Evicting the generator must not fail this unrelated output
+    io_manager.handle_output(_io_context("second"), [3])
+
+    assert len(os.listdir(tmp_path)) == 1
+    assert io_manager.load_input(_io_context("first")) == {"rows": [1, 2]}
+    # The reloaded output is back in memory and its spill file is gone; "second"
+    # was spilled in its place
+    assert io_manager.load_input(_io_context("first")) == {"rows": [1, 2]}
+    assert io_manager.load_input(_io_context("lazy")) is None
+    assert io_manager.load_input(_io_context("second")) == [3]
+    assert io_manager.load_input(_io_context("first")) == {"rows": [1, 2]}
+    assert len(os.listdir(tmp_path)) == 1
+
+
+def test_io_manager_adds_metadata_for_op_outputs(tmp_path):
+    """Test that every output, not just asset outputs, gets record count metadata."""
+    io_manager = dagster_integration.WorkflowIOManager(storage_dir=str(tmp_path))
+    metadata: list[dict] = []
+
+    io_manager.handle_output(_io_context("op_output", metadata), [1, 2, 3])
+
+    assert metadata == [{"record_count": 3, "data_type": "<class 'list'>"}]
+
+
+def _define_workflow() -> type:
+    """Define a workflow class the way a (re)import of its module would."""
+    from data_warehouse.workflow.base import WorkflowBase
+
+    return type("ReloadedWorkflow", (WorkflowBase,), {"__module__": "workflows.sales.reloaded"})
+
+
+def test_adapter_rebuilds_definitions_for_reloaded_workflow():
+    """Test that a reloaded workflow class gets a fresh asset instead of the stale one."""
+    adapter = dagster_integration.DagsterWorkflowAdapter()
+    original = _define_workflow()
+
+    first = adapter.workflow_to_asset(original)
+    assert adapter.workflow_to_asset(original) is first
+
+    reloaded = _define_workflow()
+    assert adapter.workflow_to_asset(reloaded) is not first
+    # Entries built for the old class are replaced, not kept alongside the new ones
+    assert len(adapter._definition_cache) == 1
+    assert adapter._cached_classes["workflows.sales.reloaded.ReloadedWorkflow"] is reloaded
@@ -0,0 +1,174 @@
+"""Tests for workflow discovery."""
+
+import os
+import shutil
+import sys
+import threading
+import time
+
+import pytest
+from watchdog.events import DirModifiedEvent, FileModifiedEvent
+
+from data_warehouse.core.exceptions import WorkflowDiscoveryError
+from data_warehouse.workflow.base import WorkflowRegistry
+from data_warehouse.workflow.discovery import WorkflowDiscovery, WorkflowFileHandler
+
+WORKFLOW_SOURCE = """
+from data_warehouse.workflow.base import WorkflowBase
+
+
+class {name}(WorkflowBase):
+    def extract(self, context):
+        return context
+
+    def transform(self, context):
+        return context
+
+    def load(self, context):
+        return context
+
+    def _validate_config(self):
+        pass
+"""
+
+
+@pytest.fixture
+def workflow_package(tmp_path, monkeypatch):
+    """Create an importable package with one workflow per domain and an ignored template."""
+    root = tmp_path / "scan_pkg"
+    for directory in (root, root / "sales", root / "_templates"):
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / "__init__.py").write_text("")
+    (root / "sales" / "orders.py").write_text(WORKFLOW_SOURCE.format(name="OrdersWorkflow"))
+    (root / "_templates" / "template.py").write_text(WORKFLOW_SOURCE.format(name="TemplateWorkflow"))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield root
+    registry = WorkflowRegistry()
+    for workflow_id in list(registry.get_all_workflows()):
+        if workflow_id.startswith("scan_pkg."):
+            registry.unregister(workflow_id)
+    # Each test builds its own package, so the next one must not reuse these modules
+    for module_name in [name for name in sys.modules if name.split(".")[0] == "scan_pkg"]:
+        del sys.modules[module_name]
+
+
+def test_discover_workflows_skips_unchanged_modules(workflow_package):
+    """Test that modules are only re-imported when their mtime changes."""
+    discovery = WorkflowDiscovery()
+
+    first = discovery.discover_workflows("scan_pkg")
+    second = discovery.discover_workflows("scan_pkg")
+
+    assert [workflow.__name__ for workflow in first] == ["OrdersWorkflow"]
+    assert second == []
+
+    module_file = workflow_package / "sales" / "orders.py"
+    stat = module_file.stat()
+    os.utime(module_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert [workflow.__name__ for workflow in discovery.discover_workflows("scan_pkg")] == ["OrdersWorkflow"]
+
+
+def test_discover_workflows_does_not_follow_symlinked_directories(workflow_package):
+    """Test that a symlink cycle inside the package is not followed."""
+    (workflow_package / "sales" / "loop").symlink_to(workflow_package, target_is_directory=True)
+
+    discovered = WorkflowDiscovery().discover_workflows("scan_pkg")
+
+    assert [workflow.__name__ for workflow in discovered] == ["OrdersWorkflow"]
+
+
+def test_iter_module_files_skips_directories_removed_while_scanning(workflow_package):
+    """Test that a directory deleted after being queued is skipped."""
+    (workflow_package / "top.py").write_text("")
+    files = WorkflowDiscovery()._iter_module_files(str(workflow_package), "scan_pkg")
+
+    assert next(files)[0] == "scan_pkg.top"
+    shutil.rmtree(workflow_package / "sales")
+
+    assert list(files) == []
+
+
+@pytest.mark.parametrize(
+    ("event", "expected"),
+    [
+        (FileModifiedEvent("/pkg/sales/orders.py"), True),
+        (FileModifiedEvent("/pkg/sales/notes.txt"), False),
+        (FileModifiedEvent("/pkg/sales/__init__.py"), False),
+        (FileModifiedEvent("/pkg/sales/.orders.py"), False),
+        (DirModifiedEvent("/pkg/sales.py"), False),
+    ],
+)
+def test_file_handler_filters_events(event, expected):
+    """Test that only public Python module events trigger a reload."""
+    handler = WorkflowFileHandler(WorkflowDiscovery(), ["pkg"])
+
+    assert handler._should_process_event(event) is expected
+
+
+def test_file_handler_coalesces_event_bursts(monkeypatch):
+    """Test that a burst of events schedules a single trailing reload."""
+    handler = WorkflowFileHandler(WorkflowDiscovery(), ["pkg"])
+    handler.cooldown_period = 0.05
+    reloaded = threading.Event()
+    calls: list[None] = []
+
+    def fake_reload():
+        calls.append(None)
+        reloaded.set()
+
+    monkeypatch.setattr(handler, "_reload_workflows", fake_reload)
+
+    for _ in range(5):
+        handler.on_modified(FileModifiedEvent("/pkg/sales/orders.py"))
+
+    assert reloaded.wait(timeout=2)
+    time.sleep(0.1)
+    assert len(calls) == 1
+
+
+def test_rediscovery_drops_workflows_removed_from_module(workflow_package):
+    """Test that reloading a changed module unregisters workflows deleted from it."""
+    module_file = workflow_package / "sales" / "orders.py"
+    module_file.write_text(
+        WORKFLOW_SOURCE.format(name="OrdersWorkflow") + WORKFLOW_SOURCE.format(name="LegacyWorkflow")
+    )
+    discovery = WorkflowDiscovery()
+    discovery.discover_workflows("scan_pkg")
+
+    module_file.write_text(WORKFLOW_SOURCE.format(name="OrdersWorkflow"))
+    stat = module_file.stat()
+    os.utime(module_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    discovery.discover_workflows("scan_pkg")
+
+    registered = WorkflowRegistry().get_all_workflows()
+    assert "scan_pkg.sales.orders.OrdersWorkflow" in registered
+    assert "scan_pkg.sales.orders.LegacyWorkflow" not in registered
+
+
+def test_failed_reload_keeps_registered_workflows(workflow_package):
+    """Test that a module that fails to reload keeps its workflows and is retried."""
+    module_file = workflow_package / "sales" / "orders.py"
+    discovery = WorkflowDiscovery()
+    discovery.discover_workflows("scan_pkg")
+    first_timestamp = discovery.discovered_modules["scan_pkg.sales.orders"]
+
+    module_file.write_text("class Broken(:\n")
+    os.utime(module_file, ns=(first_timestamp, first_timestamp + 1_000_000_000))
+
+    assert discovery.discover_workflows("scan_pkg") == []
+    assert "scan_pkg.sales.orders.OrdersWorkflow" in WorkflowRegistry().get_all_workflows()
+    assert discovery.discovered_modules["scan_pkg.sales.orders"] == first_timestamp
+
+    # Once the file is fixed, the module is reloaded at the same mtime it failed at
+    module_file.write_text(WORKFLOW_SOURCE.format(name="OrdersWorkflow"))
+    os.utime(module_file, ns=(first_timestamp, first_timestamp + 1_000_000_000))
+
+    assert [workflow.__name__ for workflow in discovery.discover_workflows("scan_pkg")] == ["OrdersWorkflow"]
+
+
+@pytest.mark.parametrize("package_path", ["missing_workflow_pkg", "os"], ids=["missing", "not-a-package"])
+def test_discover_workflows_rejects_invalid_packages(package_path: str):
+    """Test that unknown modules and plain modules are reported as discovery errors."""
+    with pytest.raises(WorkflowDiscoveryError):
+        WorkflowDiscovery().discover_workflows(package_path)
@@ -0,0 +1,122 @@
+"""Tests for the GitHub example extractor."""
+
+import pytest
+import requests
+
+from data_warehouse.core.exceptions import ExtractorError
+from data_warehouse.workflow.base import WorkflowContext
+from data_warehouse.workflow.examples.github.extraction import GitHubExtractor
+from data_warehouse.workflow.examples.github.workflow import GitHubWorkflow
+
+
+@pytest.fixture
+def extractor(monkeypatch) -> GitHubExtractor:
+    """Extractor whose HTTP requests echo the requested URL."""
+    extractor = GitHubExtractor({"source_name": "github"})
+    monkeypatch.setattr(extractor, "_fetch", lambda url, params: [{"url": url}])
+    return extractor
+
+
+def test_extract_many_keeps_context_order(extractor: GitHubExtractor):
+    """Test that concurrent extraction returns results in context order."""
+    contexts = [
+        WorkflowContext(workflow_id="github", config={"entity_name": "octocat/hello-world", "endpoint": endpoint})
+        for endpoint in ["issues", "pulls", "releases"]
+    ]
+
+    results = extractor.extract_many(contexts)
+
+    assert [result[0]["url"] for result in results] == [
+        "https://api.github.com/repos/octocat/hello-world/issues",
+        "https://api.github.com/repos/octocat/hello-world/pulls",
+        "https://api.github.com/repos/octocat/hello-world/releases",
+    ]
+
+
+def test_extract_rejects_repo_without_owner(extractor: GitHubExtractor):
+    """Test that repository names must include the owner."""
+    context = WorkflowContext(workflow_id="github", config={"entity_name": "hello-world"})
+
+    with pytest.raises(ExtractorError):
+        extractor.extract(context)
+
+
+def _response(status_code: int, body: bytes = b"", etag: str | None = None) -> requests.Response:
+    """Build a canned HTTP response."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    if etag:
+        response.headers["ETag"] = etag
+    return response
+
+
+def test_fetch_serves_not_modified_responses_from_cache(tmp_path, monkeypatch):
+    """Test that a cached ETag is sent and a 304 reply returns the cached records."""
+    extractor = GitHubExtractor({"source_name": "github", "cache_dir": str(tmp_path)})
+    responses = [_response(200, b'[{"id": 1}]', etag='"v1"'), _response(304)]
+    sent_headers = []
+
+    def fake_get(url, params=None, headers=None, timeout=None):
+        sent_headers.append(headers)
+        return responses.pop(0)
+
+    monkeypatch.setattr(extractor.session, "get", fake_get)
+    url = "https://api.github.com/repos/octocat/hello-world/issues"
+
+    assert extractor._fetch(url, {"state": "open"}) == [{"id": 1}]
+    assert extractor._fetch(url, {"state": "open"}) == [{"id": 1}]
+    assert sent_headers == [None, {"If-None-Match": '"v1"'}]
+
+
+def test_fetch_collects_all_pages_in_order(monkeypatch):
+    """Test that pages after the first are fetched and appended in page order."""
+    extractor = GitHubExtractor({"source_name": "github"})
+    url = "https://api.github.com/repos/octocat/hello-world/issues"
+    requested_params = []
+
+    def fake_get(url, params=None, headers=None, timeout=None):
+        requested_params.append(params)
+        page = params.get("page", 1)
+        response = _response(200, f'[{{"id": {page}}}]'.encode())
+        response.headers["Link"] = f'<{url}?per_page=100&page=3>; rel="last"'
+        return response
+
+    monkeypatch.setattr(extractor.session, "get", fake_get)
+
+    assert extractor._fetch(url, {}) == [{"id": 1}, {"id": 2}, {"id": 3}]
+    assert requested_params[0] == {"per_page": 100}
+    assert sorted(params.get("page", 1) for params in requested_params) == [1, 2, 3]
+
+
+def test_workflows_share_extractors_per_connection_settings():
+    """Test that workflows only differing in entity share one extractor."""
+    base = {"source_name": "github", "target_name": "warehouse", "credentials": {"token": "a"}}
+    try:
+        first = GitHubWorkflow({**base, "entity_name": "octocat/one"})
+        second = GitHubWorkflow({**base, "entity_name": "octocat/two"})
+        other_token = GitHubWorkflow({**base, "credentials": {"token": "b"}})
+
+        assert first.extractor is second.extractor
+        assert other_token.extractor is not first.extractor
+    finally:
+        GitHubWorkflow.reset_shared_extractors()
+
+
+def test_execute_endpoints_runs_each_endpoint(monkeypatch):
+    """Test that every endpoint is extracted, transformed and loaded with its own context."""
+    workflow = GitHubWorkflow({"source_name": "github", "target_name": "warehouse", "endpoint": "issues"})
+    try:
+        monkeypatch.setattr(
+            workflow.extractor,
+            "extract",
+            lambda context: [{"id": i, "endpoint": context.config["endpoint"]} for i in range(3)],
+        )
+
+        contexts = workflow.execute_endpoints(["releases", "teams"])
+
+        assert set(contexts) == {"releases", "teams"}
+        assert contexts["teams"].get_data("extracted_data")[0]["endpoint"] == "teams"
+        assert contexts["releases"].get_data("records_loaded") == 3
+    finally:
+        GitHubWorkflow.reset_shared_extractors()
@@ -0,0 +1,66 @@
+"""Tests for the GitHub example loaders."""
+
+import json
+from datetime import UTC, datetime
+
+import pyarrow as pa
+import pytest
+from pyarrow import parquet as pq
+
+from data_warehouse.workflow.base import WorkflowContext
+from data_warehouse.workflow.examples.github import load
+from data_warehouse.workflow.examples.github.load import GitHubFileLoader, GitHubParquetLoader
+
+
+@pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+def test_file_loader_writes_json_records(tmp_path, monkeypatch, use_orjson: bool):
+    """Test that records are written as a JSON array with ISO 8601 datetimes."""
+    if not use_orjson:
+        monkeypatch.setattr(load, "orjson", None)
+    elif load.orjson is None:
+        pytest.skip("orjson is not installed")
+    monkeypatch.chdir(tmp_path)
+    records = [{"id": 1, "created_at": datetime(2024, 1, 1, 10, tzinfo=UTC)}]
+    context = WorkflowContext(workflow_id="github", config={"entity_type": "repo", "endpoint": "pulls"})
+
+    written = GitHubFileLoader({"target_name": "files"}).load(records, context)
+
+    assert written == 1
+    content = (tmp_path / "data/github/repo/pull_requests.json").read_bytes()
+    assert json.loads(content) == [{"id": 1, "created_at": "2024-01-01T10:00:00+00:00"}]
+
+
+def test_parquet_loader_writes_typed_columns(tmp_path, monkeypatch):
+    """Test that records are written to Parquet, including always-empty struct fields."""
+    monkeypatch.chdir(tmp_path)
+    records = [
+        {"sha": "a1", "committer_date": datetime(2024, 1, 1, 10, tzinfo=UTC), "stats": {}},
+        {"sha": "b2", "committer_date": None, "stats": {}},
+    ]
+    context = WorkflowContext(workflow_id="github", config={"entity_type": "repo", "endpoint": "commits"})
+
+    written = GitHubParquetLoader({"target_name": "files"}).load(records, context)
+
+    assert written == 2
+    table = pq.read_table(tmp_path / "data/github/repo/commits.parquet")
+    assert table.column("sha").to_pylist() == ["a1", "b2"]
+    assert table.schema.field("committer_date").type == pa.timestamp("us", tz="UTC")
+    assert table.column("stats").null_count == 2
+
+
+def test_parquet_loader_uses_keys_and_types_from_every_record(tmp_path, monkeypatch):
+    """Test that keys missing from the first record and mixed-type values are kept."""
+    monkeypatch.chdir(tmp_path)
+    records = [
+        {"number": 1, "label": "bug"},
+        {"number": 2, "label": 7, "milestone": "v1"},
+    ]
+    context = WorkflowContext(workflow_id="github", config={"entity_type": "repo", "endpoint": "issues"})
+
+    written = GitHubParquetLoader({"target_name": "files"}).load(records, context)
+
+    assert written == 2
+    table = pq.read_table(tmp_path / "data/github/repo/issues.parquet")
+    assert table.column_names == ["number", "label", "milestone"]
+    assert table.column("milestone").to_pylist() == [None, "v1"]
+    assert table.column("label").to_pylist() == ["bug", "7"]
@@ -0,0 +1,58 @@
+"""Tests for the GitHub example transformer."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from data_warehouse.workflow.base import WorkflowContext
+from data_warehouse.workflow.examples.github.transform import GitHubTransformer
+
+
+@pytest.fixture
+def issue() -> dict:
+    """A GitHub issue as returned by the API."""
+    return {
+        "id": 1,
+        "number": 7,
+        "title": "Broken build",
+        "state": "closed",
+        "url": "https://api.github.com/repos/octocat/hello-world/issues/7",
+        "html_url": "https://github.com/octocat/hello-world/issues/7",
+        "created_at": "2024-01-01T10:00:00Z",
+        "updated_at": "2024-01-02T10:00:00Z",
+        "closed_at": None,
+        "body": "It fails",
+        "comments": 2,
+        "labels": [{"name": "bug"}, {"name": "ci"}],
+        "assignees": [{"login": "octocat"}],
+        "milestone": {"title": "v1"},
+        "user": {"login": "hubot"},
+    }
+
+
+def test_transform_issues(issue: dict):
+    """Test the issue field mapping, including nested and nullable fields."""
+    context = WorkflowContext(workflow_id="github", config={"endpoint": "issues"})
+
+    [result] = GitHubTransformer().transform([issue], context)
+
+    assert result["issue_number"] == 7
+    assert result["created_at"] == datetime(2024, 1, 1, 10, tzinfo=UTC)
+    assert result["closed_at"] is None
+    assert result["labels"] == ["bug", "ci"]
+    assert result["assignees"] == ["octocat"]
+    assert result["milestone"] == "v1"
+    assert result["author"] == "hubot"
+    assert result["is_pull_request"] is False
+
+
+def test_transform_generic_parses_dates_and_keeps_other_fields(issue: dict):
+    """Test that unknown endpoints rename URLs, parse dates and copy the rest."""
+    context = WorkflowContext(workflow_id="github", config={"endpoint": "releases"})
+
+    [result] = GitHubTransformer().transform([issue], context)
+
+    assert result["api_url"] == issue["url"]
+    assert result["updated_at"] == datetime(2024, 1, 2, 10, tzinfo=UTC)
+    assert result["title"] == "Broken build"
+    assert result["url"] == issue["url"]
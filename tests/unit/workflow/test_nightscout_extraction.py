@@ -0,0 +1,129 @@
+"""Tests for the Nightscout example extractor."""
+
+import pytest
+import requests
+
+# Importing the nightscout package also imports its SQLAlchemy loader
+pytest.importorskip("sqlalchemy")
+
+from data_warehouse.workflow.base import WorkflowContext  # noqa: E402
+from data_warehouse.workflow.examples.nightscout.extraction import NightscoutExtractor  # noqa: E402
+
+
+@pytest.fixture
+def extractor() -> NightscoutExtractor:
+    """Extractor with a small page size."""
+    extractor = NightscoutExtractor({"source_name": "https://ns.example.com"})
+    extractor.ENTRIES_PAGE_SIZE = 4
+    return extractor
+
+
+def _serve_entries(monkeypatch, extractor: NightscoutExtractor, entries: list[dict]) -> list[dict]:
+    """Answer entry requests from a newest-first list, recording the query parameters."""
+    requests_made = []
+
+    def fake_get_json(url, params=None, conditional=False):
+        requests_made.append(params)
+        upper = params.get("find[date][$lte]", float("inf"))
+        below = params.get("find[date][$lt]", float("inf"))
+        matching = [
+            entry for entry in entries if params["find[date][$gte]"] <= entry["date"] <= upper and entry["date"] < below
+        ]
+        return matching[: params["count"]]
+
+    monkeypatch.setattr(extractor, "_get_json", fake_get_json)
+    return requests_made
+
+
+@pytest.mark.parametrize("record_limit", [3, 10, 100])
+def test_extract_entries_pages_with_inclusive_date_cursor(monkeypatch, extractor: NightscoutExtractor, record_limit):
+    """Test that paging keeps entries sharing a boundary date exactly once."""
+    # Pairs of entries share a date, as when two uploaders send the same reading
+    entries = [{"_id": str(i), "date": 1000 - i // 2} for i in range(25)]
+    requests_made = _serve_entries(monkeypatch, extractor, entries)
+
+    result = extractor._extract_entries("https://ns.example.com", 0, 2000, record_limit)
+
+    assert result == entries[:record_limit]
+    assert requests_made[0] == {"find[date][$gte]": 0, "find[date][$lte]": 2000, "count": min(4, record_limit)}
+
+
+def test_extract_entries_moves_past_a_date_fuller_than_a_page(monkeypatch, extractor: NightscoutExtractor):
+    """Test that a date with more entries than a page does not end the extraction."""
+    entries = [{"_id": f"same-{i}", "date": 500} for i in range(6)] + [{"_id": "older", "date": 400}]
+    requests_made = _serve_entries(monkeypatch, extractor, entries)
+
+    result = extractor._extract_entries("https://ns.example.com", 0, 2000, 100)
+
+    assert [entry["_id"] for entry in result] == ["same-0", "same-1", "same-2", "same-3", "older"]
+    assert requests_made[-1]["find[date][$lt]"] == 500
+
+
+def test_extract_entries_deduplicates_entries_without_id(monkeypatch, extractor: NightscoutExtractor):
+    """Test that entries without an _id are not repeated across pages."""
+    entries = [{"date": 1000 - i // 2, "device": "xDrip", "sgv": 100 + i} for i in range(9)]
+    _serve_entries(monkeypatch, extractor, entries)
+
+    result = extractor._extract_entries("https://ns.example.com", 0, 2000, 100)
+
+    assert result == entries
+
+
+def _response(status_code: int, body: bytes = b"", etag: str | None = None) -> requests.Response:
+    """Build a canned HTTP response."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    if etag:
+        response.headers["ETag"] = etag
+    return response
+
+
+def test_profiles_are_revalidated_with_cached_etag(tmp_path, monkeypatch):
+    """Test that a 304 reply serves the cached profiles, also from a new extractor via the disk cache."""
+    config = {"source_name": "https://ns.example.com", "cache_dir": str(tmp_path)}
+    responses = [_response(200, b'[{"_id": "p1"}]', etag='"v1"'), _response(304), _response(304)]
+    sent_headers = []
+
+    def fake_get(url, params=None, headers=None, timeout=None):
+        sent_headers.append(headers)
+        return responses.pop(0)
+
+    first = NightscoutExtractor(config)
+    monkeypatch.setattr(first.session, "get", fake_get)
+    assert first._extract_profiles("https://ns.example.com") == [{"_id": "p1"}]
+    assert first._extract_profiles("https://ns.example.com") == [{"_id": "p1"}]
+
+    second = NightscoutExtractor(config)
+    monkeypatch.setattr(second.session, "get", fake_get)
+    assert second._extract_profiles("https://ns.example.com") == [{"_id": "p1"}]
+
+    assert sent_headers == [None, {"If-None-Match": '"v1"'}, {"If-None-Match": '"v1"'}]
+
+
+@pytest.mark.parametrize("sparse_fields", [True, False])
+def test_sparse_fields_toggles_the_projection(monkeypatch, sparse_fields: bool):
+    """Test that entries and device status request a field projection unless disabled."""
+    extractor = NightscoutExtractor({"source_name": "https://ns.example.com"})
+    requested_params = {}
+
+    def fake_get(url, params=None, headers=None, timeout=None):
+        requested_params[url.rsplit("/", 1)[-1]] = params or {}
+        return _response(200, b"[]")
+
+    monkeypatch.setattr(extractor.session, "get", fake_get)
+    context = WorkflowContext(
+        workflow_id="nightscout",
+        config={"nightscout_url": "https://ns.example.com", "sparse_fields": sparse_fields},
+    )
+
+    extractor.extract(context)
+
+    fields = {endpoint: params.get("fields") for endpoint, params in requested_params.items()}
+    if sparse_fields:
+        assert fields["entries.json"] == NightscoutExtractor._ENTRY_FIELDS
+        assert fields["devicestatus.json"] == NightscoutExtractor._DEVICESTATUS_FIELDS
+    else:
+        assert fields["entries.json"] is None
+        assert fields["devicestatus.json"] is None
+    assert fields["treatments.json"] is None
@@ -0,0 +1,97 @@
+"""Tests for the Nightscout example loader."""
+
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from sqlalchemy.dialects import postgresql  # noqa: E402
+
+from data_warehouse.workflow.base import WorkflowContext  # noqa: E402
+from data_warehouse.workflow.examples.nightscout.load import NightscoutLoader  # noqa: E402
+from data_warehouse.workflow.examples.nightscout.transform import NightscoutTransformer  # noqa: E402
+
+
+@pytest.fixture
+def loader() -> NightscoutLoader:
+    """Loader that is never connected to a database."""
+    return NightscoutLoader({"target_name": "warehouse"})
+
+
+@pytest.fixture
+def transformed() -> dict:
+    """One transformed record of each Nightscout type."""
+    raw = {
+        "entries": [{"_id": "e1", "device": "xDrip", "date": 1704103200000, "sgv": 180, "direction": "Flat", "raw": 1}],
+        "treatments": [
+            {"_id": "t1", "eventType": "Carbs", "created_at": "2024-01-01T10:00:00Z", "enteredBy": "ann", "carbs": 30}
+        ],
+        "profiles": [
+            {
+                "_id": "p1",
+                "created_at": "2024-01-01T10:00:00Z",
+                "startDate": "2024-01-01T00:00:00Z",
+                "defaultProfile": "Default",
+                "store": {"Default": {"dia": 4, "units": "mmol", "timezone": "UTC"}},
+            }
+        ],
+        "devicestatus": [{"_id": "d1", "created_at": "2024-01-01T10:00:00Z", "device": "loop://phone"}],
+    }
+    return NightscoutTransformer().transform(raw, WorkflowContext(workflow_id="nightscout"))
+
+
+def test_build_rows_maps_transformed_records_onto_columns(loader: NightscoutLoader, transformed: dict):
+    """Test that every column is filled from the transformer's field, including renamed ones."""
+    [entry] = loader._build_rows(loader.entries_table, transformed["entries"])
+    [treatment] = loader._build_rows(loader.treatments_table, transformed["treatments"])
+    [profile] = loader._build_rows(loader.profiles_table, transformed["profiles"])
+    [status] = loader._build_rows(loader.devicestatus_table, transformed["devicestatus"])
+
+    assert entry["id"] == "e1"
+    assert entry["date"] == datetime.fromtimestamp(1704103200)
+    assert entry["sgv"] == 180
+    assert entry["sgv_mmol"] == 10.0
+    assert entry["noise"] is None
+    assert "dateString" not in entry
+    assert entry["raw_data"] is transformed["entries"][0]
+
+    assert treatment["entered_by"] == "ann"
+    assert treatment["carbs"] == 30.0
+    assert treatment["insulin"] is None
+
+    assert profile["start_date"] == "2024-01-01T00:00:00Z"
+    assert profile["dia"] == 4
+    assert profile["units"] == "mmol"
+
+    assert status == {
+        "id": "d1",
+        "created_at": transformed["devicestatus"][0]["created_at"],
+        "device": "loop://phone",
+        "raw_data": transformed["devicestatus"][0],
+    }
+
+    # Every row carries exactly the table's columns, as executemany requires
+    for table, row in [
+        (loader.entries_table, entry),
+        (loader.treatments_table, treatment),
+        (loader.profiles_table, profile),
+    ]:
+        assert set(row) == {column.name for column in table.columns}
+
+
+@pytest.mark.parametrize("upsert", [True, False])
+def test_build_insert_compiles_to_postgres_upsert(upsert: bool):
+    """Test that upserts update every non-key column on conflict and plain inserts do not."""
+    loader = NightscoutLoader({"target_name": "warehouse", "upsert": upsert})
+
+    sql = str(loader._build_insert(loader.devicestatus_table).compile(dialect=postgresql.dialect()))
+
+    assert sql.startswith("INSERT INTO nightscout_devicestatus (id, created_at, device, raw_data) VALUES")
+    if upsert:
+        assert sql.endswith(
+            "ON CONFLICT (id) DO UPDATE SET created_at = excluded.created_at, "
+            "device = excluded.device, raw_data = excluded.raw_data"
+        )
+    else:
+        assert "ON CONFLICT" not in sql